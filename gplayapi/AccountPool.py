@@ -0,0 +1,212 @@
+from collections import deque
+from contextlib import contextmanager
+from threading import Lock
+from time import monotonic
+
+from gplayapi.Constant import sc
+from gplayapi.Error import LoginError, RequestError, ThrottledError
+from gplayapi.GoogleAuth import GoogleAuthAPI
+from gplayapi.GplayAPI import GplayAPI
+from gplayapi.Session import SessionSnapshot
+
+ROUND_ROBIN = 'round_robin'
+LEAST_LOADED = 'least_loaded'
+
+
+def is_account_error(error):
+    """Whether *error* tells something about the health of the account.
+
+    Throttling, login failures and transport or HTTP failures do. A
+    RequestError carrying the message of the server (such as "Item not
+    found." for a delisted app) and errors in the arguments don't."""
+    if isinstance(error, (ThrottledError, LoginError)):
+        return True
+    if isinstance(error, (RequestError, ValueError, TypeError, KeyError)):
+        return False
+    return True
+
+
+class PooledAccount:
+    """An account of an AccountPool, with its GplayAPI and its recent requests and errors"""
+
+    def __init__(self, name, api, window=sc.ACCOUNT_STATS_WINDOW):
+        self.name = name
+        self.api = api
+        self.window = window
+        self.in_flight = 0
+        self.requests = deque()
+        self.errors = deque()
+        self.total_requests = 0
+        self.total_errors = 0
+        self.cooldown_until = 0
+
+    def __trim__(self, now):
+        start = now - self.window
+        while self.requests and self.requests[0] < start:
+            self.requests.popleft()
+        while self.errors and self.errors[0] < start:
+            self.errors.popleft()
+
+    def request_rate(self, now=None):
+        """Requests per second over the window"""
+        self.__trim__(monotonic() if now is None else now)
+        return len(self.requests) / self.window
+
+    def error_rate(self, now=None):
+        """Share of the requests of the window which failed"""
+        self.__trim__(monotonic() if now is None else now)
+        if not self.requests:
+            return 0.0
+        return len(self.errors) / len(self.requests)
+
+    def is_available(self, now=None):
+        return (monotonic() if now is None else now) >= self.cooldown_until
+
+    def stats(self, now=None):
+        now = monotonic() if now is None else now
+        return {'name': self.name,
+                'in_flight': self.in_flight,
+                'request_rate': self.request_rate(now),
+                'error_rate': self.error_rate(now),
+                'total_requests': self.total_requests,
+                'total_errors': self.total_errors,
+                'cooldown': max(0.0, self.cooldown_until - now)}
+
+
+class AccountPool:
+    """Spread requests over many logged in accounts.
+
+        pool = AccountPool(strategy=LEAST_LOADED)
+        for auth in auth_contexts:
+            pool.add(auth)
+        with pool.lease() as api:
+            api.details("com.example")
+        # or, moving to the next account when one is throttled
+        pool.call('details', "com.example")
+
+    Accounts answering 429 Too Many Requests, or failing more than
+    max_error_rate of their recent requests (as told by error_classifier,
+    item level errors don't count), are left out of rotation for
+    cooldown seconds. Leases must not outlive the call they wrap, iterators
+    such as bulk_details_iter are counted when the lease is released, not
+    when they are consumed."""
+
+    def __init__(self, strategy=ROUND_ROBIN, cooldown=sc.ACCOUNT_COOLDOWN, window=sc.ACCOUNT_STATS_WINDOW,
+                 max_error_rate=sc.ACCOUNT_MAX_ERROR_RATE, min_requests=sc.ACCOUNT_MIN_REQUESTS,
+                 api_factory=GplayAPI, error_classifier=is_account_error, **api_kwargs):
+        """
+        :param strategy: ROUND_ROBIN or LEAST_LOADED (fewest requests in flight, then lowest request rate)
+        :param error_classifier: called with each exception raised in a lease, returns
+            whether it counts toward the error rate of the account
+        :param api_factory: called with each GoogleAuthAPI and api_kwargs to build its client
+        """
+        if strategy not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError("unknown strategy: {}".format(strategy))
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self.window = window
+        self.max_error_rate = max_error_rate
+        self.min_requests = min_requests
+        self.api_factory = api_factory
+        self.error_classifier = error_classifier
+        self.api_kwargs = api_kwargs
+        self.__accounts = []
+        self.__next = 0
+        self.__lock = Lock()
+
+    def __len__(self):
+        return len(self.__accounts)
+
+    def add(self, google_auth_context: GoogleAuthAPI, name=None):
+        if name is None:
+            name = "{:x}".format(google_auth_context.gsfId)
+        account = PooledAccount(name, self.api_factory(google_auth_context, **self.api_kwargs), self.window)
+        with self.__lock:
+            if any(a.name == name for a in self.__accounts):
+                raise ValueError("account already in the pool: {}".format(name))
+            self.__accounts.append(account)
+        return account
+
+    def add_snapshot(self, snapshot: SessionSnapshot, name=None, proxies_config=None):
+        return self.add(snapshot.restore(proxies_config), name)
+
+    def remove(self, name):
+        with self.__lock:
+            self.__accounts = [a for a in self.__accounts if a.name != name]
+
+    def __select__(self, now):
+        """Return the index of the account to use, None when they are all cooling down"""
+        count = len(self.__accounts)
+        if self.strategy == LEAST_LOADED:
+            available = [i for i in range(count) if self.__accounts[i].is_available(now)]
+            if not available:
+                return None
+            return min(available, key=lambda i: (self.__accounts[i].in_flight, self.__accounts[i].request_rate(now)))
+        for offset in range(count):
+            index = (self.__next + offset) % count
+            if self.__accounts[index].is_available(now):
+                return index
+        return None
+
+    def acquire(self):
+        """Pick an account and count a request on it, release() must follow"""
+        with self.__lock:
+            if not self.__accounts:
+                raise ValueError("the account pool is empty")
+            now = monotonic()
+            index = self.__select__(now)
+            if index is None:
+                retry_after = min(a.cooldown_until for a in self.__accounts) - now
+                raise ThrottledError("Every account of the pool is cooling down", retry_after)
+            account = self.__accounts[index]
+            self.__next = (index + 1) % len(self.__accounts)
+            account.in_flight += 1
+            account.total_requests += 1
+            account.requests.append(now)
+            return account
+
+    def release(self, account, error=None):
+        with self.__lock:
+            account.in_flight -= 1
+            if error is None or not self.error_classifier(error):
+                return
+            now = monotonic()
+            account.total_errors += 1
+            account.errors.append(now)
+            if isinstance(error, ThrottledError):
+                cooldown = error.retry_after if error.retry_after is not None else self.cooldown
+            elif account.error_rate(now) > self.max_error_rate and len(account.requests) >= self.min_requests:
+                cooldown = self.cooldown
+            else:
+                return
+            account.cooldown_until = max(account.cooldown_until, now + cooldown)
+            # start over once back in rotation
+            account.errors.clear()
+
+    @contextmanager
+    def lease(self):
+        """Yield the GplayAPI of the selected account"""
+        account = self.acquire()
+        try:
+            yield account.api
+        except Exception as e:
+            self.release(account, e)
+            raise
+        else:
+            self.release(account)
+
+    def call(self, method, *args, **kwargs):
+        """Call the GplayAPI method *method*, on another account each time one is throttled"""
+        attempts = max(1, len(self.__accounts))
+        for attempt in range(attempts):
+            try:
+                with self.lease() as api:
+                    return getattr(api, method)(*args, **kwargs)
+            except ThrottledError:
+                if attempt == attempts - 1:
+                    raise
+
+    def stats(self):
+        with self.__lock:
+            now = monotonic()
+            return [account.stats(now) for account in self.__accounts]
@@ -0,0 +1,469 @@
+import asyncio
+from functools import partial
+
+import aiohttp
+
+from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
+from gplayapi.Backend import check_protobuf_backend
+from gplayapi.Cache import BaseResponseCache, cache_key
+from gplayapi.Concurrency import request_key
+from gplayapi.Error import LoginError, RequestError, ThrottledError
+from gplayapi.GoogleAuth import GoogleAuthAPI, create_ssl_context, sc
+from gplayapi.Helper import has_tos_token, parse_protobuf_obj, has_tos_content, has_cookie, parse_retry_after, \
+    quote_uri
+from gplayapi.Parsing import EXTRACTORS, list_ranks_path, make_parser
+
+
+class AsyncTransport:
+    """Pooled aiohttp transport sharing the TLS settings of AuthHTTPAdapter.
+
+    A single transport can be shared by several AsyncGplayAPI instances,
+    the connector keeps up to *limit* connections open in total and
+    *limit_per_host* per FDFE host."""
+
+    def __init__(self, limit=sc.ASYNC_POOL_LIMIT, limit_per_host=sc.ASYNC_POOL_LIMIT_PER_HOST, timeout=60):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.session = None
+
+    def __get_ssl__(self):
+        if not sc.ssl_verify:
+            return False
+        context = create_ssl_context()
+        context.check_hostname = True
+        context.load_default_certs()
+        return context
+
+    async def get_session(self):
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(ssl=self.__get_ssl__(),
+                                             limit=self.limit,
+                                             limit_per_host=self.limit_per_host)
+            # headers are sent as-is, aiohttp must not add its own defaults
+            self.session = aiohttp.ClientSession(connector=connector,
+                                                 timeout=self.timeout,
+                                                 skip_auto_headers=('User-Agent', 'Accept-Encoding'))
+        return self.session
+
+    async def fetch(self, method, url, headers=None, params=None, data=None, proxy=None):
+        """Return (status, headers, body) of the response."""
+        session = await self.get_session()
+        async with session.request(method, url,
+                                   headers=headers,
+                                   params=params,
+                                   data=data,
+                                   proxy=proxy) as response:
+            return response.status, response.headers, await response.read()
+
+    async def request(self, method, url, headers=None, params=None, data=None, proxy=None):
+        status, response_headers, body = await self.fetch(method, url, headers, params, data, proxy)
+        return body
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def __aenter__(self):
+        await self.get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class AsyncDetailsCoalescer:
+    """asyncio version of Concurrency.DetailsCoalescer.
+
+    *fetch* is a coroutine function taking a list of package names and
+    returning the docs (or None) in the same order."""
+
+    def __init__(self, fetch, window=sc.COALESCE_WINDOW, max_batch=sc.BULK_CHUNK_SIZE):
+        self.fetch = fetch
+        self.window = window
+        self.max_batch = max_batch
+        self.__pending = {}
+        self.__handle = None
+        # the event loop only keeps weak references to tasks
+        self.__tasks = set()
+
+    def __take__(self):
+        batch = self.__pending
+        self.__pending = {}
+        if self.__handle is not None:
+            self.__handle.cancel()
+            self.__handle = None
+        return batch
+
+    def __spawn__(self, coroutine):
+        task = asyncio.ensure_future(coroutine)
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    def __flush__(self):
+        self.__spawn__(self.__dispatch__(self.__take__()))
+
+    async def __dispatch__(self, batch):
+        if not batch:
+            return
+        package_names = list(batch)
+        try:
+            docs = await self.fetch(package_names)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        docs = dict(zip(package_names, docs))
+        for package_name, future in batch.items():
+            if future.done():
+                continue
+            doc = docs.get(package_name)
+            if doc is None:
+                future.set_exception(RequestError("Item not found."))
+            else:
+                future.set_result(doc)
+
+    async def get(self, package_name):
+        future = self.__pending.get(package_name)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self.__pending[package_name] = future
+            if len(self.__pending) >= self.max_batch:
+                self.__spawn__(self.__dispatch__(self.__take__()))
+            elif self.__handle is None:
+                self.__handle = loop.call_later(self.window, self.__flush__)
+        # several callers may wait on the same future
+        return await asyncio.shield(future)
+
+
+class AsyncSingleFlight:
+    """asyncio version of Concurrency.SingleFlight.
+
+    The shared call runs in a task of its own which every caller, the
+    first one included, awaits through asyncio.shield, so cancelling one
+    caller doesn't cancel the call the others wait on."""
+
+    def __init__(self):
+        self.__calls = {}
+
+    async def do(self, key, fn, *args, **kwargs):
+        task = self.__calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self.__calls[key] = task
+            task.add_done_callback(partial(self.__done__, key))
+        return await asyncio.shield(task)
+
+    def __done__(self, key, task):
+        if self.__calls.get(key) is task:
+            del self.__calls[key]
+        if not task.cancelled():
+            # avoid "exception was never retrieved" when every caller was cancelled
+            task.exception()
+
+
+class AsyncGplayAPI:
+    """asyncio counterpart of GplayAPI.
+
+    Every read method is a coroutine returning the same data as its
+    GplayAPI equivalent, so many FDFE calls can be in flight from a
+    single thread:
+
+        async with AsyncGplayAPI(auth_service) as api:
+            results = await asyncio.gather(*[api.list_ranks(ctr, cat) for cat in cats])
+    """
+
+    def __init__(self, google_auth_context: GoogleAuthAPI, transport: AsyncTransport = None, coalesce_window=None,
+                 single_flight=True, response_cache: BaseResponseCache = None, lazy=False,
+                 strict_protobuf=None):
+        self.protobuf_backend = check_protobuf_backend(strict_protobuf)
+        self.google_auth_context = google_auth_context
+        self.lazy = lazy
+        self.auth_sub_token = self.google_auth_context.auth_sub_token
+        self.proxies_config = self.google_auth_context.proxies_config
+        self.dfeCookie = self.google_auth_context.dfeCookie
+        self.transport = transport if transport is not None else AsyncTransport()
+        self.single_flight = AsyncSingleFlight() if single_flight else None
+        self.response_cache = response_cache
+        self.__revalidating = set()
+        # created in __toc__, an asyncio.Lock must be made inside the running loop
+        self.__toc_lock = None
+        # background revalidations, referenced until done as the event loop only keeps weak references
+        self.__tasks = set()
+        self.details_coalescer = None
+        if coalesce_window is not None:
+            self.details_coalescer = AsyncDetailsCoalescer(self.bulk_details, coalesce_window)
+
+    async def close(self):
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __parser__(self, fields=None, record=None, raw=False):
+        return make_parser(fields, record, raw, self.lazy)
+
+    def __parse__(self, obj):
+        return self.__parser__()(obj)
+
+    async def __request_result__(self, kind, parse, path, post_data=None, content_type=sc.CONTENT_TYPE_URLENC,
+                                 params=None):
+        """Execute the request and extract its result with Parsing.EXTRACTORS[kind]"""
+        message = await self.__execute_request_api__(path, post_data, content_type, params)
+        return EXTRACTORS[kind](message, parse)
+
+    def __get_headers__(self):
+        return self.google_auth_context.get_headers()
+
+    def __get_proxy__(self):
+        if not self.proxies_config:
+            return None
+        return self.proxies_config.get('https')
+
+    async def __execute_request_api__(self, path, post_data=None, content_type=sc.CONTENT_TYPE_URLENC, params=None):
+        if self.auth_sub_token is None:
+            raise LoginError("You need to login before executing any request")
+        if self.response_cache is None:
+            return await self.__single_flight__(request_key(path, post_data, content_type, params),
+                                                self.__send_request__, path, post_data, content_type, params)
+        if post_data is not None:
+            # only GET requests are identified by their url
+            message = await self.__single_flight__(request_key(path, post_data, content_type, params),
+                                                   self.__send_request__, path, post_data, content_type, params)
+            self.response_cache.put_prefetch(message)
+            return message
+
+        key = cache_key(path, params)
+        entry = self.response_cache.get_entry(key, allow_expired=True)
+        if entry is not None and not entry.is_stale():
+            return entry.response
+        if entry is not None and not entry.is_expired():
+            # stale-while-revalidate, answer from cache and refresh in the background
+            self.__revalidate_in_background__(key, path, content_type, params)
+            return entry.response
+        return await self.__single_flight__(request_key(path, None, content_type, params),
+                                            self.__revalidate__, key, path, content_type, params)
+
+    async def __single_flight__(self, key, fn, *args):
+        if self.single_flight is None:
+            return await fn(*args)
+        return await self.single_flight.do(key, fn, *args)
+
+    async def __revalidate__(self, key, path, content_type, params):
+        """Fetch *path* into the response cache, conditionally when the cached entry has an etag."""
+        entry = self.response_cache.get_entry(key, allow_expired=True)
+        etag = entry.etag if entry is not None else None
+        status, headers, content = await self.__http_request__(path, None, content_type, params, etag=etag)
+        if status == 304 and entry is not None:
+            return self.response_cache.renew(key, entry).response
+
+        message = self.__parse_response__(content)
+        self.response_cache.put_prefetch(message)
+        self.response_cache.put(key, message, etag=headers.get("ETag"))
+        return message
+
+    def __revalidate_in_background__(self, key, path, content_type, params):
+        if key in self.__revalidating:
+            return
+        self.__revalidating.add(key)
+
+        async def revalidate():
+            try:
+                await self.__single_flight__(request_key(path, None, content_type, params),
+                                             self.__revalidate__, key, path, content_type, params)
+            except Exception:
+                # the stale entry stays in place until it expires
+                pass
+            finally:
+                self.__revalidating.discard(key)
+
+        task = asyncio.ensure_future(revalidate())
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    async def __http_request__(self, path, post_data, content_type, params, etag=None):
+        headers = self.__get_headers__()
+        headers["Content-Type"] = content_type
+        if etag is not None:
+            headers["If-None-Match"] = etag
+
+        if post_data is not None:
+            response = await self.transport.fetch('POST', path,
+                                                  data=str(post_data),
+                                                  headers=headers,
+                                                  params=params,
+                                                  proxy=self.__get_proxy__())
+        else:
+            response = await self.transport.fetch('GET', path,
+                                                  headers=headers,
+                                                  params=params,
+                                                  proxy=self.__get_proxy__())
+        status, response_headers, content = response
+        if status == 429:
+            raise ThrottledError("Too many requests", parse_retry_after(response_headers.get("Retry-After")))
+        return response
+
+    def __parse_response__(self, content):
+        message = GooglePlay_pb2.ResponseWrapper.FromString(content)
+        if message.commands.displayErrorMessage != "":
+            raise RequestError(message.commands.displayErrorMessage)
+        return message
+
+    async def __send_request__(self, path, post_data, content_type, params):
+        status, headers, content = await self.__http_request__(path, post_data, content_type, params)
+        return self.__parse_response__(content)
+
+    async def __toc__(self, force=False):
+        '''
+        Table Of Contents, cached on the auth context for sc.TOC_TTL seconds
+        :param force: fetch a new TOC even if the cached one is fresh
+        :return:
+        '''
+        auth = self.google_auth_context
+        if not force and auth.has_fresh_toc():
+            return auth.toc
+        if self.__toc_lock is None:
+            self.__toc_lock = asyncio.Lock()
+        seen = auth.toc
+        # concurrent searches on a cold context wait for a single TOC (and ToS) round trip
+        async with self.__toc_lock:
+            if auth.has_fresh_toc() and (not force or auth.toc is not seen):
+                return auth.toc
+            content = await self.transport.request('GET', sc.TOC_URL,
+                                                   headers=self.__get_headers__(),
+                                                   proxy=self.__get_proxy__())
+            data = GooglePlay_pb2.ResponseWrapper.FromString(content)
+            toc_response = data.payload.tocResponse
+            # the ToS is accepted once per account, restored sessions remember it
+            if not auth.tos_accepted and has_tos_content(toc_response) and has_tos_token(toc_response):
+                await self.__accept_tos__(toc_response.tosToken)
+                auth.tos_accepted = True
+            if has_cookie(toc_response):
+                self.dfeCookie = auth.dfeCookie = toc_response.cookie
+            auth.set_toc(parse_protobuf_obj(toc_response))
+            return auth.toc
+
+    async def __accept_tos__(self, tos_token):
+        params = {
+            "tost": tos_token,
+            "toscme": "false"
+        }
+        content = await self.transport.request('GET', sc.ACCEPT_TOS_URL,
+                                               headers=self.__get_headers__(),
+                                               params=params,
+                                               proxy=self.__get_proxy__())
+        data = GooglePlay_pb2.ResponseWrapper.FromString(content)
+        return parse_protobuf_obj(data.payload.acceptTosResponse)
+
+    async def search(self, query, fields=None, record=None, raw=False):
+        """Search the play store for an app, fields limits the converted paths of each doc
+        and record (AppSummary, AppDetails) returns records instead of dicts, raw the DocV2 messages."""
+        if self.auth_sub_token is None:
+            raise LoginError("You need to login before executing any request")
+
+        path = sc.SEARCH_URL + "?c=3&q={}".format(quote_uri(query))
+        parse = self.__parser__(fields, record, raw)
+        toc_cached = self.google_auth_context.has_fresh_toc()
+        await self.__toc__()
+        try:
+            return await self.__request_result__('list_docs', parse, path)
+        except ThrottledError:
+            # a 429 says nothing about the cookie, retrying would only hit the throttled account again
+            raise
+        except RequestError:
+            if not toc_cached:
+                raise
+            # the cached TOC cookie may have been rejected, refresh it and retry once
+            await self.__toc__(force=True)
+            return await self.__request_result__('list_docs', parse, path)
+
+    async def list_ranks(self, ctr, cat=None, next_page_url=None, fetch_new_apps=False, fields=None,
+                         record=None, raw=False):
+        """
+        List top ranks for the given category and rank list.
+        Args:
+          cat (str) - Category ID.
+          ctr (str) - Rank list ID.
+          next_page_url (str) - Next page url for subsequent requests.
+          fields (list) - only convert these dotted field paths of each app.
+          record (type) - AppSummary or AppDetails, returns these records instead of dicts.
+          raw (bool) - return the GooglePlaySlim_pb2.DocV2 messages instead of dicts.
+        Returns:
+          (a list of apps, next page url)
+        """
+        path = list_ranks_path(ctr, cat, next_page_url, fetch_new_apps)
+        return await self.__request_result__('list_ranks', self.__parser__(fields, record, raw), path)
+
+    async def details(self, package_name, version_code=False, fields=None, record=None, raw=False):
+        """Get app details from a package name.
+
+        packageName (str) is the app unique ID (usually starting with 'com.').
+        versionCode (int) is the version code desired.
+        fields (list) only converts these dotted field paths of the doc.
+        record (type) AppSummary or AppDetails, returns this record instead of a dict.
+        raw (bool) returns the GooglePlaySlim_pb2.DocV2 message instead of a dict."""
+        if not version_code and not fields and record is None and not raw \
+                and self.details_coalescer is not None:
+            return await self.details_coalescer.get(package_name)
+        parse = self.__parser__(fields, record, raw)
+        if version_code:
+            path = sc.DETAILS_URL + "?doc={}&vc={}".format(quote_uri(package_name), quote_uri(str(version_code)))
+        else:
+            path = sc.DETAILS_URL + "?doc={}".format(quote_uri(package_name))
+        return await self.__request_result__('details', parse, path)
+
+    async def bulk_details(self, package_names, fields=None, record=None, raw=False):
+        """Get several apps details from a list of package names.
+
+        fields (list) only converts these dotted field paths of each doc.
+        record (type) AppSummary or AppDetails, returns these records instead of dicts.
+        raw (bool) returns the DocV2 messages instead of dicts.
+
+        Returns:
+            a list of dictionaries containing docv2 data, or None
+            if the app doesn't exist"""
+        parse = self.__parser__(fields, record, raw)
+        params = {'au': '1'}
+        req = GooglePlay_pb2.BulkDetailsRequest()
+        req.docid.extend(package_names)
+        data = req.SerializeToString()
+        return await self.__request_result__('bulk_details', parse, sc.BULK_URL,
+                                             post_data=data.decode("utf-8"),
+                                             content_type=sc.CONTENT_TYPE_PROTO,
+                                             params=params)
+
+    async def home(self, cat=None, fields=None, raw=False):
+        path = sc.HOME_URL + "?c=3&nocache_isui=true"
+        if cat is not None:
+            path += "&cat={}".format(cat)
+        return await self.__request_result__('list_docs', self.__parser__(fields, raw=raw), path)
+
+    async def browse(self, cat=None, sub_cat=None, raw=False):
+        """Browse categories. If neither cat nor subcat are specified,
+        return a list of categories, otherwise it return a list of apps
+        using cat (category ID) and subCat (subcategory ID) as filters.
+        raw returns the BrowseResponse message instead of a dict."""
+        path = sc.BROWSE_URL + "?c=3"
+        if cat is not None:
+            path += "&cat={}".format(quote_uri(cat))
+        if sub_cat is not None:
+            path += "&ctr={}".format(quote_uri(sub_cat))
+        return await self.__request_result__('browse', self.__parser__(raw=raw), path)
+
+    async def gather(self, *coroutines, limit=None):
+        """Run several API coroutines concurrently, at most *limit* at a time."""
+        if limit is None:
+            return await asyncio.gather(*coroutines)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def bounded(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*[bounded(c) for c in coroutines])
@@ -0,0 +1,56 @@
+"""Which protobuf implementation the generated _pb2 modules run on.
+
+The pure python backend decodes responses several times slower than upb
+or cpp, and protobuf falls back to it silently when the compiled module
+can't be loaded (wheel missing for the platform, or
+PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python in the environment).
+"""
+import os
+import sys
+import warnings
+
+from google.protobuf import __version__ as protobuf_version
+from google.protobuf.internal import api_implementation
+
+from gplayapi.Constant import sc
+from gplayapi.Error import ProtobufBackendError
+
+FAST_BACKENDS = ('upb', 'cpp')
+
+
+def protobuf_backend():
+    """'upb', 'cpp' or 'python'"""
+    return api_implementation.Type()
+
+
+def backend_report():
+    backend = protobuf_backend()
+    return {
+        'backend': backend,
+        'fast': backend in FAST_BACKENDS,
+        'protobuf_version': protobuf_version,
+        'python_version': sys.version.split()[0],
+        'env': os.environ.get('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION'),
+    }
+
+
+def strict_from_env():
+    return os.environ.get(sc.STRICT_PROTOBUF_ENV, '').lower() in ('1', 'true', 'yes')
+
+
+def check_protobuf_backend(strict=None):
+    """Warn, or raise ProtobufBackendError when strict, if protobuf runs on the pure python backend.
+
+    strict defaults to the GPLAYAPI_STRICT_PROTOBUF environment variable.
+    Returns the backend name."""
+    backend = protobuf_backend()
+    if backend in FAST_BACKENDS:
+        return backend
+    if strict is None:
+        strict = strict_from_env()
+    message = "protobuf {} is running on the '{}' backend, responses are decoded several times slower" \
+        .format(protobuf_version, backend)
+    if strict:
+        raise ProtobufBackendError(message)
+    warnings.warn(message, RuntimeWarning, stacklevel=3)
+    return backend
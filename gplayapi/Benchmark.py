@@ -0,0 +1,126 @@
+"""Micro benchmarks on recorded ResponseWrapper payloads.
+
+    python -m gplayapi.Benchmark wire bulk bulk_details_response.bin
+    python -m gplayapi.Benchmark wire list list_ranks_response.bin
+    python -m gplayapi.Benchmark parse response.bin
+    python -m gplayapi.Benchmark backends response.bin
+"""
+import json
+import os
+import subprocess
+import sys
+from timeit import Timer
+
+from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
+from gplayapi.Backend import backend_report
+from gplayapi.Helper import parse_protobuf_obj, has_doc
+from gplayapi.Records import AppSummary
+from gplayapi.WireDecoder import decode_bulk_details, decode_list_ranks
+
+
+def _bulk_docs(message):
+    return [None if not has_doc(entry) else entry.doc for entry in message.payload.bulkDetailsResponse.entry]
+
+
+def _list_docs(message):
+    return [a for d in message.payload.listResponse.doc for c in d.child for a in c.child]
+
+
+_KINDS = {
+    'bulk': (_bulk_docs, decode_bulk_details),
+    'list': (_list_docs, lambda content: decode_list_ranks(content)[0]),
+}
+
+
+def time_call(fn, number):
+    """Best seconds per call out of 3 runs of *number* calls"""
+    return min(Timer(fn).repeat(3, number)) / number
+
+
+def benchmark_wire_decoder(content, kind='bulk', number=100):
+    """Compare the ways of reading the apps of a recorded bulkDetails ('bulk')
+    or top chart ('list') response, returns {name: seconds per call}"""
+    extract, decode = _KINDS[kind]
+
+    def message_to_dict():
+        docs = extract(GooglePlay_pb2.ResponseWrapper.FromString(content))
+        return [None if doc is None else parse_protobuf_obj(doc) for doc in docs]
+
+    def from_doc():
+        docs = extract(GooglePlay_pb2.ResponseWrapper.FromString(content))
+        return [None if doc is None else AppSummary.from_doc(doc) for doc in docs]
+
+    expected = from_doc()
+    if decode(content) != expected:
+        raise AssertionError("WireDecoder and AppSummary.from_doc disagree on this payload")
+
+    return {
+        'FromString + MessageToDict': time_call(message_to_dict, number),
+        'FromString + AppSummary.from_doc': time_call(from_doc, number),
+        'WireDecoder': time_call(lambda: decode(content), number),
+    }
+
+
+def benchmark_parse(content, number=100):
+    """Time decoding a recorded ResponseWrapper on the protobuf backend of this process"""
+    def from_string():
+        return GooglePlay_pb2.ResponseWrapper.FromString(content)
+
+    return {
+        'FromString': time_call(from_string, number),
+        'FromString + MessageToDict': time_call(lambda: parse_protobuf_obj(from_string()), number),
+    }
+
+
+def benchmark_backends(filename, backends=('upb', 'cpp', 'python'), number=100):
+    """Run benchmark_parse on each protobuf backend, in a child process as
+    the backend is chosen once at import, returns {backend: results}.
+
+    Backends which can't be loaded here are left out."""
+    results = {}
+    for backend in backends:
+        env = dict(os.environ, PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=backend)
+        child = subprocess.run([sys.executable, '-m', 'gplayapi.Benchmark', 'parse', filename, '--json', str(number)],
+                               env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        if child.returncode != 0:
+            continue
+        output = json.loads(child.stdout.decode())
+        # protobuf may silently pick another backend than the requested one
+        if output['backend'] == backend:
+            results[backend] = output['results']
+    return results
+
+
+def print_results(results):
+    baseline = max(results.values())
+    for name, seconds in results.items():
+        print("{:<36} {:>10.3f} ms  x{:.1f}".format(name, seconds * 1000, baseline / seconds))
+
+
+def main(argv):
+    if len(argv) == 3 and argv[0] == 'wire' and argv[1] in _KINDS:
+        with open(argv[2], 'rb') as f:
+            content = f.read()
+        print_results(benchmark_wire_decoder(content, argv[1]))
+        return 0
+    if len(argv) in (2, 4) and argv[0] == 'parse':
+        with open(argv[1], 'rb') as f:
+            content = f.read()
+        if len(argv) == 4 and argv[2] == '--json':
+            results = benchmark_parse(content, int(argv[3]))
+            print(json.dumps({'backend': backend_report()['backend'], 'results': results}))
+        else:
+            print(backend_report())
+            print_results(benchmark_parse(content))
+        return 0
+    if len(argv) == 2 and argv[0] == 'backends':
+        for backend, results in benchmark_backends(argv[1]).items():
+            print("[{}]".format(backend))
+            print_results(results)
+        return 0
+    print(__doc__)
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,216 @@
+from collections import OrderedDict
+from threading import Lock
+from time import time
+from urllib.parse import urlencode
+
+from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
+from gplayapi.Constant import sc
+
+
+def cache_key(path, params=None):
+    """Normalize an FDFE url to the part after fdfe/, so that absolute urls,
+    urls of both FDFE hosts and relative PreFetch urls share one key."""
+    if params:
+        path += ("&" if "?" in path else "?") + urlencode(params)
+    index = path.find("fdfe/")
+    if index != -1:
+        path = path[index + len("fdfe/"):]
+    return path.lstrip("/")
+
+
+class CacheEntry:
+    def __init__(self, response, ttl, soft_ttl=None, etag=None, fetched_at=None):
+        self.response = response
+        self.ttl = ttl
+        self.soft_ttl = ttl if soft_ttl is None else min(soft_ttl, ttl)
+        self.etag = etag or None
+        self.fetched_at = time() if fetched_at is None else fetched_at
+        self.expires_at = self.fetched_at + self.ttl
+        self.soft_expires_at = self.fetched_at + self.soft_ttl
+
+    def is_expired(self, now=None):
+        return (time() if now is None else now) >= self.expires_at
+
+    def is_stale(self, now=None):
+        return (time() if now is None else now) >= self.soft_expires_at
+
+
+class BaseResponseCache:
+    """Interface shared by the response cache backends.
+
+    Expired entries carrying an etag are kept, get_entry(key, allow_expired=True)
+    returns them so that they can be revalidated with a conditional request."""
+
+    default_ttl = sc.CACHE_DEFAULT_TTL
+
+    def get_entry(self, key, allow_expired=False):
+        raise NotImplementedError
+
+    def put_entry(self, key, entry):
+        raise NotImplementedError
+
+    def invalidate(self, key):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def get(self, key):
+        entry = self.get_entry(key)
+        return None if entry is None else entry.response
+
+    def put(self, key, response, ttl=None, soft_ttl=None, etag=None):
+        entry = CacheEntry(response, self.default_ttl if ttl is None else ttl, soft_ttl, etag)
+        self.put_entry(key, entry)
+        return entry
+
+    def renew(self, key, entry):
+        """Restart the ttl of *entry* after the server answered "not modified"."""
+        return self.put(key, entry.response, entry.ttl, entry.soft_ttl, entry.etag)
+
+    def put_prefetch(self, response_wrapper):
+        """Store every PreFetch entry of *response_wrapper*, ttl and softTtl are in ms."""
+        for pre_fetch in response_wrapper.preFetch:
+            if not pre_fetch.url or not pre_fetch.HasField('response'):
+                continue
+            ttl = pre_fetch.ttl / 1000 if pre_fetch.ttl else None
+            soft_ttl = pre_fetch.softTtl / 1000 if pre_fetch.softTtl else None
+            self.put(cache_key(pre_fetch.url), pre_fetch.response, ttl, soft_ttl, pre_fetch.etag)
+
+
+class ResponseCache(BaseResponseCache):
+    """In-memory LRU cache of ResponseWrapper messages keyed by FDFE url.
+
+    Entries are evicted when they expire or when more than *max_entries*
+    are stored. Cached messages are shared, callers must not modify them."""
+
+    def __init__(self, max_entries=sc.CACHE_MAX_ENTRIES, default_ttl=sc.CACHE_DEFAULT_TTL):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.__lock = Lock()
+        self.__entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get_entry(self, key, allow_expired=False):
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            if entry.is_expired():
+                if entry.etag is None:
+                    del self.__entries[key]
+                    return None
+                if not allow_expired:
+                    return None
+            self.__entries.move_to_end(key)
+            return entry
+
+    def put_entry(self, key, entry):
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+
+class SQLiteResponseCache(BaseResponseCache):
+    """Persistent response cache storing raw ResponseWrapper bytes in a SQLite file.
+
+    Entries are keyed by url, locale and device profile, so one file can
+    be shared by jobs running with different profiles. It has the same
+    interface as ResponseCache and can be passed as GplayAPI(response_cache=...)."""
+
+    def __init__(self, filename, locale, device_profile, default_ttl=sc.PERSISTENT_CACHE_DEFAULT_TTL):
+        self.filename = filename
+        self.locale = locale
+        self.device_profile = device_profile
+        self.default_ttl = default_ttl
+        import sqlite3
+
+        self.__lock = Lock()
+        self.__connection = sqlite3.connect(filename, check_same_thread=False, isolation_level=None)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS responses ("
+                                  "url TEXT NOT NULL, "
+                                  "locale TEXT NOT NULL, "
+                                  "device_profile TEXT NOT NULL, "
+                                  "fetched_at REAL NOT NULL, "
+                                  "expires_at REAL NOT NULL, "
+                                  "soft_expires_at REAL NOT NULL, "
+                                  "etag TEXT, "
+                                  "body BLOB NOT NULL, "
+                                  "PRIMARY KEY (url, locale, device_profile))")
+
+    @classmethod
+    def for_auth_context(cls, filename, google_auth_context, **kwargs):
+        return cls(filename,
+                   google_auth_context.device_builder.locale,
+                   google_auth_context.device_profile,
+                   **kwargs)
+
+    def __len__(self):
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM responses WHERE locale = ? AND device_profile = ?",
+                                             (self.locale, self.device_profile)).fetchone()[0]
+
+    def get_entry(self, key, allow_expired=False):
+        with self.__lock:
+            row = self.__connection.execute("SELECT fetched_at, expires_at, soft_expires_at, etag, body "
+                                            "FROM responses WHERE url = ? AND locale = ? AND device_profile = ?",
+                                            (key, self.locale, self.device_profile)).fetchone()
+        if row is None:
+            return None
+        fetched_at, expires_at, soft_expires_at, etag, body = row
+        if time() >= expires_at:
+            if etag is None:
+                self.invalidate(key)
+                return None
+            if not allow_expired:
+                return None
+        return CacheEntry(GooglePlay_pb2.ResponseWrapper.FromString(body),
+                          expires_at - fetched_at,
+                          soft_expires_at - fetched_at,
+                          etag,
+                          fetched_at)
+
+    def put_entry(self, key, entry):
+        with self.__lock:
+            self.__connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                      (key, self.locale, self.device_profile,
+                                       entry.fetched_at, entry.expires_at, entry.soft_expires_at,
+                                       entry.etag, entry.response.SerializeToString()))
+
+    def invalidate(self, key):
+        with self.__lock:
+            self.__connection.execute("DELETE FROM responses WHERE url = ? AND locale = ? AND device_profile = ?",
+                                      (key, self.locale, self.device_profile))
+
+    def purge_expired(self, keep_etag=True):
+        """Delete expired entries of every locale and profile.
+
+        Entries with an etag are kept unless keep_etag is False, they can
+        still be revalidated cheaply."""
+        with self.__lock:
+            if keep_etag:
+                self.__connection.execute("DELETE FROM responses WHERE expires_at <= ? AND etag IS NULL", (time(),))
+            else:
+                self.__connection.execute("DELETE FROM responses WHERE expires_at <= ?", (time(),))
+
+    def clear(self):
+        with self.__lock:
+            self.__connection.execute("DELETE FROM responses WHERE locale = ? AND device_profile = ?",
+                                      (self.locale, self.device_profile))
+
+    def close(self):
+        with self.__lock:
+            self.__connection.close()
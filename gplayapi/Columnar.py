@@ -0,0 +1,73 @@
+"""Columnar export of list_ranks / bulk_details results.
+
+Accepts DocV2 messages of GooglePlaySlim_pb2 (raw=True) or GooglePlay_pb2, AppSummary/AppDetails
+records (record=...) or None for missing apps, which
+are left out of the output but keep their rank position. numpy and
+pyarrow are only imported by the function using them.
+"""
+from gplayapi.Records import AppSummary
+
+# name, numpy dtype, value used by numpy for a missing number
+COLUMNS = (
+    ('rank', 'int64', -1),
+    ('docid', 'object', None),
+    ('title', 'object', None),
+    ('creator', 'object', None),
+    ('star_rating', 'float32', float('nan')),
+    ('ratings_count', 'int64', -1),
+    ('price_micros', 'int64', -1),
+    ('currency_code', 'object', None),
+    ('formatted_price', 'object', None),
+    ('version_code', 'int64', -1),
+    ('num_downloads', 'object', None),
+)
+
+_SUMMARY_FIELDS = AppSummary.fields()
+
+
+def to_columns(docs, start_rank=1):
+    """Transpose docs into {column name: list of values} in one pass.
+
+    rank is the position of each doc in *docs* plus start_rank, pass the
+    number of apps of the previous pages to keep ranks across list_ranks pages."""
+    columns = {name: [] for name, _, _ in COLUMNS}
+    appenders = [columns[name].append for name in _SUMMARY_FIELDS]
+    append_rank = columns['rank'].append
+    for rank, doc in enumerate(docs, start_rank):
+        if doc is None:
+            continue
+        if isinstance(doc, AppSummary):
+            values = [getattr(doc, name) for name in _SUMMARY_FIELDS]
+        else:
+            values = AppSummary.summary_values(doc)
+        append_rank(rank)
+        for append, value in zip(appenders, values):
+            append(value)
+    return columns
+
+
+def to_numpy(docs, start_rank=1):
+    """Return {column name: numpy array}, missing numbers use the fill value of COLUMNS"""
+    import numpy as np
+
+    columns = to_columns(docs, start_rank)
+    arrays = {}
+    for name, dtype, missing in COLUMNS:
+        values = columns[name]
+        if dtype != 'object' and None in values:
+            values = [missing if value is None else value for value in values]
+        arrays[name] = np.array(values, dtype=dtype)
+    return arrays
+
+
+def to_arrow(docs, start_rank=1):
+    """Return a pyarrow.Table, missing values are nulls"""
+    import pyarrow as pa
+
+    types = {
+        'int64': pa.int64(),
+        'float32': pa.float32(),
+        'object': pa.string(),
+    }
+    columns = to_columns(docs, start_rank)
+    return pa.table({name: pa.array(columns[name], type=types[dtype]) for name, dtype, _ in COLUMNS})
@@ -0,0 +1,197 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from threading import Lock, Timer
+
+from gplayapi.Constant import sc
+from gplayapi.Error import RequestError
+
+
+def iter_completed(fn, items, max_workers, ahead=sc.SUBMIT_AHEAD):
+    """Call fn(item) for each item on a bounded thread pool, yield (item, future) in completion order.
+
+    At most max_workers * ahead calls are submitted before their results
+    are consumed, so a consumer stopping early doesn't send the remaining
+    items, and closing the generator cancels the calls not started yet."""
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = {}
+    try:
+        for item in islice(items, max(1, max_workers * ahead)):
+            pending[executor.submit(fn, item)] = item
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                for next_item in islice(items, 1):
+                    pending[executor.submit(fn, next_item)] = next_item
+                yield item, future
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class BatchSizeTuner:
+    """Hill climbing controller for the number of docs per BulkDetailsRequest.
+
+    Observations (docs, latency, payload size) are collected for the
+    current size. When adjust() is called the size keeps moving in the
+    same direction while docs/sec improves and turns around otherwise.
+    Timeouts and oversized responses always halve the size."""
+
+    def __init__(self, initial=sc.BULK_CHUNK_SIZE, minimum=sc.BULK_MIN_CHUNK_SIZE,
+                 maximum=sc.BULK_MAX_CHUNK_SIZE, max_response_bytes=sc.BULK_MAX_RESPONSE_BYTES,
+                 growth=sc.BULK_CHUNK_GROWTH):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.max_response_bytes = max_response_bytes
+        self.growth = growth
+        self.size = max(minimum, min(maximum, initial))
+        self.direction = 1
+        self.last_throughput = None
+        self.__lock = Lock()
+        self.__docs = 0
+        self.__seconds = 0.0
+        self.__penalty = False
+
+    def observe(self, docs, seconds, payload_bytes):
+        """Record a successful request of *docs* items."""
+        with self.__lock:
+            self.__docs += docs
+            self.__seconds += seconds
+            if payload_bytes > self.max_response_bytes:
+                self.__penalty = True
+
+    def observe_timeout(self):
+        with self.__lock:
+            self.__penalty = True
+
+    def __resize__(self, factor):
+        self.size = max(self.minimum, min(self.maximum, int(round(self.size * factor))))
+
+    def adjust(self):
+        """Pick the size for the next round of requests and return it."""
+        with self.__lock:
+            if self.__penalty:
+                self.__resize__(0.5)
+                self.direction = -1
+                # throughput measured with the old size is meaningless now
+                self.last_throughput = None
+            elif self.__docs and self.__seconds > 0:
+                throughput = self.__docs / self.__seconds
+                if self.last_throughput is not None and throughput < self.last_throughput:
+                    self.direction = -self.direction
+                self.last_throughput = throughput
+                self.__resize__(self.growth if self.direction > 0 else 1 / self.growth)
+            self.__docs = 0
+            self.__seconds = 0.0
+            self.__penalty = False
+            return self.size
+
+
+class DetailsCoalescer:
+    """Merge details() lookups issued within *window* seconds into one bulk request.
+
+    *fetch* receives a list of package names and returns the matching
+    docs (or None) in the same order, e.g. GplayAPI.__bulk_details_chunk__.
+    Callers asking for the same package in the same window share the
+    result, a missing doc raises RequestError like details() does."""
+
+    def __init__(self, fetch, window=sc.COALESCE_WINDOW, max_batch=sc.BULK_CHUNK_SIZE):
+        self.fetch = fetch
+        self.window = window
+        self.max_batch = max_batch
+        self.__lock = Lock()
+        self.__pending = {}
+        self.__timer = None
+
+    def __take__(self):
+        batch = self.__pending
+        self.__pending = {}
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        return batch
+
+    def __flush__(self):
+        with self.__lock:
+            batch = self.__take__()
+        self.__dispatch__(batch)
+
+    def __dispatch__(self, batch):
+        if not batch:
+            return
+        package_names = list(batch)
+        try:
+            docs = self.fetch(package_names)
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+        docs = dict(zip(package_names, docs))
+        for package_name, future in batch.items():
+            doc = docs.get(package_name)
+            if doc is None:
+                future.set_exception(RequestError("Item not found."))
+            else:
+                future.set_result(doc)
+
+    def submit(self, package_name):
+        """Queue *package_name* and return a concurrent.futures.Future of its doc."""
+        batch = None
+        with self.__lock:
+            future = self.__pending.get(package_name)
+            if future is None:
+                future = Future()
+                self.__pending[package_name] = future
+                if len(self.__pending) >= self.max_batch:
+                    batch = self.__take__()
+                elif self.__timer is None:
+                    self.__timer = Timer(self.window, self.__flush__)
+                    self.__timer.daemon = True
+                    self.__timer.start()
+        if batch is not None:
+            self.__dispatch__(batch)
+        return future
+
+    def get(self, package_name, timeout=None):
+        return self.submit(package_name).result(timeout)
+
+
+class SingleFlight:
+    """Share the result of a call between callers arriving while it is in flight.
+
+    Only the first caller for a key runs the function, the others block
+    until it finishes and get the same result or exception. The key is
+    forgotten as soon as the call completes, nothing is cached."""
+
+    def __init__(self):
+        self.__lock = Lock()
+        self.__calls = {}
+
+    def do(self, key, fn, *args, **kwargs):
+        with self.__lock:
+            future = self.__calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self.__calls[key] = future
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.__lock:
+                self.__calls.pop(key, None)
+
+
+def request_key(path, post_data=None, content_type=None, params=None):
+    """Identity of an FDFE request, used to deduplicate in-flight calls."""
+    if params:
+        params = tuple(sorted(params.items()))
+    return path, params, post_data, content_type
@@ -31,9 +31,57 @@ sc.ACCEPT_TOS_URL = sc.FDFE + "acceptTos"
 sc.LEGACY_LIST_URL = sc.FDFE + "list"
 sc.LIST_TEST_URL = sc.PLAYSTORE_FDFE + "listTopChartItems"
 sc.LIST_TEST_V2_URL = sc.PLAYSTORE_FDFE + "browseTopCharts"
+sc.DETAILS_URL = sc.FDFE + "details"
+sc.BULK_URL = sc.FDFE + "bulkDetails"
+sc.HOME_URL = sc.FDFE + "homeV2"
+sc.BROWSE_URL = sc.FDFE + "browse"
 sc.CONTENT_TYPE_URLENC = "application/x-www-form-urlencoded; charset=UTF-8"
 sc.CONTENT_TYPE_PROTO = "application/x-protobuf"
 
+# connection pool of the shared requests adapter, should be >= the number of worker threads
+sc.HTTP_POOL_MAXSIZE = 32
+sc.DETAILS_MAX_WORKERS = 16
+# calls submitted ahead per worker by details_many and bootstrap_sessions
+sc.SUBMIT_AHEAD = 2
+sc.BULK_CHUNK_SIZE = 250
+sc.BULK_MAX_WORKERS = 8
+# bounds of the adaptive bulk_details chunk size
+sc.BULK_MIN_CHUNK_SIZE = 10
+sc.BULK_MAX_CHUNK_SIZE = 1000
+sc.BULK_CHUNK_GROWTH = 1.5
+sc.BULK_MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+# seconds details() calls are collected before being sent as one bulk_details
+sc.COALESCE_WINDOW = 0.01
+# bytes read at a time from streamed responses
+sc.STREAM_CHUNK_SIZE = 64 * 1024
+
+# in-memory response cache, ttl in seconds for responses without PreFetch ttl
+sc.CACHE_MAX_ENTRIES = 4096
+sc.CACHE_DEFAULT_TTL = 300
+sc.PERSISTENT_CACHE_DEFAULT_TTL = 6 * 60 * 60
+sc.REVALIDATE_MAX_WORKERS = 4
+
+# seconds a TocResponse and its dfeCookie are reused before search() fetches a new one
+sc.TOC_TTL = 60 * 60
+
+# connection pool of the asyncio transport
+sc.ASYNC_POOL_LIMIT = 256
+sc.ASYNC_POOL_LIMIT_PER_HOST = 128
+
+# AccountPool: seconds of history behind the request and error rates, seconds a
+# throttled account stays out of rotation, error rate (over at least
+# ACCOUNT_MIN_REQUESTS requests) taking an account out of rotation
+sc.ACCOUNT_STATS_WINDOW = 60
+sc.ACCOUNT_COOLDOWN = 60
+sc.ACCOUNT_MAX_ERROR_RATE = 0.5
+sc.ACCOUNT_MIN_REQUESTS = 10
+
+# accounts logged in side by side by Session.bootstrap_sessions
+sc.BOOTSTRAP_MAX_WORKERS = 16
+
+# set to 1 to refuse running the generated _pb2 modules on the pure python protobuf backend
+sc.STRICT_PROTOBUF_ENV = "GPLAYAPI_STRICT_PROTOBUF"
+
 # https://play-fe.googleapis.com/fdfe/browseTopCharts?c=3&cat=GAME&scat=GAME&stcid=apps_topselling_paid&ups=true
 
 ctr = space_constants()
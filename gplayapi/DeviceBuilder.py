@@ -1,22 +1,43 @@
 import configparser
+from functools import lru_cache
 from os import path
 from re import match
 from time import time
 
-from gplayapi import GooglePlay_pb2
+from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
 from gplayapi.Constant import sc
 from gplayapi.Error import InvalidTimezoneError, InvalidLocaleError
 
 
+DEVICE_PROPERTIES = path.join(path.dirname(path.realpath(__file__)), '../resources/Device.properties')
+
+# serialized messages which only depend on the profile, {(name, filepath, device): bytes}
+_message_cache = {}
+
+
+@lru_cache(maxsize=None)
+def load_device_config(filepath=DEVICE_PROPERTIES):
+    """Parse a Device.properties file once per process"""
+    config = configparser.ConfigParser()
+    config.read(filepath)
+    return config
+
+
+@lru_cache(maxsize=None)
+def load_device_profile(device, filepath=DEVICE_PROPERTIES):
+    """Return the properties of a device profile, parsed once per process"""
+    return dict(load_device_config(filepath).items(device))
+
+
 class DeviceBuilder(object):
 
     def __init__(self, device):
-        self.device = {}
-        self.filepath = path.join(path.dirname(path.realpath(__file__)), '../resources/Device.properties')
-        self.config = configparser.ConfigParser()
-        self.config.read(self.filepath)
-        for (key, value) in self.config.items(device):
-            self.device[key] = value
+        self.device_profile = device
+        self.filepath = DEVICE_PROPERTIES
+        self.config = load_device_config(self.filepath)
+        self.device = dict(load_device_profile(device, self.filepath))
+        self.user_agent = None
+        self.base_headers = None
 
     def set_locale(self, locale):
         # test if provided locale is valid
@@ -28,6 +49,8 @@ class DeviceBuilder(object):
         if match(r'[a-z]{2}_[A-Z]{2}', locale) is None:
             raise InvalidLocaleError()
         self.locale = locale
+        # Accept-Language depends on the locale
+        self.base_headers = None
 
     def set_timezone(self, timezone):
         if timezone is None or type(timezone) is not str:
@@ -37,14 +60,17 @@ class DeviceBuilder(object):
         self.timezone = timezone
 
     def get_base_headers(self):
-        return {"Accept-Language": self.locale.replace('_', '-'),
-                "X-DFE-Encoded-Targets": sc.DFE_TARGETS,
-                "User-Agent": self.get_user_agent(),
-                "X-DFE-Client-Id": "am-android-google",
-                "X-DFE-MCCMNC": self.device.get('celloperator'),
-                "X-DFE-Network-Type": "4",
-                "X-DFE-Content-Filters": "",
-                "X-DFE-Request-Params": "timeoutMs=4000"}
+        """Return a copy of the device headers, built once per locale"""
+        if self.base_headers is None:
+            self.base_headers = {"Accept-Language": self.locale.replace('_', '-'),
+                                 "X-DFE-Encoded-Targets": sc.DFE_TARGETS,
+                                 "User-Agent": self.get_user_agent(),
+                                 "X-DFE-Client-Id": "am-android-google",
+                                 "X-DFE-MCCMNC": self.device.get('celloperator'),
+                                 "X-DFE-Network-Type": "4",
+                                 "X-DFE-Content-Filters": "",
+                                 "X-DFE-Request-Params": "timeoutMs=4000"}
+        return dict(self.base_headers)
 
     def get_device_upload_headers(self):
         headers = self.get_base_headers()
@@ -57,6 +83,11 @@ class DeviceBuilder(object):
         return headers
 
     def get_user_agent(self):
+        if self.user_agent is None:
+            self.user_agent = self.__build_user_agent__()
+        return self.user_agent
+
+    def __build_user_agent__(self):
         version_string = self.device.get('vending.versionstring')
         if version_string is None:
             version_string = '8.4.19.V-all [0] [FP] 175058788'
@@ -106,18 +137,41 @@ class DeviceBuilder(object):
                 "callerSig": "38918a453d07199354f8b19af05ec6562ced5788",
                 "droidguard_results": "dummy123"}
 
+    def __cached_message__(self, name, build):
+        """Serialize the message returned by build() once per process and profile"""
+        key = (name, self.filepath, self.device_profile)
+        content = _message_cache.get(key)
+        if content is None:
+            content = build().SerializeToString()
+            _message_cache[key] = content
+        return content
+
     def get_android_checkin_request(self):
+        request = GooglePlay_pb2.AndroidCheckinRequest.FromString(
+            self.__cached_message__('checkin_request', self.__build_android_checkin_request__))
+        request.checkin.build.timestamp = int(time() / 1000)
+        request.locale = self.locale
+        request.timeZone = self.timezone
+        return request
+
+    def __build_android_checkin_request__(self):
+        """Checkin request without the locale, time zone and build timestamp"""
         request = GooglePlay_pb2.AndroidCheckinRequest()
         request.id = 0
         request.checkin.CopyFrom(self.get_android_checkin())
-        request.locale = self.locale
-        request.timeZone = self.timezone
         request.version = 3
-        request.deviceConfiguration.CopyFrom(self.get_device_config())
+        request.deviceConfiguration.MergeFromString(self.get_device_config_bytes())
         request.fragment = 0
         return request
 
+    def get_device_config_bytes(self):
+        """Serialized DeviceConfigurationProto of the profile"""
+        return self.__cached_message__('device_config', self.__build_device_config__)
+
     def get_device_config(self):
+        return GooglePlay_pb2.DeviceConfigurationProto.FromString(self.get_device_config_bytes())
+
+    def __build_device_config__(self):
         libList = self.device['sharedlibraries'].split(",")
         featureList = self.device['features'].split(",")
         localeList = self.device['locales'].split(",")
@@ -137,16 +191,11 @@ class DeviceBuilder(object):
         deviceConfig.screenWidth = int(self.device['screen.width'])
         deviceConfig.screenHeight = int(self.device['screen.height'])
         deviceConfig.glEsVersion = int(self.device['gl.version'])
-        for x in platforms:
-            deviceConfig.nativePlatform.append(x)
-        for x in libList:
-            deviceConfig.systemSharedLibrary.append(x)
-        for x in featureList:
-            deviceConfig.systemAvailableFeature.append(x)
-        for x in localeList:
-            deviceConfig.systemSupportedLocale.append(x)
-        for x in glList:
-            deviceConfig.glExtension.append(x)
+        deviceConfig.nativePlatform.extend(platforms)
+        deviceConfig.systemSharedLibrary.extend(libList)
+        deviceConfig.systemAvailableFeature.extend(featureList)
+        deviceConfig.systemSupportedLocale.extend(localeList)
+        deviceConfig.glExtension.extend(glList)
         return deviceConfig
 
     def get_android_build(self):
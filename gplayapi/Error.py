@@ -14,6 +14,13 @@ class RequestError(Exception):
         return repr(self.value)
 
 
+class ThrottledError(RequestError):
+    """The server answered 429 Too Many Requests, retry_after is in seconds when known"""
+    def __init__(self, value, retry_after=None):
+        RequestError.__init__(self, value)
+        self.retry_after = retry_after
+
+
 class SecurityCheckError(Exception):
     def __init__(self, value):
         self.value = value
@@ -22,6 +29,14 @@ class SecurityCheckError(Exception):
         return repr(self.value)
 
 
+class ProtobufBackendError(Exception):
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return repr(self.value)
+
+
 class InvalidLocaleError(Exception):
     pass
 
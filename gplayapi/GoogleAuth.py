@@ -1,17 +1,9 @@
 import ssl
 from base64 import b64decode, urlsafe_b64encode
+from threading import Lock
+from time import time
 
-import requests
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
-from cryptography.hazmat.primitives.serialization import load_der_public_key
-from requests.adapters import HTTPAdapter
-from urllib3.poolmanager import PoolManager
-from urllib3.util import ssl_
-
-from gplayapi import GooglePlay_pb2
+from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
 from gplayapi.Constant import sc
 from gplayapi.DeviceBuilder import DeviceBuilder
 from gplayapi.Error import SecurityCheckError, LoginError
@@ -26,22 +18,48 @@ class SSLContext(ssl.SSLContext):
         pass
 
 
-class AuthHTTPAdapter(HTTPAdapter):
-    def init_poolmanager(self, *args, **kwargs):
-        """
-        Secure settings from ssl.create_default_context(), but without
-        ssl.OP_NO_TICKET which causes Google to return 403 Bad
-        Authentication.
-        ssl.OP_NO-TICKET -> 0x4000
-        """
-        context = SSLContext()
-        context.set_ciphers(ssl_.DEFAULT_CIPHERS)
-        context.verify_mode = ssl.CERT_REQUIRED
-        context.options &= ~ssl.OP_NO_TICKET
-        self.poolmanager = PoolManager(*args, ssl_context=context, **kwargs)
+def create_ssl_context():
+    """
+    Secure settings from ssl.create_default_context(), but without
+    ssl.OP_NO_TICKET which causes Google to return 403 Bad
+    Authentication.
+    ssl.OP_NO-TICKET -> 0x4000
+    """
+    from urllib3.util import ssl_
+
+    context = SSLContext()
+    context.set_ciphers(ssl_.DEFAULT_CIPHERS)
+    context.verify_mode = ssl.CERT_REQUIRED
+    context.options &= ~ssl.OP_NO_TICKET
+    return context
+
+
+def __getattr__(name):
+    # requests is only imported once a session is needed, processes answering
+    # from the response cache or a restored session never load it
+    if name in ('AuthHTTPAdapter', 'authAdapter'):
+        return _auth_adapter()[name]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+_AUTH_ADAPTER = {}
+_AUTH_ADAPTER_LOCK = Lock()
+
+
+def _auth_adapter():
+    with _AUTH_ADAPTER_LOCK:
+        if _AUTH_ADAPTER:
+            return _AUTH_ADAPTER
+        from requests.adapters import HTTPAdapter
+        from urllib3.poolmanager import PoolManager
 
+        class AuthHTTPAdapter(HTTPAdapter):
+            def init_poolmanager(self, *args, **kwargs):
+                self.poolmanager = PoolManager(*args, ssl_context=create_ssl_context(), **kwargs)
 
-authAdapter = AuthHTTPAdapter()
+        _AUTH_ADAPTER['AuthHTTPAdapter'] = AuthHTTPAdapter
+        _AUTH_ADAPTER['authAdapter'] = AuthHTTPAdapter(pool_maxsize=sc.HTTP_POOL_MAXSIZE)
+        return _AUTH_ADAPTER
 
 
 class GoogleAuthAPI:
@@ -53,21 +71,65 @@ class GoogleAuthAPI:
         self.proxies_config = proxies_config
         self.dfeCookie = None
         self.device_config_token = None
+        self.device_profile = device_profile
 
-        self.session = requests.session()
-        self.session.mount('https://', authAdapter)
+        # Table Of Contents state shared by every GplayAPI using this context
+        self.toc = None
+        self.toc_expires_at = 0
+        self.tos_accepted = False
+        self.toc_lock = Lock()
+
+        # {upload_fields: (header values, headers)} of the last get_headers() calls
+        self.headers_cache = {}
+
+        self.__session = None
+        self.__session_lock = Lock()
 
         # initialize device builder
         self.device_builder = DeviceBuilder(device_profile)
         self.device_builder.set_locale(locale)
         self.device_builder.set_timezone(time_zone)
 
+    @property
+    def session(self):
+        """requests session of the context, created on first use"""
+        with self.__session_lock:
+            if self.__session is None:
+                import requests
+
+                session = requests.session()
+                session.mount('https://', _auth_adapter()['authAdapter'])
+                self.__session = session
+            return self.__session
+
+    @session.setter
+    def session(self, session):
+        self.__session = session
+
     def set_auth_sub_token(self, auth_sub_token):
         self.auth_sub_token = auth_sub_token
+        self.invalidate_toc()
+
+    def has_fresh_toc(self):
+        return self.toc is not None and time() < self.toc_expires_at
+
+    def set_toc(self, toc, ttl=sc.TOC_TTL):
+        self.toc = toc
+        self.toc_expires_at = time() + ttl
+
+    def invalidate_toc(self):
+        self.toc = None
+        self.toc_expires_at = 0
 
     def encrypt_password(self, login, passwd):
         """Encrypt credentials using the google publickey, with the
         RSA algorithm"""
+        # cryptography is only needed to log in, not to use a restored session
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+        from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+        from cryptography.hazmat.primitives.serialization import load_der_public_key
 
         # structure of the binary key:
         #
@@ -244,7 +306,7 @@ class GoogleAuthAPI:
         selected in the __init__ methodi to the google account."""
 
         upload = GooglePlay_pb2.UploadDeviceConfigRequest()
-        upload.deviceConfiguration.CopyFrom(self.device_builder.get_device_config())
+        upload.deviceConfiguration.MergeFromString(self.device_builder.get_device_config_bytes())
         headers = self.get_headers(upload_fields=True)
         string_request = upload.SerializeToString()
         response = self.session.post(sc.UPLOAD_URL, data=string_request,
@@ -264,6 +326,18 @@ class GoogleAuthAPI:
         """Return the default set of request headers, which
         can later be expanded, based on the request type"""
 
+        # the attributes below are assigned directly by the login flow,
+        # so the cached headers are checked against their current values
+        values = (self.device_builder.locale, self.gsfId, self.auth_sub_token, self.device_config_token,
+                  self.device_checkin_consistency_token, self.dfeCookie)
+        cached = self.headers_cache.get(upload_fields)
+        if cached is None or cached[0] != values:
+            cached = (values, self.__build_headers__(upload_fields))
+            self.headers_cache[upload_fields] = cached
+        # callers add their own headers to the returned dict
+        return dict(cached[1])
+
+    def __build_headers__(self, upload_fields):
         if upload_fields:
             headers = self.device_builder.get_device_upload_headers()
         else:
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: GooglePlaySlim.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14GooglePlaySlim.proto\x12\rgplayapi.slim\"\xac\x04\n\x16\x41ndroidAppDeliveryData\x12\x14\n\x0c\x64ownloadSize\x18\x01 \x01(\x03\x12\x0c\n\x04sha1\x18\x02 \x01(\t\x12\x13\n\x0b\x64ownloadUrl\x18\x03 \x01(\t\x12\x36\n\x0e\x61\x64\x64itionalFile\x18\x04 \x03(\x0b\x32\x1e.gplayapi.slim.AppFileMetadata\x12\x35\n\x12\x64ownloadAuthCookie\x18\x05 \x03(\x0b\x32\x19.gplayapi.slim.HttpCookie\x12\x15\n\rforwardLocked\x18\x06 \x01(\x08\x12\x15\n\rrefundTimeout\x18\x07 \x01(\x03\x12\x17\n\x0fserverInitiated\x18\x08 \x01(\x08\x12%\n\x1dpostInstallRefundWindowMillis\x18\t \x01(\x03\x12\x1c\n\x14immediateStartNeeded\x18\n \x01(\x08\x12\x35\n\tpatchData\x18\x0b \x01(\x0b\x32\".gplayapi.slim.AndroidAppPatchData\x12\x39\n\x10\x65ncryptionParams\x18\x0c \x01(\x0b\x32\x1f.gplayapi.slim.EncryptionParams\x12\x1a\n\x12\x64ownloadUrlGzipped\x18\r \x01(\t\x12\x1b\n\x13\x64ownloadSizeGzipped\x18\x0e \x01(\x03\x12#\n\x05split\x18\x0f \x03(\x0b\x32\x14.gplayapi.slim.Split\x12\x0e\n\x06sha256\x18\x13 \x01(\t\"\x87\x01\n\x05Split\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04size\x18\x02 \x01(\x03\x12\x13\n\x0bsizeGzipped\x18\x03 \x01(\x03\x12\x0c\n\x04sha1\x18\x04 \x01(\t\x12\x13\n\x0b\x64ownloadUrl\x18\x05 \x01(\t\x12\x1a\n\x12\x64ownloadUrlGzipped\x18\x06 \x01(\t\x12\x0e\n\x06sha256\x18\t \x01(\t\"\x80\x01\n\x13\x41ndroidAppPatchData\x12\x17\n\x0f\x62\x61seVersionCode\x18\x01 \x01(\x05\x12\x10\n\x08\x62\x61seSha1\x18\x02 \x01(\t\x12\x13\n\x0b\x64ownloadUrl\x18\x03 \x01(\t\x12\x13\n\x0bpatchFormat\x18\x04 \x01(\x05\x12\x14\n\x0cmaxPatchSize\x18\x05 \x01(\x03\"\x9a\x01\n\x0f\x41ppFileMetadata\x12\x10\n\x08\x66ileType\x18\x01 \x01(\x05\x12\x13\n\x0bversionCode\x18\x02 \x01(\x05\x12\x0c\n\x04size\x18\x03 \x01(\x03\x12\x13\n\x0b\x64ownloadUrl\x18\x04 \x01(\t\x12\x13\n\x0bsizeGzipped\x18\x06 \x01(\x03\x12\x1a\n\x12\x64ownloadUrlGzipped\x18\x07 \x01(\t\x12\x0c\n\x04sha1\x18\x08 \x01(\t\"K\n\x10\x45ncryptionParams\x12\x0f\n\x07version\x18\x01 \x01(\x05\x12\x15\n\rencryptionKey\x18\x02 \x01(\t\x12\x0f\n\x07hmacKey\x18\x03 \x01(\t\")\n\nHttpCookie\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"X\n\nBookAuthor\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x17\n\x0f\x64\x65precatedQuery\x18\x02 \x01(\t\x12#\n\x05\x64ocid\x18\x03 \x01(\x0b\x32\x14.gplayapi.slim.Docid\"\xed\x03\n\x0b\x42ookDetails\x12+\n\x07subject\x18\x03 \x03(\x0b\x32\x1a.gplayapi.slim.BookSubject\x12\x11\n\tpublisher\x18\x04 \x01(\t\x12\x17\n\x0fpublicationDate\x18\x05 \x01(\t\x12\x0c\n\x04isbn\x18\x06 \x01(\t\x12\x15\n\rnumberOfPages\x18\x07 \x01(\x05\x12\x10\n\x08subtitle\x18\x08 \x01(\t\x12)\n\x06\x61uthor\x18\t \x03(\x0b\x32\x19.gplayapi.slim.BookAuthor\x12\x11\n\treaderUrl\x18\n \x01(\t\x12\x17\n\x0f\x64ownloadEpubUrl\x18\x0b \x01(\t\x12\x16\n\x0e\x64ownloadPdfUrl\x18\x0c \x01(\t\x12\x17\n\x0f\x61\x63sEpubTokenUrl\x18\r \x01(\t\x12\x16\n\x0e\x61\x63sPdfTokenUrl\x18\x0e \x01(\t\x12\x15\n\repubAvailable\x18\x0f \x01(\x08\x12\x14\n\x0cpdfAvailable\x18\x10 \x01(\x08\x12\x16\n\x0e\x61\x62outTheAuthor\x18\x11 \x01(\t\x12\x39\n\nidentifier\x18\x12 \x03(\n2%.gplayapi.slim.BookDetails.Identifier\x1a.\n\nIdentifier\x12\x0c\n\x04type\x18\x13 \x01(\x05\x12\x12\n\nidentifier\x18\x14 \x01(\t\"=\n\x0b\x42ookSubject\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05query\x18\x02 \x01(\t\x12\x11\n\tsubjectId\x18\x03 \x01(\t\"\x9a\x01\n\nBrowseLink\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x64\x61taUrl\x18\x03 \x01(\t\x12\"\n\x04icon\x18\x05 \x01(\x0b\x32\x14.gplayapi.slim.Image\x12I\n\x18unknownCategoryContainer\x18\x04 \x01(\x0b\x32\'.gplayapi.slim.UnknownCategoryContainer\"[\n\x18UnknownCategoryContainer\x12?\n\x13\x63\x61tegoryIdContainer\x18\x05 \x01(\x0b\x32\".gplayapi.slim.CategoryIdContainer\")\n\x13\x43\x61tegoryIdContainer\x12\x12\n\ncategoryId\x18\x04 \x01(\t\"\xd0\x01\n\x0e\x42rowseResponse\x12\x13\n\x0b\x63ontentsUrl\x18\x01 \x01(\t\x12\x10\n\x08promoUrl\x18\x02 \x01(\t\x12+\n\x08\x63\x61tegory\x18\x03 \x03(\x0b\x32\x19.gplayapi.slim.BrowseLink\x12-\n\nbreadcrumb\x18\x04 \x03(\x0b\x32\x19.gplayapi.slim.BrowseLink\x12;\n\x11\x63\x61tegoryContainer\x18\t \x01(\x0b\x32 .gplayapi.slim.CategoryContainer\"@\n\x11\x43\x61tegoryContainer\x12+\n\x08\x63\x61tegory\x18\x04 \x03(\x0b\x32\x19.gplayapi.slim.BrowseLink\"<\n\x05\x44ocid\x12\x14\n\x0c\x62\x61\x63kendDocid\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\x05\x12\x0f\n\x07\x62\x61\x63kend\x18\x03 \x01(\x05\">\n\x07Install\x12\x11\n\tandroidId\x18\x01 \x01(\x06\x12\x0f\n\x07version\x18\x02 \x01(\x05\x12\x0f\n\x07\x62undled\x18\x03 \x01(\x08\"\xf8\x03\n\x05Offer\x12\x0e\n\x06micros\x18\x01 \x01(\x03\x12\x14\n\x0c\x63urrencyCode\x18\x02 \x01(\t\x12\x17\n\x0f\x66ormattedAmount\x18\x03 \x01(\t\x12,\n\x0e\x63onvertedPrice\x18\x04 \x03(\x0b\x32\x14.gplayapi.slim.Offer\x12\x1c\n\x14\x63heckoutFlowRequired\x18\x05 \x01(\x08\x12\x17\n\x0f\x66ullPriceMicros\x18\x06 \x01(\x03\x12\x1b\n\x13\x66ormattedFullAmount\x18\x07 \x01(\t\x12\x11\n\tofferType\x18\x08 \x01(\x05\x12/\n\x0brentalTerms\x18\t \x01(\x0b\x32\x1a.gplayapi.slim.RentalTerms\x12\x12\n\nonSaleDate\x18\n \x01(\x03\x12\x16\n\x0epromotionLabel\x18\x0b \x03(\t\x12;\n\x11subscriptionTerms\x18\x0c \x01(\x0b\x32 .gplayapi.slim.SubscriptionTerms\x12\x15\n\rformattedName\x18\r \x01(\t\x12\x1c\n\x14\x66ormattedDescription\x18\x0e \x01(\t\x12\x0c\n\x04sale\x18\x16 \x01(\x08\x12\x0f\n\x07message\x18\x1a \x01(\t\x12\x18\n\x10saleEndTimestamp\x18\x1e \x01(\x03\x12\x13\n\x0bsaleMessage\x18\x1f \x01(\t\"\xb1\x01\n\rOwnershipInfo\x12\x1f\n\x17initiationTimestampMsec\x18\x01 \x01(\x03\x12\x1f\n\x17validUntilTimestampMsec\x18\x02 \x01(\x03\x12\x14\n\x0c\x61utoRenewing\x18\x03 \x01(\x08\x12\"\n\x1arefundTimeoutTimestampMsec\x18\x04 \x01(\x03\x12$\n\x1cpostDeliveryRefundWindowMsec\x18\x05 \x01(\x03\"H\n\x0bRentalTerms\x12\x1a\n\x12grantPeriodSeconds\x18\x01 \x01(\x05\x12\x1d\n\x15\x61\x63tivatePeriodSeconds\x18\x02 \x01(\x05\"w\n\x11SubscriptionTerms\x12\x32\n\x0frecurringPeriod\x18\x01 \x01(\x0b\x32\x19.gplayapi.slim.TimePeriod\x12.\n\x0btrialPeriod\x18\x02 \x01(\x0b\x32\x19.gplayapi.slim.TimePeriod\")\n\nTimePeriod\x12\x0c\n\x04unit\x18\x01 \x01(\x05\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\x92\x01\n\x11\x43ontainerMetadata\x12\x11\n\tbrowseUrl\x18\x01 \x01(\t\x12\x13\n\x0bnextPageUrl\x18\x02 \x01(\t\x12\x11\n\trelevance\x18\x03 \x01(\x01\x12\x18\n\x10\x65stimatedResults\x18\x04 \x01(\x03\x12\x17\n\x0f\x61nalyticsCookie\x18\x05 \x01(\t\x12\x0f\n\x07ordered\x18\x06 \x01(\x08\"5\n\x10\x42ulkDetailsEntry\x12!\n\x03\x64oc\x18\x01 \x01(\x0b\x32\x14.gplayapi.slim.DocV2\"=\n\x12\x42ulkDetailsRequest\x12\r\n\x05\x64ocid\x18\x01 \x03(\t\x12\x18\n\x10includeChildDocs\x18\x02 \x01(\x08\"E\n\x13\x42ulkDetailsResponse\x12.\n\x05\x65ntry\x18\x01 \x03(\x0b\x32\x1f.gplayapi.slim.BulkDetailsEntry\"\xd9\x02\n\x0f\x44\x65tailsResponse\x12#\n\x05\x64ocV1\x18\x01 \x01(\x0b\x32\x14.gplayapi.slim.DocV1\x12\x17\n\x0f\x61nalyticsCookie\x18\x02 \x01(\t\x12)\n\nuserReview\x18\x03 \x01(\x0b\x32\x15.gplayapi.slim.Review\x12#\n\x05\x64ocV2\x18\x04 \x01(\x0b\x32\x14.gplayapi.slim.DocV2\x12\x12\n\nfooterHtml\x18\x05 \x01(\t\x12#\n\x05\x62\x61\x64ge\x18\x07 \x03(\x0b\x32\x14.gplayapi.slim.Badge\x12)\n\x08\x66\x65\x61tures\x18\x0c \x01(\x0b\x32\x17.gplayapi.slim.Features\x12\x18\n\x10\x64\x65tailsStreamUrl\x18\r \x01(\t\x12\x15\n\ruserReviewUrl\x18\x0e \x01(\t\x12#\n\x1bpostAcquireDetailsStreamUrl\x18\x11 \x01(\t\"\x85\x01\n\x05\x42\x61\x64ge\x12\r\n\x05label\x18\x01 \x01(\t\x12#\n\x05image\x18\x02 \x01(\x0b\x32\x14.gplayapi.slim.Image\x12\x37\n\x0f\x62\x61\x64geContainer1\x18\x04 \x01(\x0b\x32\x1e.gplayapi.slim.BadgeContainer1\x12\x0f\n\x07message\x18\x0b \x01(\t\"J\n\x0f\x42\x61\x64geContainer1\x12\x37\n\x0f\x62\x61\x64geContainer2\x18\x01 \x01(\x0b\x32\x1e.gplayapi.slim.BadgeContainer2\"P\n\x0f\x42\x61\x64geContainer2\x12=\n\x12\x62\x61\x64geLinkContainer\x18\x02 \x01(\x0b\x32!.gplayapi.slim.BadgeLinkContainer\"\"\n\x12\x42\x61\x64geLinkContainer\x12\x0c\n\x04link\x18\x02 \x01(\t\"j\n\x08\x46\x65\x61tures\x12/\n\x0f\x66\x65\x61turePresence\x18\x01 \x03(\x0b\x32\x16.gplayapi.slim.Feature\x12-\n\rfeatureRating\x18\x02 \x03(\x0b\x32\x16.gplayapi.slim.Feature\"\'\n\x07\x46\x65\x61ture\x12\r\n\x05label\x18\x01 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\t\"\xb5\x03\n\x18\x44\x65viceConfigurationProto\x12\x13\n\x0btouchScreen\x18\x01 \x01(\x05\x12\x10\n\x08keyboard\x18\x02 \x01(\x05\x12\x12\n\nnavigation\x18\x03 \x01(\x05\x12\x14\n\x0cscreenLayout\x18\x04 \x01(\x05\x12\x17\n\x0fhasHardKeyboard\x18\x05 \x01(\x08\x12\x1c\n\x14hasFiveWayNavigation\x18\x06 \x01(\x08\x12\x15\n\rscreenDensity\x18\x07 \x01(\x05\x12\x13\n\x0bglEsVersion\x18\x08 \x01(\x05\x12\x1b\n\x13systemSharedLibrary\x18\t \x03(\t\x12\x1e\n\x16systemAvailableFeature\x18\n \x03(\t\x12\x16\n\x0enativePlatform\x18\x0b \x03(\t\x12\x13\n\x0bscreenWidth\x18\x0c \x01(\x05\x12\x14\n\x0cscreenHeight\x18\r \x01(\x05\x12\x1d\n\x15systemSupportedLocale\x18\x0e \x03(\t\x12\x13\n\x0bglExtension\x18\x0f \x03(\t\x12\x13\n\x0b\x64\x65viceClass\x18\x10 \x01(\x05\x12\x1c\n\x14maxApkDownloadSizeMb\x18\x11 \x01(\x05\"\xb5\x05\n\x08\x44ocument\x12#\n\x05\x64ocid\x18\x01 \x01(\x0b\x32\x14.gplayapi.slim.Docid\x12(\n\nfetchDocid\x18\x02 \x01(\x0b\x32\x14.gplayapi.slim.Docid\x12)\n\x0bsampleDocid\x18\x03 \x01(\x0b\x32\x14.gplayapi.slim.Docid\x12\r\n\x05title\x18\x04 \x01(\t\x12\x0b\n\x03url\x18\x05 \x01(\t\x12\x0f\n\x07snippet\x18\x06 \x03(\t\x12-\n\x0fpriceDeprecated\x18\x07 \x01(\x0b\x32\x14.gplayapi.slim.Offer\x12\x31\n\x0c\x61vailability\x18\t \x01(\x0b\x32\x1b.gplayapi.slim.Availability\x12#\n\x05image\x18\n \x03(\x0b\x32\x14.gplayapi.slim.Image\x12&\n\x05\x63hild\x18\x0b \x03(\x0b\x32\x17.gplayapi.slim.Document\x12\x37\n\x0f\x61ggregateRating\x18\r \x01(\x0b\x32\x1e.gplayapi.slim.AggregateRating\x12#\n\x05offer\x18\x0e \x03(\x0b\x32\x14.gplayapi.slim.Offer\x12\x38\n\x11translatedSnippet\x18\x0f \x03(\x0b\x32\x1d.gplayapi.slim.TranslatedText\x12\x37\n\x0f\x64ocumentVariant\x18\x10 \x03(\x0b\x32\x1e.gplayapi.slim.DocumentVariant\x12\x12\n\ncategoryId\x18\x11 \x03(\t\x12+\n\ndecoration\x18\x12 \x03(\x0b\x32\x17.gplayapi.slim.Document\x12\'\n\x06parent\x18\x13 \x03(\x0b\x32\x17.gplayapi.slim.Document\x12\x18\n\x10privacyPolicyUrl\x18\x14 \x01(\t\"\xc7\x02\n\x0f\x44ocumentVariant\x12\x15\n\rvariationType\x18\x01 \x01(\x05\x12!\n\x04rule\x18\x02 \x01(\x0b\x32\x13.gplayapi.slim.Rule\x12\r\n\x05title\x18\x03 \x01(\t\x12\x0f\n\x07snippet\x18\x04 \x03(\t\x12\x15\n\rrecentChanges\x18\x05 \x01(\t\x12\x36\n\x0f\x61utoTranslation\x18\x06 \x03(\x0b\x32\x1d.gplayapi.slim.TranslatedText\x12#\n\x05offer\x18\x07 \x03(\x0b\x32\x14.gplayapi.slim.Offer\x12\x11\n\tchannelId\x18\t \x01(\x03\x12&\n\x05\x63hild\x18\n \x03(\x0b\x32\x17.gplayapi.slim.Document\x12+\n\ndecoration\x18\x0b \x03(\x0b\x32\x17.gplayapi.slim.Document\"\x82\x03\n\x05Image\x12\x11\n\timageType\x18\x01 \x01(\x05\x12\x31\n\tdimension\x18\x02 \x01(\n2\x1e.gplayapi.slim.Image.Dimension\x12\x10\n\x08imageUrl\x18\x05 \x01(\t\x12\x18\n\x10\x61ltTextLocalized\x18\x06 \x01(\t\x12\x11\n\tsecureUrl\x18\x07 \x01(\t\x12\x1a\n\x12positionInSequence\x18\x08 \x01(\x05\x12\x1e\n\x16supportsFifeUrlOptions\x18\t \x01(\x08\x12/\n\x08\x63itation\x18\n \x01(\n2\x1d.gplayapi.slim.Image.Citation\x12\r\n\x05\x63olor\x18\x0f \x01(\t\x12\x1b\n\x13screenshotSetNumber\x18\x15 \x01(\x05\x1a*\n\tDimension\x12\r\n\x05width\x18\x03 \x01(\x05\x12\x0e\n\x06height\x18\x04 \x01(\x05\x1a/\n\x08\x43itation\x12\x16\n\x0etitleLocalized\x18\x0b \x01(\t\x12\x0b\n\x03url\x18\x0c \x01(\t\"J\n\x0eTranslatedText\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x14\n\x0csourceLocale\x18\x02 \x01(\t\x12\x14\n\x0ctargetLocale\x18\x03 \x01(\t\"w\n\x0bPlusOneData\x12\x11\n\tsetByUser\x18\x01 \x01(\x08\x12\r\n\x05total\x18\x02 \x01(\x03\x12\x14\n\x0c\x63irclesTotal\x18\x03 \x01(\x03\x12\x30\n\rcirclesPeople\x18\x04 \x03(\x0b\x32\x19.gplayapi.slim.PlusPerson\":\n\nPlusPerson\x12\x13\n\x0b\x64isplayName\x18\x02 \x01(\t\x12\x17\n\x0fprofileImageUrl\x18\x04 \x01(\t\"\x7f\n\x0c\x41lbumDetails\x12\x0c\n\x04name\x18\x01 \x01(\t\x12,\n\x07\x64\x65tails\x18\x02 \x01(\x0b\x32\x1b.gplayapi.slim.MusicDetails\x12\x33\n\rdisplayArtist\x18\x03 \x01(\x0b\x32\x1c.gplayapi.slim.ArtistDetails\"\xb5\x05\n\nAppDetails\x12\x15\n\rdeveloperName\x18\x01 \x01(\t\x12\x1a\n\x12majorVersionNumber\x18\x02 \x01(\x05\x12\x13\n\x0bversionCode\x18\x03 \x01(\x05\x12\x15\n\rversionString\x18\x04 \x01(\t\x12\r\n\x05title\x18\x05 \x01(\t\x12\x13\n\x0b\x61ppCategory\x18\x07 \x03(\t\x12\x15\n\rcontentRating\x18\x08 \x01(\x05\x12\x18\n\x10installationSize\x18\t \x01(\x03\x12\x12\n\npermission\x18\n \x03(\t\x12\x16\n\x0e\x64\x65veloperEmail\x18\x0b \x01(\t\x12\x18\n\x10\x64\x65veloperWebsite\x18\x0c \x01(\t\x12\x14\n\x0cnumDownloads\x18\r \x01(\t\x12\x13\n\x0bpackageName\x18\x0e \x01(\t\x12\x19\n\x11recentChangesHtml\x18\x0f \x01(\t\x12\x12\n\nuploadDate\x18\x10 \x01(\t\x12)\n\x04\x66ile\x18\x11 \x03(\x0b\x32\x1b.gplayapi.slim.FileMetadata\x12\x0f\n\x07\x61ppType\x18\x12 \x01(\t\x12\x10\n\x08unstable\x18\x15 \x01(\x08\x12\x16\n\x0ehasInstantLink\x18\x18 \x01(\x08\x12\x13\n\x0b\x63ontainsAds\x18\x1e \x01(\t\x12\x31\n\x0c\x64\x65pendencies\x18\" \x01(\x0b\x32\x1b.gplayapi.slim.Dependencies\x12=\n\x12testingProgramInfo\x18# \x01(\x0b\x32!.gplayapi.slim.TestingProgramInfo\x12\x37\n\x0f\x65\x61rlyAccessInfo\x18$ \x01(\x0b\x32\x1e.gplayapi.slim.EarlyAccessInfo\x12\x13\n\x0binstantLink\x18+ \x01(\t\x12\x18\n\x10\x64\x65veloperAddress\x18- \x01(\t\"s\n\x0c\x44\x65pendencies\x12\x10\n\x08unknown1\x18\x01 \x01(\x05\x12\x10\n\x08unknown2\x18\x02 \x01(\x03\x12-\n\ndependency\x18\x03 \x03(\x0b\x32\x19.gplayapi.slim.Dependency\x12\x10\n\x08unknown3\x18\x04 \x01(\x05\"D\n\nDependency\x12\x13\n\x0bpackageName\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\x05\x12\x10\n\x08unknown4\x18\x04 \x01(\x05\"Z\n\x12TestingProgramInfo\x12\x12\n\nsubscribed\x18\x02 \x01(\x08\x12\x13\n\x0bsubscribed1\x18\x03 \x01(\x08\x12\x1b\n\x13testingProgramEmail\x18\x05 \x01(\t\" \n\x0f\x45\x61rlyAccessInfo\x12\r\n\x05\x65mail\x18\x03 \x01(\t\"l\n\rArtistDetails\x12\x12\n\ndetailsUrl\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x39\n\rexternalLinks\x18\x03 \x01(\x0b\x32\".gplayapi.slim.ArtistExternalLinks\"b\n\x13\x41rtistExternalLinks\x12\x12\n\nwebsiteUrl\x18\x01 \x03(\t\x12\x1c\n\x14googlePlusProfileUrl\x18\x02 \x01(\t\x12\x19\n\x11youtubeChannelUrl\x18\x03 \x01(\t\"\xe0\x04\n\x0f\x44ocumentDetails\x12-\n\nappDetails\x18\x01 \x01(\x0b\x32\x19.gplayapi.slim.AppDetails\x12\x31\n\x0c\x61lbumDetails\x18\x02 \x01(\x0b\x32\x1b.gplayapi.slim.AlbumDetails\x12\x33\n\rartistDetails\x18\x03 \x01(\x0b\x32\x1c.gplayapi.slim.ArtistDetails\x12/\n\x0bsongDetails\x18\x04 \x01(\x0b\x32\x1a.gplayapi.slim.SongDetails\x12/\n\x0b\x62ookDetails\x18\x05 \x01(\x0b\x32\x1a.gplayapi.slim.BookDetails\x12\x31\n\x0cvideoDetails\x18\x06 \x01(\x0b\x32\x1b.gplayapi.slim.VideoDetails\x12?\n\x13subscriptionDetails\x18\x07 \x01(\x0b\x32\".gplayapi.slim.SubscriptionDetails\x12\x37\n\x0fmagazineDetails\x18\x08 \x01(\x0b\x32\x1e.gplayapi.slim.MagazineDetails\x12\x33\n\rtvShowDetails\x18\t \x01(\x0b\x32\x1c.gplayapi.slim.TvShowDetails\x12\x37\n\x0ftvSeasonDetails\x18\n \x01(\x0b\x32\x1e.gplayapi.slim.TvSeasonDetails\x12\x39\n\x10tvEpisodeDetails\x18\x0b \x01(\x0b\x32\x1f.gplayapi.slim.TvEpisodeDetails\"C\n\x0c\x46ileMetadata\x12\x10\n\x08\x66ileType\x18\x01 \x01(\x05\x12\x13\n\x0bversionCode\x18\x02 \x01(\x05\x12\x0c\n\x04size\x18\x03 \x01(\x03\"\x94\x01\n\x0fMagazineDetails\x12\x18\n\x10parentDetailsUrl\x18\x01 \x01(\t\x12)\n!deviceAvailabilityDescriptionHtml\x18\x02 \x01(\t\x12\x16\n\x0epsvDescription\x18\x03 \x01(\t\x12$\n\x1c\x64\x65liveryFrequencyDescription\x18\x04 \x01(\t\"\xc9\x01\n\x0cMusicDetails\x12\x11\n\tcensoring\x18\x01 \x01(\x05\x12\x13\n\x0b\x64urationSec\x18\x02 \x01(\x05\x12\x1b\n\x13originalReleaseDate\x18\x03 \x01(\t\x12\r\n\x05label\x18\x04 \x01(\t\x12,\n\x06\x61rtist\x18\x05 \x03(\x0b\x32\x1c.gplayapi.slim.ArtistDetails\x12\r\n\x05genre\x18\x06 \x03(\t\x12\x13\n\x0breleaseDate\x18\x07 \x01(\t\x12\x13\n\x0breleaseType\x18\x08 \x03(\x05\"\xba\x01\n\x0bSongDetails\x12\x0c\n\x04name\x18\x01 \x01(\t\x12,\n\x07\x64\x65tails\x18\x02 \x01(\x0b\x32\x1b.gplayapi.slim.MusicDetails\x12\x11\n\talbumName\x18\x03 \x01(\t\x12\x13\n\x0btrackNumber\x18\x04 \x01(\x05\x12\x12\n\npreviewUrl\x18\x05 \x01(\t\x12\x33\n\rdisplayArtist\x18\x06 \x01(\x0b\x32\x1c.gplayapi.slim.ArtistDetails\"1\n\x13SubscriptionDetails\x12\x1a\n\x12subscriptionPeriod\x18\x01 \x01(\x05\"e\n\x07Trailer\x12\x11\n\ttrailerId\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x14\n\x0cthumbnailUrl\x18\x03 \x01(\t\x12\x10\n\x08watchUrl\x18\x04 \x01(\t\x12\x10\n\x08\x64uration\x18\x05 \x01(\t\"W\n\x10TvEpisodeDetails\x12\x18\n\x10parentDetailsUrl\x18\x01 \x01(\t\x12\x14\n\x0c\x65pisodeIndex\x18\x02 \x01(\x05\x12\x13\n\x0breleaseDate\x18\x03 \x01(\t\"j\n\x0fTvSeasonDetails\x12\x18\n\x10parentDetailsUrl\x18\x01 \x01(\t\x12\x13\n\x0bseasonIndex\x18\x02 \x01(\x05\x12\x13\n\x0breleaseDate\x18\x03 \x01(\t\x12\x13\n\x0b\x62roadcaster\x18\x04 \x01(\t\"]\n\rTvShowDetails\x12\x13\n\x0bseasonCount\x18\x01 \x01(\x05\x12\x11\n\tstartYear\x18\x02 \x01(\x05\x12\x0f\n\x07\x65ndYear\x18\x03 \x01(\x05\x12\x13\n\x0b\x62roadcaster\x18\x04 \x01(\t\"?\n\x0bVideoCredit\x12\x12\n\ncreditType\x18\x01 \x01(\x05\x12\x0e\n\x06\x63redit\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x03(\t\"\x85\x02\n\x0cVideoDetails\x12*\n\x06\x63redit\x18\x01 \x03(\x0b\x32\x1a.gplayapi.slim.VideoCredit\x12\x10\n\x08\x64uration\x18\x02 \x01(\t\x12\x13\n\x0breleaseDate\x18\x03 \x01(\t\x12\x15\n\rcontentRating\x18\x04 \x01(\t\x12\r\n\x05likes\x18\x05 \x01(\x03\x12\x10\n\x08\x64islikes\x18\x06 \x01(\x03\x12\r\n\x05genre\x18\x07 \x03(\t\x12\'\n\x07trailer\x18\x08 \x03(\x0b\x32\x16.gplayapi.slim.Trailer\x12\x32\n\nrentalTerm\x18\t \x03(\x0b\x32\x1e.gplayapi.slim.VideoRentalTerm\"\xae\x01\n\x0fVideoRentalTerm\x12\x11\n\tofferType\x18\x01 \x01(\x05\x12\x19\n\x11offerAbbreviation\x18\x02 \x01(\t\x12\x14\n\x0crentalHeader\x18\x03 \x01(\t\x12\x31\n\x04term\x18\x04 \x03(\n2#.gplayapi.slim.VideoRentalTerm.Term\x1a$\n\x04Term\x12\x0e\n\x06header\x18\x05 \x01(\t\x12\x0c\n\x04\x62ody\x18\x06 \x01(\t\"\x87\x02\n\x06\x42ucket\x12&\n\x08\x64ocument\x18\x01 \x03(\x0b\x32\x14.gplayapi.slim.DocV1\x12\x13\n\x0bmultiCorpus\x18\x02 \x01(\x08\x12\r\n\x05title\x18\x03 \x01(\t\x12\x0f\n\x07iconUrl\x18\x04 \x01(\t\x12\x17\n\x0f\x66ullContentsUrl\x18\x05 \x01(\t\x12\x11\n\trelevance\x18\x06 \x01(\x01\x12\x18\n\x10\x65stimatedResults\x18\x07 \x01(\x03\x12\x17\n\x0f\x61nalyticsCookie\x18\x08 \x01(\t\x12\x1b\n\x13\x66ullContentsListUrl\x18\t \x01(\t\x12\x13\n\x0bnextPageUrl\x18\n \x01(\t\x12\x0f\n\x07ordered\x18\x0b \x01(\x08\"X\n\x0cListResponse\x12%\n\x06\x62ucket\x18\x01 \x03(\x0b\x32\x15.gplayapi.slim.Bucket\x12!\n\x03\x64oc\x18\x02 \x03(\x0b\x32\x14.gplayapi.slim.DocV2\"\xbe\x03\n\x05\x44ocV1\x12*\n\tfinskyDoc\x18\x01 \x01(\x0b\x32\x17.gplayapi.slim.Document\x12\r\n\x05\x64ocid\x18\x02 \x01(\t\x12\x12\n\ndetailsUrl\x18\x03 \x01(\t\x12\x12\n\nreviewsUrl\x18\x04 \x01(\t\x12\x16\n\x0erelatedListUrl\x18\x05 \x01(\t\x12\x15\n\rmoreByListUrl\x18\x06 \x01(\t\x12\x10\n\x08shareUrl\x18\x07 \x01(\t\x12\x0f\n\x07\x63reator\x18\x08 \x01(\t\x12/\n\x07\x64\x65tails\x18\t \x01(\x0b\x32\x1e.gplayapi.slim.DocumentDetails\x12\x17\n\x0f\x64\x65scriptionHtml\x18\n \x01(\t\x12\x18\n\x10relatedBrowseUrl\x18\x0b \x01(\t\x12\x17\n\x0fmoreByBrowseUrl\x18\x0c \x01(\t\x12\x15\n\rrelatedHeader\x18\r \x01(\t\x12\x14\n\x0cmoreByHeader\x18\x0e \x01(\t\x12\r\n\x05title\x18\x0f \x01(\t\x12/\n\x0bplusOneData\x18\x10 \x01(\x0b\x32\x1a.gplayapi.slim.PlusOneData\x12\x16\n\x0ewarningMessage\x18\x11 \x01(\t\"\xe3\x06\n\x05\x44ocV2\x12\r\n\x05\x64ocid\x18\x01 \x01(\t\x12\x14\n\x0c\x62\x61\x63kendDocid\x18\x02 \x01(\t\x12\x0f\n\x07\x64ocType\x18\x03 \x01(\x05\x12\x11\n\tbackendId\x18\x04 \x01(\x05\x12\r\n\x05title\x18\x05 \x01(\t\x12\x0f\n\x07\x63reator\x18\x06 \x01(\t\x12\x17\n\x0f\x64\x65scriptionHtml\x18\x07 \x01(\t\x12#\n\x05offer\x18\x08 \x03(\x0b\x32\x14.gplayapi.slim.Offer\x12\x31\n\x0c\x61vailability\x18\t \x01(\x0b\x32\x1b.gplayapi.slim.Availability\x12#\n\x05image\x18\n \x03(\x0b\x32\x14.gplayapi.slim.Image\x12#\n\x05\x63hild\x18\x0b \x03(\x0b\x32\x14.gplayapi.slim.DocV2\x12;\n\x11\x63ontainerMetadata\x18\x0c \x01(\x0b\x32 .gplayapi.slim.ContainerMetadata\x12/\n\x07\x64\x65tails\x18\r \x01(\x0b\x32\x1e.gplayapi.slim.DocumentDetails\x12\x37\n\x0f\x61ggregateRating\x18\x0e \x01(\x0b\x32\x1e.gplayapi.slim.AggregateRating\x12\x31\n\x0crelatedLinks\x18\x0f \x01(\x0b\x32\x1b.gplayapi.slim.RelatedLinks\x12\x12\n\ndetailsUrl\x18\x10 \x01(\t\x12\x10\n\x08shareUrl\x18\x11 \x01(\t\x12\x12\n\nreviewsUrl\x18\x12 \x01(\t\x12\x12\n\nbackendUrl\x18\x13 \x01(\t\x12\x1a\n\x12purchaseDetailsUrl\x18\x14 \x01(\t\x12\x17\n\x0f\x64\x65tailsReusable\x18\x15 \x01(\x08\x12\x10\n\x08subtitle\x18\x16 \x01(\t\x12I\n\x18unknownCategoryContainer\x18\x18 \x01(\x0b\x32\'.gplayapi.slim.UnknownCategoryContainer\x12+\n\tunknown25\x18\x19 \x01(\x0b\x32\x18.gplayapi.slim.Unknown25\x12\x18\n\x10\x64\x65scriptionShort\x18\x1b \x01(\t\x12\x19\n\x11reviewSnippetsUrl\x18\x1f \x01(\t\x12\x1a\n\x12reviewQuestionsUrl\x18\" \x01(\t\"7\n\tUnknown25\x12*\n\x04item\x18\x02 \x03(\x0b\x32\x1c.gplayapi.slim.Unknown25Item\"T\n\rUnknown25Item\x12\r\n\x05label\x18\x01 \x01(\t\x12\x34\n\tcontainer\x18\x03 \x01(\x0b\x32!.gplayapi.slim.Unknown25Container\"#\n\x12Unknown25Container\x12\r\n\x05value\x18\x02 \x01(\t\"\x9f\x02\n\x0cRelatedLinks\x12\x35\n\x08unknown1\x18\n \x01(\x0b\x32#.gplayapi.slim.RelatedLinksUnknown1\x12\x18\n\x10privacyPolicyUrl\x18\x12 \x01(\t\x12\x34\n\x10youMightAlsoLike\x18\x18 \x01(\x0b\x32\x1a.gplayapi.slim.RelatedLink\x12#\n\x05rated\x18\x1d \x01(\x0b\x32\x14.gplayapi.slim.Rated\x12\x30\n\x0crelatedLinks\x18\" \x03(\x0b\x32\x1a.gplayapi.slim.RelatedLink\x12\x31\n\x0c\x63\x61tegoryInfo\x18\x35 \x01(\x0b\x32\x1b.gplayapi.slim.CategoryInfo\"M\n\x14RelatedLinksUnknown1\x12\x35\n\x08unknown2\x18\x02 \x01(\x0b\x32#.gplayapi.slim.RelatedLinksUnknown2\"<\n\x14RelatedLinksUnknown2\x12\x0f\n\x07homeUrl\x18\x02 \x01(\t\x12\x13\n\x0bnextPageUrl\x18\x03 \x01(\t\"V\n\x05Rated\x12\r\n\x05label\x18\x01 \x01(\t\x12#\n\x05image\x18\x02 \x01(\x0b\x32\x14.gplayapi.slim.Image\x12\x19\n\x11learnMoreHtmlLink\x18\x04 \x01(\t\"8\n\x0bRelatedLink\x12\r\n\x05label\x18\x01 \x01(\t\x12\x0c\n\x04url1\x18\x02 \x01(\t\x12\x0c\n\x04url2\x18\x03 \x01(\t\"4\n\x0c\x43\x61tegoryInfo\x12\x0f\n\x07\x61ppType\x18\x01 \x01(\t\x12\x13\n\x0b\x61ppCategory\x18\x02 \x01(\t\"\x91\x04\n\x0c\x41vailability\x12\x13\n\x0brestriction\x18\x05 \x01(\x05\x12\x11\n\tofferType\x18\x06 \x01(\x05\x12!\n\x04rule\x18\x07 \x01(\x0b\x32\x13.gplayapi.slim.Rule\x12\x66\n perdeviceavailabilityrestriction\x18\t \x03(\n2<.gplayapi.slim.Availability.PerDeviceAvailabilityRestriction\x12\x18\n\x10\x61vailableIfOwned\x18\r \x01(\x08\x12\'\n\x07install\x18\x0e \x03(\x0b\x32\x16.gplayapi.slim.Install\x12\x37\n\nfilterInfo\x18\x10 \x01(\x0b\x32#.gplayapi.slim.FilterEvaluationInfo\x12\x33\n\rownershipInfo\x18\x11 \x01(\x0b\x32\x1c.gplayapi.slim.OwnershipInfo\x1a\x9c\x01\n PerDeviceAvailabilityRestriction\x12\x11\n\tandroidId\x18\n \x01(\x06\x12\x19\n\x11\x64\x65viceRestriction\x18\x0b \x01(\x05\x12\x11\n\tchannelId\x18\x0c \x01(\x03\x12\x37\n\nfilterInfo\x18\x0f \x01(\x0b\x32#.gplayapi.slim.FilterEvaluationInfo\"M\n\x14\x46ilterEvaluationInfo\x12\x35\n\x0eruleEvaluation\x18\x01 \x03(\x0b\x32\x1d.gplayapi.slim.RuleEvaluation\"\xe2\x01\n\x04Rule\x12\x0e\n\x06negate\x18\x01 \x01(\x08\x12\x10\n\x08operator\x18\x02 \x01(\x05\x12\x0b\n\x03key\x18\x03 \x01(\x05\x12\x11\n\tstringArg\x18\x04 \x03(\t\x12\x0f\n\x07longArg\x18\x05 \x03(\x03\x12\x11\n\tdoubleArg\x18\x06 \x03(\x01\x12$\n\x07subrule\x18\x07 \x03(\x0b\x32\x13.gplayapi.slim.Rule\x12\x14\n\x0cresponseCode\x18\x08 \x01(\x05\x12\x0f\n\x07\x63omment\x18\t \x01(\t\x12\x15\n\rstringArgHash\x18\n \x03(\x06\x12\x10\n\x08\x63onstArg\x18\x0b \x03(\x05\"\x9b\x01\n\x0eRuleEvaluation\x12!\n\x04rule\x18\x01 \x01(\x0b\x32\x13.gplayapi.slim.Rule\x12\x19\n\x11\x61\x63tualStringValue\x18\x02 \x03(\t\x12\x17\n\x0f\x61\x63tualLongValue\x18\x03 \x03(\x03\x12\x17\n\x0f\x61\x63tualBoolValue\x18\x04 \x03(\x08\x12\x19\n\x11\x61\x63tualDoubleValue\x18\x05 \x03(\x01\"v\n\x11LibraryAppDetails\x12\x17\n\x0f\x63\x65rtificateHash\x18\x02 \x01(\t\x12\"\n\x1arefundTimeoutTimestampMsec\x18\x03 \x01(\x03\x12$\n\x1cpostDeliveryRefundWindowMsec\x18\x04 \x01(\x03\"D\n\x13LibraryInAppDetails\x12\x1a\n\x12signedPurchaseData\x18\x01 \x01(\t\x12\x11\n\tsignature\x18\x02 \x01(\t\"\xa8\x02\n\x0fLibraryMutation\x12#\n\x05\x64ocid\x18\x01 \x01(\x0b\x32\x14.gplayapi.slim.Docid\x12\x11\n\tofferType\x18\x02 \x01(\x05\x12\x14\n\x0c\x64ocumentHash\x18\x03 \x01(\x03\x12\x0f\n\x07\x64\x65leted\x18\x04 \x01(\x08\x12\x34\n\nappDetails\x18\x05 \x01(\x0b\x32 .gplayapi.slim.LibraryAppDetails\x12\x46\n\x13subscriptionDetails\x18\x06 \x01(\x0b\x32).gplayapi.slim.LibrarySubscriptionDetails\x12\x38\n\x0cinAppDetails\x18\x07 \x01(\x0b\x32\".gplayapi.slim.LibraryInAppDetails\"\x95\x01\n\x1aLibrarySubscriptionDetails\x12\x1f\n\x17initiationTimestampMsec\x18\x01 \x01(\x03\x12\x1f\n\x17validUntilTimestampMsec\x18\x02 \x01(\x03\x12\x14\n\x0c\x61utoRenewing\x18\x03 \x01(\x08\x12\x1f\n\x17trialUntilTimestampMsec\x18\x04 \x01(\x03\"\x9a\x01\n\rLibraryUpdate\x12\x0e\n\x06status\x18\x01 \x01(\x05\x12\x0e\n\x06\x63orpus\x18\x02 \x01(\x05\x12\x13\n\x0bserverToken\x18\x03 \x01(\x0c\x12\x30\n\x08mutation\x18\x04 \x03(\x0b\x32\x1e.gplayapi.slim.LibraryMutation\x12\x0f\n\x07hasMore\x18\x05 \x01(\x08\x12\x11\n\tlibraryId\x18\x06 \x01(\t\"B\n\x1a\x41ndroidAppNotificationData\x12\x13\n\x0bversionCode\x18\x01 \x01(\x05\x12\x0f\n\x07\x61ssetId\x18\x02 \x01(\t\"M\n\x15InAppNotificationData\x12\x17\n\x0f\x63heckoutOrderId\x18\x01 \x01(\t\x12\x1b\n\x13inAppNotificationId\x18\x02 \x01(\t\"#\n\x10LibraryDirtyData\x12\x0f\n\x07\x62\x61\x63kend\x18\x01 \x01(\x05\"\x95\x05\n\x0cNotification\x12\x18\n\x10notificationType\x18\x01 \x01(\x05\x12\x11\n\ttimestamp\x18\x03 \x01(\x03\x12#\n\x05\x64ocid\x18\x04 \x01(\x0b\x32\x14.gplayapi.slim.Docid\x12\x10\n\x08\x64ocTitle\x18\x05 \x01(\t\x12\x11\n\tuserEmail\x18\x06 \x01(\t\x12:\n\x07\x61ppData\x18\x07 \x01(\x0b\x32).gplayapi.slim.AndroidAppNotificationData\x12>\n\x0f\x61ppDeliveryData\x18\x08 \x01(\x0b\x32%.gplayapi.slim.AndroidAppDeliveryData\x12?\n\x13purchaseRemovalData\x18\t \x01(\x0b\x32\".gplayapi.slim.PurchaseRemovalData\x12\x41\n\x14userNotificationData\x18\n \x01(\x0b\x32#.gplayapi.slim.UserNotificationData\x12\x43\n\x15inAppNotificationData\x18\x0b \x01(\x0b\x32$.gplayapi.slim.InAppNotificationData\x12\x41\n\x14purchaseDeclinedData\x18\x0c \x01(\x0b\x32#.gplayapi.slim.PurchaseDeclinedData\x12\x16\n\x0enotificationId\x18\r \x01(\t\x12\x33\n\rlibraryUpdate\x18\x0e \x01(\x0b\x32\x1c.gplayapi.slim.LibraryUpdate\x12\x39\n\x10libraryDirtyData\x18\x0f \x01(\x0b\x32\x1f.gplayapi.slim.LibraryDirtyData\"@\n\x14PurchaseDeclinedData\x12\x0e\n\x06reason\x18\x01 \x01(\x05\x12\x18\n\x10showNotification\x18\x02 \x01(\x08\"(\n\x13PurchaseRemovalData\x12\x11\n\tmalicious\x18\x01 \x01(\x08\"\x88\x01\n\x14UserNotificationData\x12\x19\n\x11notificationTitle\x18\x01 \x01(\t\x12\x18\n\x10notificationText\x18\x02 \x01(\t\x12\x12\n\ntickerText\x18\x03 \x01(\t\x12\x13\n\x0b\x64ialogTitle\x18\x04 \x01(\t\x12\x12\n\ndialogText\x18\x05 \x01(\t\"\xa7\x02\n\x0f\x41ggregateRating\x12\x0c\n\x04type\x18\x01 \x01(\x05\x12\x12\n\nstarRating\x18\x02 \x01(\x02\x12\x14\n\x0cratingsCount\x18\x03 \x01(\x04\x12\x16\n\x0eoneStarRatings\x18\x04 \x01(\x04\x12\x16\n\x0etwoStarRatings\x18\x05 \x01(\x04\x12\x18\n\x10threeStarRatings\x18\x06 \x01(\x04\x12\x17\n\x0f\x66ourStarRatings\x18\x07 \x01(\x04\x12\x17\n\x0f\x66iveStarRatings\x18\x08 \x01(\x04\x12\x15\n\rthumbsUpCount\x18\t \x01(\x04\x12\x17\n\x0fthumbsDownCount\x18\n \x01(\x04\x12\x14\n\x0c\x63ommentCount\x18\x0b \x01(\x04\x12\x1a\n\x12\x62\x61yesianMeanRating\x18\x0c \x01(\x01\"\x13\n\x11\x41\x63\x63\x65ptTosResponse\"\xe9\x01\n\x14\x43\x61rrierBillingConfig\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\napiVersion\x18\x03 \x01(\x05\x12\x17\n\x0fprovisioningUrl\x18\x04 \x01(\t\x12\x16\n\x0e\x63redentialsUrl\x18\x05 \x01(\t\x12\x13\n\x0btosRequired\x18\x06 \x01(\x08\x12)\n!perTransactionCredentialsRequired\x18\x07 \x01(\x08\x12\x32\n*sendSubscriberIdWithCarrierBillingRequests\x18\x08 \x01(\x08\"l\n\rBillingConfig\x12\x41\n\x14\x63\x61rrierBillingConfig\x18\x01 \x01(\x0b\x32#.gplayapi.slim.CarrierBillingConfig\x12\x18\n\x10maxIabApiVersion\x18\x02 \x01(\x05\"\x81\x01\n\x0e\x43orpusMetadata\x12\x0f\n\x07\x62\x61\x63kend\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nlandingUrl\x18\x03 \x01(\t\x12\x13\n\x0blibraryName\x18\x04 \x01(\t\x12\x15\n\rrecsWidgetUrl\x18\x06 \x01(\t\x12\x10\n\x08shopName\x18\x07 \x01(\t\"#\n\x0b\x45xperiments\x12\x14\n\x0c\x65xperimentId\x18\x01 \x03(\t\"3\n\x10SelfUpdateConfig\x12\x1f\n\x17latestClientVersionCode\x18\x01 \x01(\x05\"\xe9\x04\n\x0bTocResponse\x12-\n\x06\x63orpus\x18\x01 \x03(\x0b\x32\x1d.gplayapi.slim.CorpusMetadata\x12\x1c\n\x14tosVersionDeprecated\x18\x02 \x01(\x05\x12\x12\n\ntosContent\x18\x03 \x01(\t\x12\x0f\n\x07homeUrl\x18\x04 \x01(\t\x12/\n\x0b\x65xperiments\x18\x05 \x01(\x0b\x32\x1a.gplayapi.slim.Experiments\x12&\n\x1etosCheckboxTextMarketingEmails\x18\x06 \x01(\t\x12\x10\n\x08tosToken\x18\x07 \x01(\t\x12\x17\n\x0ficonOverrideUrl\x18\t \x01(\t\x12\x39\n\x10selfUpdateConfig\x18\n \x01(\x0b\x32\x1f.gplayapi.slim.SelfUpdateConfig\x12\"\n\x1arequiresUploadDeviceConfig\x18\x0b \x01(\x08\x12\x33\n\rbillingConfig\x18\x0c \x01(\x0b\x32\x1c.gplayapi.slim.BillingConfig\x12\x15\n\rrecsWidgetUrl\x18\r \x01(\t\x12\x15\n\rsocialHomeUrl\x18\x0f \x01(\t\x12\x1f\n\x17\x61geVerificationRequired\x18\x10 \x01(\x08\x12\x1a\n\x12gplusSignupEnabled\x18\x11 \x01(\x08\x12\x15\n\rredeemEnabled\x18\x12 \x01(\x08\x12\x0f\n\x07helpUrl\x18\x13 \x01(\t\x12\x0f\n\x07themeId\x18\x14 \x01(\x05\x12\x1c\n\x14\x65ntertainmentHomeUrl\x18\x15 \x01(\t\x12\x0e\n\x06\x63ookie\x18\x16 \x01(\t\"\xaa\x03\n\x07Payload\x12\x31\n\x0clistResponse\x18\x01 \x01(\x0b\x32\x1b.gplayapi.slim.ListResponse\x12\x37\n\x0f\x64\x65tailsResponse\x18\x02 \x01(\x0b\x32\x1e.gplayapi.slim.DetailsResponse\x12/\n\x0btocResponse\x18\x06 \x01(\x0b\x32\x1a.gplayapi.slim.TocResponse\x12\x35\n\x0e\x62rowseResponse\x18\x07 \x01(\x0b\x32\x1d.gplayapi.slim.BrowseResponse\x12?\n\x13\x62ulkDetailsResponse\x18\x13 \x01(\x0b\x32\".gplayapi.slim.BulkDetailsResponse\x12;\n\x11\x61\x63\x63\x65ptTosResponse\x18\x16 \x01(\x0b\x32 .gplayapi.slim.AcceptTosResponse\x12M\n\x1auploadDeviceConfigResponse\x18\x1c \x01(\x0b\x32).gplayapi.slim.UploadDeviceConfigResponse\"u\n\x08PreFetch\x12\x0b\n\x03url\x18\x01 \x01(\t\x12\x30\n\x08response\x18\x02 \x01(\x0b\x32\x1e.gplayapi.slim.ResponseWrapper\x12\x0c\n\x04\x65tag\x18\x03 \x01(\t\x12\x0b\n\x03ttl\x18\x04 \x01(\x03\x12\x0f\n\x07softTtl\x18\x05 \x01(\x03\"\'\n\x0eServerMetadata\x12\x15\n\rlatencyMillis\x18\x01 \x01(\x03\".\n\x07Targets\x12\x10\n\x08targetId\x18\x01 \x03(\x03\x12\x11\n\tsignature\x18\x02 \x01(\x0c\"+\n\x0cServerCookie\x12\x0c\n\x04type\x18\x01 \x01(\x05\x12\r\n\x05token\x18\x02 \x01(\x0c\"B\n\rServerCookies\x12\x31\n\x0cserverCookie\x18\x01 \x03(\x0b\x32\x1b.gplayapi.slim.ServerCookie\"\xf8\x02\n\x0fResponseWrapper\x12\'\n\x07payload\x18\x01 \x01(\x0b\x32\x16.gplayapi.slim.Payload\x12/\n\x08\x63ommands\x18\x02 \x01(\x0b\x32\x1d.gplayapi.slim.ServerCommands\x12)\n\x08preFetch\x18\x03 \x03(\x0b\x32\x17.gplayapi.slim.PreFetch\x12\x31\n\x0cnotification\x18\x04 \x03(\x0b\x32\x1b.gplayapi.slim.Notification\x12\x35\n\x0eserverMetadata\x18\x05 \x01(\x0b\x32\x1d.gplayapi.slim.ServerMetadata\x12\'\n\x07targets\x18\x06 \x01(\x0b\x32\x16.gplayapi.slim.Targets\x12\x33\n\rserverCookies\x18\x07 \x01(\x0b\x32\x1c.gplayapi.slim.ServerCookies\x12\x18\n\x10serverLogsCookie\x18\t \x01(\x0c\"]\n\x0eServerCommands\x12\x12\n\nclearCache\x18\x01 \x01(\x08\x12\x1b\n\x13\x64isplayErrorMessage\x18\x02 \x01(\t\x12\x1a\n\x12logErrorStacktrace\x18\x03 \x01(\t\"\xd1\x02\n\x06Review\x12\x12\n\nauthorName\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\x12\x0e\n\x06source\x18\x03 \x01(\t\x12\x17\n\x0f\x64ocumentVersion\x18\x04 \x01(\t\x12\x15\n\rtimestampMsec\x18\x05 \x01(\x03\x12\x12\n\nstarRating\x18\x06 \x01(\x05\x12\r\n\x05title\x18\x07 \x01(\t\x12\x0f\n\x07\x63omment\x18\x08 \x01(\t\x12\x11\n\tcommentId\x18\t \x01(\t\x12\x12\n\ndeviceName\x18\x13 \x01(\t\x12\x11\n\treplyText\x18\x1d \x01(\t\x12\x1a\n\x12replyTimestampMsec\x18\x1e \x01(\x03\x12+\n\x06\x61uthor\x18\x1f \x01(\x0b\x32\x1b.gplayapi.slim.ReviewAuthor\x12/\n\x0buserProfile\x18! \x01(\x0b\x32\x1a.gplayapi.slim.UserProfile\"B\n\x0cReviewAuthor\x12\x0c\n\x04name\x18\x02 \x01(\t\x12$\n\x06\x61vatar\x18\x05 \x01(\x0b\x32\x14.gplayapi.slim.Image\"\xc0\x01\n\x0bUserProfile\x12\x16\n\x0epersonIdString\x18\x01 \x01(\t\x12\x10\n\x08personId\x18\x02 \x01(\t\x12\x10\n\x08unknown1\x18\x03 \x01(\x05\x12\x10\n\x08unknown2\x18\x04 \x01(\x05\x12\x0c\n\x04name\x18\x05 \x01(\t\x12#\n\x05image\x18\n \x03(\x0b\x32\x14.gplayapi.slim.Image\x12\x15\n\rgooglePlusUrl\x18\x13 \x01(\t\x12\x19\n\x11googlePlusTagline\x18\x16 \x01(\t\"\x92\x01\n\x19UploadDeviceConfigRequest\x12\x44\n\x13\x64\x65viceConfiguration\x18\x01 \x01(\x0b\x32\'.gplayapi.slim.DeviceConfigurationProto\x12\x14\n\x0cmanufacturer\x18\x02 \x01(\t\x12\x19\n\x11gcmRegistrationId\x18\x03 \x01(\t\"=\n\x1aUploadDeviceConfigResponse\x12\x1f\n\x17uploadDeviceConfigToken\x18\x01 \x01(\t\"\x83\x04\n\x15\x41ndroidCheckinRequest\x12\x0c\n\x04imei\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\x03\x12\x0e\n\x06\x64igest\x18\x03 \x01(\t\x12\x33\n\x07\x63heckin\x18\x04 \x01(\x0b\x32\".gplayapi.slim.AndroidCheckinProto\x12\x14\n\x0c\x64\x65siredBuild\x18\x05 \x01(\t\x12\x0e\n\x06locale\x18\x06 \x01(\t\x12\x11\n\tloggingId\x18\x07 \x01(\x03\x12\x15\n\rmarketCheckin\x18\x08 \x01(\t\x12\x0f\n\x07macAddr\x18\t \x03(\t\x12\x0c\n\x04meid\x18\n \x01(\t\x12\x15\n\raccountCookie\x18\x0b \x03(\t\x12\x10\n\x08timeZone\x18\x0c \x01(\t\x12\x15\n\rsecurityToken\x18\r \x01(\x06\x12\x0f\n\x07version\x18\x0e \x01(\x05\x12\x0f\n\x07otaCert\x18\x0f \x03(\t\x12\x14\n\x0cserialNumber\x18\x10 \x01(\t\x12\x0b\n\x03\x65sn\x18\x11 \x01(\t\x12\x44\n\x13\x64\x65viceConfiguration\x18\x12 \x01(\x0b\x32\'.gplayapi.slim.DeviceConfigurationProto\x12\x13\n\x0bmacAddrType\x18\x13 \x03(\t\x12\x10\n\x08\x66ragment\x18\x14 \x01(\x05\x12\x10\n\x08userName\x18\x15 \x01(\t\x12\x18\n\x10userSerialNumber\x18\x16 \x01(\x05\"\xc0\x02\n\x16\x41ndroidCheckinResponse\x12\x0f\n\x07statsOk\x18\x01 \x01(\x08\x12\x31\n\x06intent\x18\x02 \x03(\x0b\x32!.gplayapi.slim.AndroidIntentProto\x12\x10\n\x08timeMsec\x18\x03 \x01(\x03\x12\x0e\n\x06\x64igest\x18\x04 \x01(\t\x12\x30\n\x07setting\x18\x05 \x03(\x0b\x32\x1f.gplayapi.slim.GservicesSetting\x12\x10\n\x08marketOk\x18\x06 \x01(\x08\x12\x11\n\tandroidId\x18\x07 \x01(\x06\x12\x15\n\rsecurityToken\x18\x08 \x01(\x06\x12\x14\n\x0csettingsDiff\x18\t \x01(\x08\x12\x15\n\rdeleteSetting\x18\n \x03(\t\x12%\n\x1d\x64\x65viceCheckinConsistencyToken\x18\x0c \x01(\t\"/\n\x10GservicesSetting\x12\x0c\n\x04name\x18\x01 \x01(\x0c\x12\r\n\x05value\x18\x02 \x01(\x0c\"\x94\x02\n\x11\x41ndroidBuildProto\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07product\x18\x02 \x01(\t\x12\x0f\n\x07\x63\x61rrier\x18\x03 \x01(\t\x12\r\n\x05radio\x18\x04 \x01(\t\x12\x12\n\nbootloader\x18\x05 \x01(\t\x12\x0e\n\x06\x63lient\x18\x06 \x01(\t\x12\x11\n\ttimestamp\x18\x07 \x01(\x03\x12\x16\n\x0egoogleServices\x18\x08 \x01(\x05\x12\x0e\n\x06\x64\x65vice\x18\t \x01(\t\x12\x12\n\nsdkVersion\x18\n \x01(\x05\x12\r\n\x05model\x18\x0b \x01(\t\x12\x14\n\x0cmanufacturer\x18\x0c \x01(\t\x12\x14\n\x0c\x62uildProduct\x18\r \x01(\t\x12\x14\n\x0cotaInstalled\x18\x0e \x01(\x08\"\xac\x02\n\x13\x41ndroidCheckinProto\x12/\n\x05\x62uild\x18\x01 \x01(\x0b\x32 .gplayapi.slim.AndroidBuildProto\x12\x17\n\x0flastCheckinMsec\x18\x02 \x01(\x03\x12/\n\x05\x65vent\x18\x03 \x03(\x0b\x32 .gplayapi.slim.AndroidEventProto\x12\x32\n\x04stat\x18\x04 \x03(\x0b\x32$.gplayapi.slim.AndroidStatisticProto\x12\x16\n\x0erequestedGroup\x18\x05 \x03(\t\x12\x14\n\x0c\x63\x65llOperator\x18\x06 \x01(\t\x12\x13\n\x0bsimOperator\x18\x07 \x01(\t\x12\x0f\n\x07roaming\x18\x08 \x01(\t\x12\x12\n\nuserNumber\x18\t \x01(\x05\"A\n\x11\x41ndroidEventProto\x12\x0b\n\x03tag\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\x12\x10\n\x08timeMsec\x18\x03 \x01(\x03\"\xb8\x01\n\x12\x41ndroidIntentProto\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\t\x12\x0f\n\x07\x64\x61taUri\x18\x02 \x01(\t\x12\x10\n\x08mimeType\x18\x03 \x01(\t\x12\x11\n\tjavaClass\x18\x04 \x01(\t\x12\x36\n\x05\x65xtra\x18\x05 \x03(\n2\'.gplayapi.slim.AndroidIntentProto.Extra\x1a$\n\x05\x45xtra\x12\x0c\n\x04name\x18\x06 \x01(\t\x12\r\n\x05value\x18\x07 \x01(\t\"@\n\x15\x41ndroidStatisticProto\x12\x0b\n\x03tag\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\x12\x0b\n\x03sum\x18\x03 \x01(\x02')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'GooglePlaySlim_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _ANDROIDAPPDELIVERYDATA._serialized_start=40
+  _ANDROIDAPPDELIVERYDATA._serialized_end=596
+  _SPLIT._serialized_start=599
+  _SPLIT._serialized_end=734
+  _ANDROIDAPPPATCHDATA._serialized_start=737
+  _ANDROIDAPPPATCHDATA._serialized_end=865
+  _APPFILEMETADATA._serialized_start=868
+  _APPFILEMETADATA._serialized_end=1022
+  _ENCRYPTIONPARAMS._serialized_start=1024
+  _ENCRYPTIONPARAMS._serialized_end=1099
+  _HTTPCOOKIE._serialized_start=1101
+  _HTTPCOOKIE._serialized_end=1142
+  _BOOKAUTHOR._serialized_start=1144
+  _BOOKAUTHOR._serialized_end=1232
+  _BOOKDETAILS._serialized_start=1235
+  _BOOKDETAILS._serialized_end=1728
+  _BOOKDETAILS_IDENTIFIER._serialized_start=1682
+  _BOOKDETAILS_IDENTIFIER._serialized_end=1728
+  _BOOKSUBJECT._serialized_start=1730
+  _BOOKSUBJECT._serialized_end=1791
+  _BROWSELINK._serialized_start=1794
+  _BROWSELINK._serialized_end=1948
+  _UNKNOWNCATEGORYCONTAINER._serialized_start=1950
+  _UNKNOWNCATEGORYCONTAINER._serialized_end=2041
+  _CATEGORYIDCONTAINER._serialized_start=2043
+  _CATEGORYIDCONTAINER._serialized_end=2084
+  _BROWSERESPONSE._serialized_start=2087
+  _BROWSERESPONSE._serialized_end=2295
+  _CATEGORYCONTAINER._serialized_start=2297
+  _CATEGORYCONTAINER._serialized_end=2361
+  _DOCID._serialized_start=2363
+  _DOCID._serialized_end=2423
+  _INSTALL._serialized_start=2425
+  _INSTALL._serialized_end=2487
+  _OFFER._serialized_start=2490
+  _OFFER._serialized_end=2994
+  _OWNERSHIPINFO._serialized_start=2997
+  _OWNERSHIPINFO._serialized_end=3174
+  _RENTALTERMS._serialized_start=3176
+  _RENTALTERMS._serialized_end=3248
+  _SUBSCRIPTIONTERMS._serialized_start=3250
+  _SUBSCRIPTIONTERMS._serialized_end=3369
+  _TIMEPERIOD._serialized_start=3371
+  _TIMEPERIOD._serialized_end=3412
+  _CONTAINERMETADATA._serialized_start=3415
+  _CONTAINERMETADATA._serialized_end=3561
+  _BULKDETAILSENTRY._serialized_start=3563
+  _BULKDETAILSENTRY._serialized_end=3616
+  _BULKDETAILSREQUEST._serialized_start=3618
+  _BULKDETAILSREQUEST._serialized_end=3679
+  _BULKDETAILSRESPONSE._serialized_start=3681
+  _BULKDETAILSRESPONSE._serialized_end=3750
+  _DETAILSRESPONSE._serialized_start=3753
+  _DETAILSRESPONSE._serialized_end=4098
+  _BADGE._serialized_start=4101
+  _BADGE._serialized_end=4234
+  _BADGECONTAINER1._serialized_start=4236
+  _BADGECONTAINER1._serialized_end=4310
+  _BADGECONTAINER2._serialized_start=4312
+  _BADGECONTAINER2._serialized_end=4392
+  _BADGELINKCONTAINER._serialized_start=4394
+  _BADGELINKCONTAINER._serialized_end=4428
+  _FEATURES._serialized_start=4430
+  _FEATURES._serialized_end=4536
+  _FEATURE._serialized_start=4538
+  _FEATURE._serialized_end=4577
+  _DEVICECONFIGURATIONPROTO._serialized_start=4580
+  _DEVICECONFIGURATIONPROTO._serialized_end=5017
+  _DOCUMENT._serialized_start=5020
+  _DOCUMENT._serialized_end=5713
+  _DOCUMENTVARIANT._serialized_start=5716
+  _DOCUMENTVARIANT._serialized_end=6043
+  _IMAGE._serialized_start=6046
+  _IMAGE._serialized_end=6432
+  _IMAGE_DIMENSION._serialized_start=6341
+  _IMAGE_DIMENSION._serialized_end=6383
+  _IMAGE_CITATION._serialized_start=6385
+  _IMAGE_CITATION._serialized_end=6432
+  _TRANSLATEDTEXT._serialized_start=6434
+  _TRANSLATEDTEXT._serialized_end=6508
+  _PLUSONEDATA._serialized_start=6510
+  _PLUSONEDATA._serialized_end=6629
+  _PLUSPERSON._serialized_start=6631
+  _PLUSPERSON._serialized_end=6689
+  _ALBUMDETAILS._serialized_start=6691
+  _ALBUMDETAILS._serialized_end=6818
+  _APPDETAILS._serialized_start=6821
+  _APPDETAILS._serialized_end=7514
+  _DEPENDENCIES._serialized_start=7516
+  _DEPENDENCIES._serialized_end=7631
+  _DEPENDENCY._serialized_start=7633
+  _DEPENDENCY._serialized_end=7701
+  _TESTINGPROGRAMINFO._serialized_start=7703
+  _TESTINGPROGRAMINFO._serialized_end=7793
+  _EARLYACCESSINFO._serialized_start=7795
+  _EARLYACCESSINFO._serialized_end=7827
+  _ARTISTDETAILS._serialized_start=7829
+  _ARTISTDETAILS._serialized_end=7937
+  _ARTISTEXTERNALLINKS._serialized_start=7939
+  _ARTISTEXTERNALLINKS._serialized_end=8037
+  _DOCUMENTDETAILS._serialized_start=8040
+  _DOCUMENTDETAILS._serialized_end=8648
+  _FILEMETADATA._serialized_start=8650
+  _FILEMETADATA._serialized_end=8717
+  _MAGAZINEDETAILS._serialized_start=8720
+  _MAGAZINEDETAILS._serialized_end=8868
+  _MUSICDETAILS._serialized_start=8871
+  _MUSICDETAILS._serialized_end=9072
+  _SONGDETAILS._serialized_start=9075
+  _SONGDETAILS._serialized_end=9261
+  _SUBSCRIPTIONDETAILS._serialized_start=9263
+  _SUBSCRIPTIONDETAILS._serialized_end=9312
+  _TRAILER._serialized_start=9314
+  _TRAILER._serialized_end=9415
+  _TVEPISODEDETAILS._serialized_start=9417
+  _TVEPISODEDETAILS._serialized_end=9504
+  _TVSEASONDETAILS._serialized_start=9506
+  _TVSEASONDETAILS._serialized_end=9612
+  _TVSHOWDETAILS._serialized_start=9614
+  _TVSHOWDETAILS._serialized_end=9707
+  _VIDEOCREDIT._serialized_start=9709
+  _VIDEOCREDIT._serialized_end=9772
+  _VIDEODETAILS._serialized_start=9775
+  _VIDEODETAILS._serialized_end=10036
+  _VIDEORENTALTERM._serialized_start=10039
+  _VIDEORENTALTERM._serialized_end=10213
+  _VIDEORENTALTERM_TERM._serialized_start=10177
+  _VIDEORENTALTERM_TERM._serialized_end=10213
+  _BUCKET._serialized_start=10216
+  _BUCKET._serialized_end=10479
+  _LISTRESPONSE._serialized_start=10481
+  _LISTRESPONSE._serialized_end=10569
+  _DOCV1._serialized_start=10572
+  _DOCV1._serialized_end=11018
+  _DOCV2._serialized_start=11021
+  _DOCV2._serialized_end=11888
+  _UNKNOWN25._serialized_start=11890
+  _UNKNOWN25._serialized_end=11945
+  _UNKNOWN25ITEM._serialized_start=11947
+  _UNKNOWN25ITEM._serialized_end=12031
+  _UNKNOWN25CONTAINER._serialized_start=12033
+  _UNKNOWN25CONTAINER._serialized_end=12068
+  _RELATEDLINKS._serialized_start=12071
+  _RELATEDLINKS._serialized_end=12358
+  _RELATEDLINKSUNKNOWN1._serialized_start=12360
+  _RELATEDLINKSUNKNOWN1._serialized_end=12437
+  _RELATEDLINKSUNKNOWN2._serialized_start=12439
+  _RELATEDLINKSUNKNOWN2._serialized_end=12499
+  _RATED._serialized_start=12501
+  _RATED._serialized_end=12587
+  _RELATEDLINK._serialized_start=12589
+  _RELATEDLINK._serialized_end=12645
+  _CATEGORYINFO._serialized_start=12647
+  _CATEGORYINFO._serialized_end=12699
+  _AVAILABILITY._serialized_start=12702
+  _AVAILABILITY._serialized_end=13231
+  _AVAILABILITY_PERDEVICEAVAILABILITYRESTRICTION._serialized_start=13075
+  _AVAILABILITY_PERDEVICEAVAILABILITYRESTRICTION._serialized_end=13231
+  _FILTEREVALUATIONINFO._serialized_start=13233
+  _FILTEREVALUATIONINFO._serialized_end=13310
+  _RULE._serialized_start=13313
+  _RULE._serialized_end=13539
+  _RULEEVALUATION._serialized_start=13542
+  _RULEEVALUATION._serialized_end=13697
+  _LIBRARYAPPDETAILS._serialized_start=13699
+  _LIBRARYAPPDETAILS._serialized_end=13817
+  _LIBRARYINAPPDETAILS._serialized_start=13819
+  _LIBRARYINAPPDETAILS._serialized_end=13887
+  _LIBRARYMUTATION._serialized_start=13890
+  _LIBRARYMUTATION._serialized_end=14186
+  _LIBRARYSUBSCRIPTIONDETAILS._serialized_start=14189
+  _LIBRARYSUBSCRIPTIONDETAILS._serialized_end=14338
+  _LIBRARYUPDATE._serialized_start=14341
+  _LIBRARYUPDATE._serialized_end=14495
+  _ANDROIDAPPNOTIFICATIONDATA._serialized_start=14497
+  _ANDROIDAPPNOTIFICATIONDATA._serialized_end=14563
+  _INAPPNOTIFICATIONDATA._serialized_start=14565
+  _INAPPNOTIFICATIONDATA._serialized_end=14642
+  _LIBRARYDIRTYDATA._serialized_start=14644
+  _LIBRARYDIRTYDATA._serialized_end=14679
+  _NOTIFICATION._serialized_start=14682
+  _NOTIFICATION._serialized_end=15343
+  _PURCHASEDECLINEDDATA._serialized_start=15345
+  _PURCHASEDECLINEDDATA._serialized_end=15409
+  _PURCHASEREMOVALDATA._serialized_start=15411
+  _PURCHASEREMOVALDATA._serialized_end=15451
+  _USERNOTIFICATIONDATA._serialized_start=15454
+  _USERNOTIFICATIONDATA._serialized_end=15590
+  _AGGREGATERATING._serialized_start=15593
+  _AGGREGATERATING._serialized_end=15888
+  _ACCEPTTOSRESPONSE._serialized_start=15890
+  _ACCEPTTOSRESPONSE._serialized_end=15909
+  _CARRIERBILLINGCONFIG._serialized_start=15912
+  _CARRIERBILLINGCONFIG._serialized_end=16145
+  _BILLINGCONFIG._serialized_start=16147
+  _BILLINGCONFIG._serialized_end=16255
+  _CORPUSMETADATA._serialized_start=16258
+  _CORPUSMETADATA._serialized_end=16387
+  _EXPERIMENTS._serialized_start=16389
+  _EXPERIMENTS._serialized_end=16424
+  _SELFUPDATECONFIG._serialized_start=16426
+  _SELFUPDATECONFIG._serialized_end=16477
+  _TOCRESPONSE._serialized_start=16480
+  _TOCRESPONSE._serialized_end=17097
+  _PAYLOAD._serialized_start=17100
+  _PAYLOAD._serialized_end=17526
+  _PREFETCH._serialized_start=17528
+  _PREFETCH._serialized_end=17645
+  _SERVERMETADATA._serialized_start=17647
+  _SERVERMETADATA._serialized_end=17686
+  _TARGETS._serialized_start=17688
+  _TARGETS._serialized_end=17734
+  _SERVERCOOKIE._serialized_start=17736
+  _SERVERCOOKIE._serialized_end=17779
+  _SERVERCOOKIES._serialized_start=17781
+  _SERVERCOOKIES._serialized_end=17847
+  _RESPONSEWRAPPER._serialized_start=17850
+  _RESPONSEWRAPPER._serialized_end=18226
+  _SERVERCOMMANDS._serialized_start=18228
+  _SERVERCOMMANDS._serialized_end=18321
+  _REVIEW._serialized_start=18324
+  _REVIEW._serialized_end=18661
+  _REVIEWAUTHOR._serialized_start=18663
+  _REVIEWAUTHOR._serialized_end=18729
+  _USERPROFILE._serialized_start=18732
+  _USERPROFILE._serialized_end=18924
+  _UPLOADDEVICECONFIGREQUEST._serialized_start=18927
+  _UPLOADDEVICECONFIGREQUEST._serialized_end=19073
+  _UPLOADDEVICECONFIGRESPONSE._serialized_start=19075
+  _UPLOADDEVICECONFIGRESPONSE._serialized_end=19136
+  _ANDROIDCHECKINREQUEST._serialized_start=19139
+  _ANDROIDCHECKINREQUEST._serialized_end=19654
+  _ANDROIDCHECKINRESPONSE._serialized_start=19657
+  _ANDROIDCHECKINRESPONSE._serialized_end=19977
+  _GSERVICESSETTING._serialized_start=19979
+  _GSERVICESSETTING._serialized_end=20026
+  _ANDROIDBUILDPROTO._serialized_start=20029
+  _ANDROIDBUILDPROTO._serialized_end=20305
+  _ANDROIDCHECKINPROTO._serialized_start=20308
+  _ANDROIDCHECKINPROTO._serialized_end=20608
+  _ANDROIDEVENTPROTO._serialized_start=20610
+  _ANDROIDEVENTPROTO._serialized_end=20675
+  _ANDROIDINTENTPROTO._serialized_start=20678
+  _ANDROIDINTENTPROTO._serialized_end=20862
+  _ANDROIDINTENTPROTO_EXTRA._serialized_start=20826
+  _ANDROIDINTENTPROTO_EXTRA._serialized_end=20862
+  _ANDROIDSTATISTICPROTO._serialized_start=20864
+  _ANDROIDSTATISTICPROTO._serialized_end=20928
+# @@protoc_insertion_point(module_scope)
@@ -1,17 +1,82 @@
-from requests.utils import requote_uri
-
-from gplayapi import GooglePlay_pb2
-from gplayapi.Error import LoginError, RequestError
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from time import monotonic
+
+from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
+from gplayapi.Backend import check_protobuf_backend
+from gplayapi.Cache import BaseResponseCache, cache_key
+from gplayapi.Concurrency import BatchSizeTuner, DetailsCoalescer, SingleFlight, iter_completed, request_key
+from gplayapi.Error import LoginError, RequestError, ThrottledError
 from gplayapi.GoogleAuth import GoogleAuthAPI, sc
-from gplayapi.Helper import has_tos_token, parse_protobuf_obj, has_tos_content, has_cookie, has_doc, has_prefetch
+from gplayapi.Parsing import EXTRACTORS, ParseExecutor, can_offload, list_ranks_path, make_parser
+from gplayapi.Helper import has_tos_token, parse_protobuf_obj, has_tos_content, has_cookie, has_doc, \
+    parse_retry_after, quote_uri
+from gplayapi.WireDecoder import iter_bulk_details_entries
+
+
+def _timeout_error():
+    # requests is loaded by then, a request has been sent
+    from requests.exceptions import Timeout
+    return Timeout
 
 
 class GplayAPI:
-    def __init__(self, google_auth_context: GoogleAuthAPI):
+    def __init__(self, google_auth_context: GoogleAuthAPI, coalesce_window=None, single_flight=True,
+                 response_cache: BaseResponseCache = None, lazy=False, parse_executor: ParseExecutor = None,
+                 strict_protobuf=None):
+        """
+        :param google_auth_context: logged in GoogleAuthAPI
+        :param coalesce_window: when set, details() calls without a version code made
+            within this many seconds of each other are merged into one bulk_details request
+        :param single_flight: identical requests issued while one is in flight share its response
+        :param response_cache: ResponseCache or SQLiteResponseCache answering GET requests,
+            including urls received as PreFetch entries, without a network round trip.
+            Stale entries are served while being revalidated with their etag.
+        :param lazy: return LazyMessageDict views converting fields on access
+            instead of fully converted dicts
+        :param parse_executor: ParseExecutor decoding and converting responses in worker
+            processes, so the calling threads only wait on the network. Can't be combined
+            with response_cache, which needs the responses decoded in this process
+        :param strict_protobuf: raise ProtobufBackendError instead of warning when protobuf
+            runs on its pure python backend, defaults to the GPLAYAPI_STRICT_PROTOBUF environment variable
+        """
+        self.protobuf_backend = check_protobuf_backend(strict_protobuf)
         self.google_auth_context = google_auth_context
+        self.lazy = lazy
+        if parse_executor is not None and response_cache is not None:
+            raise ValueError("parse_executor and response_cache can't be combined")
+        self.parse_executor = parse_executor
         self.auth_sub_token = self.google_auth_context.auth_sub_token
         self.proxies_config = self.google_auth_context.proxies_config
         self.dfeCookie = self.google_auth_context.dfeCookie
+        self.bulk_tuner = BatchSizeTuner()
+        self.single_flight = SingleFlight() if single_flight else None
+        self.response_cache = response_cache
+        self.__revalidation_lock = Lock()
+        self.__revalidating = set()
+        self.__revalidation_executor = None
+        self.details_coalescer = None
+        if coalesce_window is not None:
+            self.details_coalescer = DetailsCoalescer(self.__bulk_details_chunk__, coalesce_window)
+
+    def __parser__(self, fields=None, record=None, raw=False):
+        """Return the function converting a message to the value handed to the caller"""
+        return make_parser(fields, record, raw, self.lazy)
+
+    def __parse__(self, obj):
+        return self.__parser__()(obj)
+
+    def __request_result__(self, kind, parse, path, post_data=None, content_type=sc.CONTENT_TYPE_URLENC, params=None):
+        """Execute the request and extract its result with Parsing.EXTRACTORS[kind].
+
+        With a parse executor the raw response is decoded and converted in
+        a worker process instead, there is no response cache then."""
+        if self.parse_executor is not None and can_offload(parse):
+            content = self.__execute_request_raw__(path, post_data, content_type, params)
+            return self.parse_executor.parse(content, kind, parse)
+        message = self.__execute_request_api__(path, post_data, content_type, params)
+        return EXTRACTORS[kind](message, parse)
 
     def __get_headers__(self):
         return self.google_auth_context.get_headers()
@@ -22,8 +87,72 @@ class GplayAPI:
     def __execute_request_api__(self, path, post_data=None, content_type=sc.CONTENT_TYPE_URLENC, params=None):
         if self.auth_sub_token is None:
             raise LoginError("You need to login before executing any request")
+        if self.response_cache is None:
+            return self.__single_flight__(request_key(path, post_data, content_type, params),
+                                          self.__send_request__, path, post_data, content_type, params)
+        if post_data is not None:
+            # only GET requests are identified by their url
+            message = self.__single_flight__(request_key(path, post_data, content_type, params),
+                                             self.__send_request__, path, post_data, content_type, params)
+            self.response_cache.put_prefetch(message)
+            return message
+
+        key = cache_key(path, params)
+        entry = self.response_cache.get_entry(key, allow_expired=True)
+        if entry is not None and not entry.is_stale():
+            return entry.response
+        if entry is not None and not entry.is_expired():
+            # stale-while-revalidate, answer from cache and refresh in the background
+            self.__revalidate_in_background__(key, path, content_type, params)
+            return entry.response
+        return self.__single_flight__(request_key(path, None, content_type, params),
+                                      self.__revalidate__, key, path, content_type, params)
+
+    def __single_flight__(self, key, fn, *args):
+        if self.single_flight is None:
+            return fn(*args)
+        # the shared ResponseWrapper must be treated as read-only by the callers
+        return self.single_flight.do(key, fn, *args)
+
+    def __revalidate__(self, key, path, content_type, params):
+        """Fetch *path* into the response cache, conditionally when the cached entry has an etag."""
+        entry = self.response_cache.get_entry(key, allow_expired=True)
+        etag = entry.etag if entry is not None else None
+        response = self.__http_request__(path, None, content_type, params, etag=etag)
+        if response.status_code == 304 and entry is not None:
+            return self.response_cache.renew(key, entry).response
+
+        message = self.__parse_response__(response.content)
+        self.response_cache.put_prefetch(message)
+        self.response_cache.put(key, message, etag=response.headers.get("ETag"))
+        return message
+
+    def __revalidate_in_background__(self, key, path, content_type, params):
+        with self.__revalidation_lock:
+            if key in self.__revalidating:
+                return
+            self.__revalidating.add(key)
+            if self.__revalidation_executor is None:
+                self.__revalidation_executor = ThreadPoolExecutor(max_workers=sc.REVALIDATE_MAX_WORKERS)
+
+        def revalidate():
+            try:
+                self.__single_flight__(request_key(path, None, content_type, params),
+                                       self.__revalidate__, key, path, content_type, params)
+            except Exception:
+                # the stale entry stays in place until it expires
+                pass
+            finally:
+                with self.__revalidation_lock:
+                    self.__revalidating.discard(key)
+
+        self.__revalidation_executor.submit(revalidate)
+
+    def __http_request__(self, path, post_data, content_type, params, etag=None, stream=False):
         headers = self.__get_headers__()
         headers["Content-Type"] = content_type
+        if etag is not None:
+            headers["If-None-Match"] = etag
 
         if post_data is not None:
             response = self.__get_session__().post(path,
@@ -32,38 +161,66 @@ class GplayAPI:
                                                    params=params,
                                                    verify=sc.ssl_verify,
                                                    timeout=60,
-                                                   proxies=self.proxies_config)
+                                                   proxies=self.proxies_config,
+                                                   stream=stream)
         else:
             response = self.__get_session__().get(path,
                                                   headers=headers,
                                                   params=params,
                                                   verify=sc.ssl_verify,
                                                   timeout=60,
-                                                  proxies=self.proxies_config)
-
-        message = GooglePlay_pb2.ResponseWrapper.FromString(response.content)
+                                                  proxies=self.proxies_config,
+                                                  stream=stream)
+        if response.status_code == 429:
+            raise ThrottledError("Too many requests", parse_retry_after(response.headers.get("Retry-After")))
+        return response
+
+    def __parse_response__(self, content):
+        message = GooglePlay_pb2.ResponseWrapper.FromString(content)
         if message.commands.displayErrorMessage != "":
             raise RequestError(message.commands.displayErrorMessage)
-
         return message
 
-    def __toc__(self):
+    def __execute_request_raw__(self, path, post_data=None, content_type=sc.CONTENT_TYPE_URLENC, params=None):
+        """Return the undecoded ResponseWrapper bytes, the response cache is not used"""
+        if self.auth_sub_token is None:
+            raise LoginError("You need to login before executing any request")
+        return self.__single_flight__(("raw",) + request_key(path, post_data, content_type, params),
+                                      self.__send_request_raw__, path, post_data, content_type, params)
+
+    def __send_request_raw__(self, path, post_data, content_type, params):
+        return self.__http_request__(path, post_data, content_type, params).content
+
+    def __send_request__(self, path, post_data, content_type, params):
+        response = self.__http_request__(path, post_data, content_type, params)
+        return self.__parse_response__(response.content)
+
+    def __toc__(self, force=False):
         '''
-        Table Of Contents
+        Table Of Contents, cached on the auth context for sc.TOC_TTL seconds
+        :param force: fetch a new TOC even if the cached one is fresh
         :return:
         '''
-        response = self.__get_session__().get(sc.TOC_URL,
-                                              headers=self.__get_headers__(),
-                                              verify=sc.ssl_verify,
-                                              timeout=60,
-                                              proxies=self.proxies_config)
-        data = GooglePlay_pb2.ResponseWrapper.FromString(response.content)
-        toc_response = data.payload.tocResponse
-        if has_tos_content(toc_response) and has_tos_token(toc_response):
-            self.__accept_tos__(toc_response.tosToken)
-        if has_cookie(toc_response):
-            self.dfeCookie = toc_response.cookie
-        return parse_protobuf_obj(toc_response)
+        auth = self.google_auth_context
+        with auth.toc_lock:
+            if not force and auth.has_fresh_toc():
+                return auth.toc
+            response = self.__get_session__().get(sc.TOC_URL,
+                                                  headers=self.__get_headers__(),
+                                                  verify=sc.ssl_verify,
+                                                  timeout=60,
+                                                  proxies=self.proxies_config)
+            data = GooglePlay_pb2.ResponseWrapper.FromString(response.content)
+            toc_response = data.payload.tocResponse
+            # the ToS is accepted once per account, restored sessions remember it
+            if not auth.tos_accepted and has_tos_content(toc_response) and has_tos_token(toc_response):
+                self.__accept_tos__(toc_response.tosToken)
+                auth.tos_accepted = True
+            if has_cookie(toc_response):
+                # the cookie is sent by get_headers() of the auth context
+                self.dfeCookie = auth.dfeCookie = toc_response.cookie
+            auth.set_toc(parse_protobuf_obj(toc_response))
+            return auth.toc
 
     def __accept_tos__(self, tos_token):
         '''
@@ -84,45 +241,55 @@ class GplayAPI:
         data = GooglePlay_pb2.ResponseWrapper.FromString(response.content)
         return parse_protobuf_obj(data.payload.acceptTosResponse)
 
-    def search(self, query):
+    def search(self, query, fields=None, record=None, raw=False):
         """ Search the play store for an app.
 
         nb_result (int): is the maximum number of result to be returned
 
         offset (int): is used to take result starting from an index.
+
+        fields (list): only convert these dotted field paths, e.g. ["docid", "aggregateRating.starRating"]
+        record (type): AppSummary or AppDetails, returns these slotted records instead of dicts
+
+        raw (bool): return the GooglePlaySlim_pb2.DocV2 messages without any conversion
         """
         if self.auth_sub_token is None:
             raise LoginError("You need to login before executing any request")
 
-        path = sc.SEARCH_URL + "?c=3&q={}".format(requote_uri(query))
-        # FIXME: not sure if this toc call should be here
+        path = sc.SEARCH_URL + "?c=3&q={}".format(quote_uri(query))
+        toc_cached = self.google_auth_context.has_fresh_toc()
         self.__toc__()
-        data = self.__execute_request_api__(path)
-        if has_prefetch(data):
-            response = data.preFetch[0].response
-        else:
-            response = data
-        res_iterator = response.payload.listResponse.doc
-        return list(map(parse_protobuf_obj, res_iterator))
+        parse = self.__parser__(fields, record, raw)
+        try:
+            return self.__request_result__('list_docs', parse, path)
+        except ThrottledError:
+            # a 429 says nothing about the cookie, retrying would only hit the throttled account again
+            raise
+        except RequestError:
+            if not toc_cached:
+                raise
+            # the cached TOC cookie may have been rejected, refresh it and retry once
+            self.__toc__(force=True)
+            return self.__request_result__('list_docs', parse, path)
 
     def list_rank_old(self, ctr, cat=None, next_page_url=None):
 
         if next_page_url:
             path = sc.FDFE + next_page_url
-            path += "&stcid={}".format(requote_uri(ctr))
+            path += "&stcid={}".format(quote_uri(ctr))
         else:
             # path = sc.LIST_TEST_URL + "?c=3&n=7"
             path = sc.LEGACY_LIST_URL + "?c=3"
-            path += "&stcid={}".format(requote_uri(ctr))
+            path += "&stcid={}".format(quote_uri(ctr))
             if cat is not None:
-                path += "&scat={}".format(requote_uri(cat))
+                path += "&scat={}".format(quote_uri(cat))
 
         data = self.__execute_request_api__(path)
         apps = []
         for d in data.payload.listResponse.doc:  # categories
             for c in d.child:  # sub-category
                 for a in c.child:  # app
-                    apps.append(parse_protobuf_obj(a))
+                    apps.append(self.__parse__(a))
         try:
             # Sometimes we get transient very short response which indicates there's no more data
             next_page_url = data.payload.listResponse.doc[0].child[0].containerMetadata.nextPageUrl
@@ -131,102 +298,217 @@ class GplayAPI:
 
         return apps, next_page_url
 
-    def list_ranks(self, ctr, cat=None, next_page_url=None, fetch_new_apps=False):
+    def list_ranks(self, ctr, cat=None, next_page_url=None, fetch_new_apps=False, fields=None,
+                   record=None, raw=False):
         """
         List top ranks for the given category and rank list.
         Args:
           cat (str) - Category ID.
           ctr (str) - Rank list ID.
           next_page_url (str) - Next page url for subsequent self.session.
+          fields (list) - only convert these dotted field paths of each app.
+          record (type) - AppSummary or AppDetails, returns these slotted records instead of dicts.
+          raw (bool) - return the GooglePlaySlim_pb2.DocV2 messages without any conversion.
         Returns:
           (a list of apps, next page url)
         """
-        if next_page_url:
-            path = sc.FDFE + next_page_url
-            path += "&stcid={}".format(requote_uri(ctr))
-        else:
-            # path = sc.LIST_TEST_URL + "?c=3&n=7"
-            path = sc.LIST_TEST_URL + "?c=3"
-            path += "&stcid={}".format(requote_uri(ctr))
-            if cat is not None:
-                path += "&scat={}".format(requote_uri(cat))
-            if fetch_new_apps:
-                path += '&stcreltype=1'
-
-        data = self.__execute_request_api__(path)
-        apps = []
-        for d in data.payload.listResponse.doc:  # categories
-            for c in d.child:  # sub-category
-                for a in c.child:  # app
-                    apps.append(parse_protobuf_obj(a))
-        try:
-            # Sometimes we get transient very short response which indicates there's no more data
-            next_page_url = data.payload.listResponse.doc[0].child[0].containerMetadata.nextPageUrl
-        except Exception:
-            return apps, ""
+        path = list_ranks_path(ctr, cat, next_page_url, fetch_new_apps)
+        return self.__request_result__('list_ranks', self.__parser__(fields, record, raw), path)
 
-        return apps, next_page_url
-
-    def details(self, package_name, version_code=False):
+    def details(self, package_name, version_code=False, fields=None, record=None, raw=False):
         """Get app details from a package name.
 
         packageName (str) is the app unique ID (usually starting with 'com.').
-        versionCode (int) is the version code desired."""
+        versionCode (int) is the version code desired.
+        fields (list) only converts these dotted field paths of the doc.
+        record (type) AppSummary or AppDetails, returns this slotted record instead of a dict.
+        raw (bool) returns the GooglePlaySlim_pb2.DocV2 message without any conversion,
+            Helper.to_full_message converts it to a GooglePlay_pb2.DocV2.
+
+        With coalescing enabled, lookups without a version code and fields are
+        served by a shared bulk_details request and return the bulk variant of the doc."""
+        if not version_code and not fields and record is None and not raw \
+                and self.details_coalescer is not None:
+            return self.details_coalescer.get(package_name)
         if version_code:
-            path = sc.DETAILS_URL + "?doc={}&vc={}".format(requote_uri(package_name), requote_uri(str(version_code)))
+            path = sc.DETAILS_URL + "?doc={}&vc={}".format(quote_uri(package_name), quote_uri(str(version_code)))
         else:
-            path = sc.DETAILS_URL + "?doc={}".format(requote_uri(package_name))
-        data = self.__execute_request_api__(path)
-        return parse_protobuf_obj(data.payload.detailsResponse.docV2)
+            path = sc.DETAILS_URL + "?doc={}".format(quote_uri(package_name))
+        return self.__request_result__('details', self.__parser__(fields, record, raw), path)
 
-    def bulk_details(self, package_names):
-        """Get several apps details from a list of package names.
+    def details_many(self, package_names, max_workers=sc.DETAILS_MAX_WORKERS, version_codes=None):
+        """Call details() for several packages in parallel on a bounded thread pool.
 
-        This is much more efficient than calling N times details() since it
-        requires only one request. If an item is not found it returns an empty object
-        instead of throwing a RequestError('Item not found') like the details() function
+        Unlike bulk_details() this supports version specific lookups.
+        Results are yielded in completion order, a failing item does not
+        stop the remaining ones. Only a few requests per worker are sent
+        ahead of the consumer, closing the generator early stops the rest.
 
         Args:
-            package_names (list): a list of app IDs (usually starting with 'com.').
-
-        Returns:
-            a list of dictionaries containing docv2 data, or None
-            if the app doesn't exist"""
-
-        params = {'au': '1'}
+            package_names (list): a list of app IDs.
+            max_workers (int): maximum number of requests in flight.
+            version_codes (list): optional version codes, aligned with package_names.
+
+        Yields:
+            (package_name, version_code, details, error) tuples, where
+            details is None when error is set"""
+        if version_codes is None:
+            version_codes = [False] * len(package_names)
+        elif len(version_codes) != len(package_names):
+            raise ValueError("version_codes must have the same length as package_names")
+
+        for (package_name, version_code), future in iter_completed(lambda item: self.details(*item),
+                                                                   zip(package_names, version_codes), max_workers):
+            try:
+                yield package_name, version_code, future.result(), None
+            except Exception as e:
+                yield package_name, version_code, None, e
+
+    def __bulk_details_body__(self, package_names):
         req = GooglePlay_pb2.BulkDetailsRequest()
         req.docid.extend(package_names)
         data = req.SerializeToString()
+        return data.decode("utf-8")
+
+    def __bulk_details_request__(self, package_names):
+        params = {'au': '1'}
         message = self.__execute_request_api__(sc.BULK_URL,
-                                               post_data=data.decode("utf-8"),
+                                               post_data=self.__bulk_details_body__(package_names),
                                                content_type=sc.CONTENT_TYPE_PROTO,
                                                params=params)
-        response = message.payload.bulkDetailsResponse
+        return message.payload.bulkDetailsResponse
+
+    def __bulk_details_chunk__(self, package_names, parse=None):
+        return self.__request_result__('bulk_details',
+                                       parse or self.__parser__(),
+                                       sc.BULK_URL,
+                                       post_data=self.__bulk_details_body__(package_names),
+                                       content_type=sc.CONTENT_TYPE_PROTO,
+                                       params={'au': '1'})
+
+    def __bulk_details_measured_chunk__(self, package_names, parse):
+        start = monotonic()
+        try:
+            response = self.__bulk_details_request__(package_names)
+        except _timeout_error():
+            self.bulk_tuner.observe_timeout()
+            raise
+        self.bulk_tuner.observe(len(package_names), monotonic() - start, response.ByteSize())
         return [None if not has_doc(entry) else
-                parse_protobuf_obj(entry.doc)
+                parse(entry.doc)
                 for entry in response.entry]
 
-    def home(self, cat=None):
+    def __bulk_details_adaptive__(self, package_names, max_workers, parse):
+        result = [None] * len(package_names)
+        # (offset, package_names) still to be fetched
+        pending = [(0, package_names)] if package_names else []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending:
+                size = self.bulk_tuner.size
+                wave = []
+                while pending and len(wave) < max_workers:
+                    offset, names = pending.pop(0)
+                    if len(names) > size:
+                        pending.insert(0, (offset + size, names[size:]))
+                        names = names[:size]
+                    wave.append((offset, names, executor.submit(self.__bulk_details_measured_chunk__, names, parse)))
+                retry = []
+                for offset, names, future in wave:
+                    try:
+                        result[offset:offset + len(names)] = future.result()
+                    except _timeout_error():
+                        if len(names) == 1:
+                            raise
+                        half = len(names) // 2
+                        retry.extend([(offset, names[:half]), (offset + half, names[half:])])
+                pending = retry + pending
+                self.bulk_tuner.adjust()
+        return result
+
+    def bulk_details(self, package_names, chunk_size=sc.BULK_CHUNK_SIZE, max_workers=sc.BULK_MAX_WORKERS,
+                     adaptive=False, fields=None, record=None, raw=False):
+        """Get several apps details from a list of package names.
+
+        This is much more efficient than calling N times details() since it
+        requires only one request per chunk. If an item is not found it returns an empty object
+        instead of throwing a RequestError('Item not found') like the details() function
+
+        Args:
+            package_names (list): a list of app IDs (usually starting with 'com.').
+            chunk_size (int): maximum number of app IDs sent in a single BulkDetailsRequest.
+            max_workers (int): maximum number of chunks requested in parallel.
+            adaptive (bool): ignore chunk_size and let self.bulk_tuner pick the chunk
+                size from the observed latency and payload size. Timed out chunks
+                are split and retried.
+            fields (list): only convert these dotted field paths, e.g. ["docid", "aggregateRating.starRating"]
+            record (type): AppSummary or AppDetails, returns these slotted records instead of dicts
+            raw (bool): return the GooglePlaySlim_pb2.DocV2 messages without any conversion
+
+        Returns:
+            a list of dictionaries containing docv2 data, or None
+            if the app doesn't exist, in the same order as package_names"""
+
+        package_names = list(package_names)
+        parse = self.__parser__(fields, record, raw)
+        if adaptive:
+            return self.__bulk_details_adaptive__(package_names, max(1, max_workers), parse)
+
+        chunks = [package_names[i:i + chunk_size] for i in range(0, len(package_names), chunk_size)]
+        if len(chunks) <= 1 or max_workers <= 1:
+            result = []
+            for chunk in chunks:
+                result.extend(self.__bulk_details_chunk__(chunk, parse))
+            return result
+
+        result = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            # map() keeps the input order of the chunks
+            for docs in executor.map(partial(self.__bulk_details_chunk__, parse=parse), chunks):
+                result.extend(docs)
+        return result
+
+    def bulk_details_iter(self, package_names, chunk_size=None, fields=None, record=None, raw=False):
+        """Generator version of bulk_details() that decodes the response while it is received.
+
+        Each BulkDetailsEntry is parsed and yielded as soon as its bytes
+        have arrived, so memory stays flat for huge batches and the first
+        docs are available before the end of the response. Chunks, if
+        chunk_size is given, are requested one after another. The response
+        cache and in-flight deduplication are not used.
+
+        Yields:
+            the converted doc (see bulk_details()), or None if the app doesn't exist,
+            in the same order as package_names"""
+        if self.auth_sub_token is None:
+            raise LoginError("You need to login before executing any request")
+        parse = self.__parser__(fields, record, raw)
+        package_names = list(package_names)
+        chunk_size = chunk_size or max(1, len(package_names))
+        for i in range(0, len(package_names), chunk_size):
+            response = self.__http_request__(sc.BULK_URL,
+                                             self.__bulk_details_body__(package_names[i:i + chunk_size]),
+                                             sc.CONTENT_TYPE_PROTO,
+                                             {'au': '1'},
+                                             stream=True)
+            with response:
+                for content in iter_bulk_details_entries(response.iter_content(sc.STREAM_CHUNK_SIZE)):
+                    entry = GooglePlay_pb2.BulkDetailsEntry.FromString(content)
+                    yield None if not has_doc(entry) else parse(entry.doc)
+
+    def home(self, cat=None, fields=None, raw=False):
         path = sc.HOME_URL + "?c=3&nocache_isui=true"
         if cat is not None:
             path += "&cat={}".format(cat)
-        data = self.__execute_request_api__(path)
-        if has_prefetch(data):
-            response = data.preFetch[0].response
-        else:
-            response = data
-        res_iterator = response.payload.listResponse.doc
-        return list(map(parse_protobuf_obj, res_iterator))
+        return self.__request_result__('list_docs', self.__parser__(fields, raw=raw), path)
 
-    def browse(self, cat=None, sub_cat=None):
+    def browse(self, cat=None, sub_cat=None, raw=False):
         """Browse categories. If neither cat nor subcat are specified,
         return a list of categories, otherwise it return a list of apps
-        using cat (category ID) and subCat (subcategory ID) as filters."""
+        using cat (category ID) and subCat (subcategory ID) as filters.
+        raw returns the GooglePlaySlim_pb2.BrowseResponse message instead of a dict."""
         path = sc.BROWSE_URL + "?c=3"
         if cat is not None:
-            path += "&cat={}".format(requote_uri(cat))
+            path += "&cat={}".format(quote_uri(cat))
         if sub_cat is not None:
-            path += "&ctr={}".format(requote_uri(sub_cat))
-        data = self.__execute_request_api__(path)
-
-        return parse_protobuf_obj(data.payload.browseResponse)
+            path += "&ctr={}".format(quote_uri(sub_cat))
+        return self.__request_result__('browse', self.__parser__(raw=raw), path)
@@ -1,11 +1,256 @@
+import base64
+import math
 import struct
+from functools import lru_cache
+from urllib.parse import quote
+
+from google.protobuf.descriptor import FieldDescriptor
 from google.protobuf.json_format import MessageToDict
 
+_INT64_TYPES = frozenset([FieldDescriptor.TYPE_INT64, FieldDescriptor.TYPE_UINT64, FieldDescriptor.TYPE_SINT64,
+                          FieldDescriptor.TYPE_FIXED64, FieldDescriptor.TYPE_SFIXED64])
+
 
 def parse_protobuf_obj(obj):
     return MessageToDict(obj, False, False, False)
 
 
+def _shortest_float(value):
+    """Shortest decimal that maps back to the same float32, like MessageToDict"""
+    for precision in range(6, 10):
+        rounded = float('{0:.{1}g}'.format(value, precision))
+        if struct.unpack('<f', struct.pack('<f', rounded))[0] == value:
+            return rounded
+    return value
+
+
+def _scalar_to_json(field, value):
+    if field.type in _INT64_TYPES:
+        return str(value)
+    if field.type == FieldDescriptor.TYPE_BYTES:
+        return base64.b64encode(value).decode('utf-8')
+    if field.type == FieldDescriptor.TYPE_ENUM:
+        enum_value = field.enum_type.values_by_number.get(value, None)
+        return value if enum_value is None else enum_value.name
+    if field.type in (FieldDescriptor.TYPE_FLOAT, FieldDescriptor.TYPE_DOUBLE):
+        if math.isinf(value):
+            return 'Infinity' if value > 0 else '-Infinity'
+        if math.isnan(value):
+            return 'NaN'
+        if field.type == FieldDescriptor.TYPE_FLOAT:
+            return _shortest_float(value)
+    return value
+
+
+def _is_repeated(field):
+    # FieldDescriptor.label was removed in protobuf 7, is_repeated replaces it
+    try:
+        return field.is_repeated
+    except AttributeError:
+        return field.label == FieldDescriptor.LABEL_REPEATED
+
+
+def _field_to_json(field, value):
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        if _is_repeated(field):
+            return [LazyMessageDict(v) for v in value]
+        return LazyMessageDict(value)
+    if _is_repeated(field):
+        return [_scalar_to_json(field, v) for v in value]
+    return _scalar_to_json(field, value)
+
+
+_UNCONVERTED = object()
+
+
+class LazyMessageDict(dict):
+    """dict over a protobuf message with the keys and values of
+    parse_protobuf_obj(), converting each field only on first access.
+
+    The keys are listed up front, the values are converted when read, so
+    it can be used wherever the dict of parse_protobuf_obj() was:
+    json.dumps, isinstance(x, dict), copy(), dict(x) and equality all see
+    the converted values. Nested messages are LazyMessageDict too,
+    to_dict() returns the plain dict and .message the wrapped message."""
+
+    __slots__ = ('message', '_fields')
+
+    def __init__(self, message):
+        fields = {field.json_name: field for field, _ in message.ListFields()}
+        dict.__init__(self, dict.fromkeys(fields, _UNCONVERTED))
+        self.message = message
+        self._fields = fields
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if value is _UNCONVERTED:
+            value = self.__convert__(key)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __convert__(self, key):
+        field = self._fields[key]
+        return _field_to_json(field, getattr(self.message, field.name))
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            dict.__delitem__(self, key)
+            return value
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        return key, self.__convert__(key) if value is _UNCONVERTED else value
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def __iter__(self):
+        # not dict's own iterator, so that dict(x) and {**x} go through __getitem__
+        return iter(self.keys())
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def copy(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # the generated message classes can't be pickled, send the converted dict
+        return dict, (self.to_dict(),)
+
+    def __repr__(self):
+        return 'LazyMessageDict({!r})'.format(self.to_dict())
+
+    def to_dict(self):
+        """Plain dict of the current contents, including changes made by the caller"""
+        return {key: _to_plain(value) for key, value in self.items()}
+
+
+def _to_plain(value):
+    if isinstance(value, LazyMessageDict):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_plain(v) for v in value]
+    return value
+
+
+def parse_protobuf_lazy(obj):
+    return LazyMessageDict(obj)
+
+
+def parse_protobuf_raw(obj):
+    return obj
+
+
+def _find_field(descriptor, name):
+    field = descriptor.fields_by_camelcase_name.get(name) or descriptor.fields_by_name.get(name)
+    if field is None:
+        raise ValueError("Unknown field {} in {}".format(name, descriptor.name))
+    return field
+
+
+def as_field_paths(fields):
+    """Return the dotted field paths as a tuple, a single string is rejected"""
+    if isinstance(fields, str):
+        raise TypeError("fields must be a list of field paths, not the string {!r}".format(fields))
+    return tuple(fields)
+
+
+@lru_cache(maxsize=256)
+def compile_field_mask(descriptor, fields):
+    """Turn a tuple of dotted paths of *descriptor* into a tree keyed by field
+    descriptor, None marks a fully converted field.
+
+    Every path is checked against the descriptors, unknown fields raise
+    ValueError whether or not they are set in a given message."""
+    tree = {}
+    for path in fields:
+        parts = path.split('.')
+        path_fields = []
+        current = descriptor
+        for i, part in enumerate(parts):
+            field = _find_field(current, part)
+            path_fields.append(field)
+            if i < len(parts) - 1:
+                if field.type != FieldDescriptor.TYPE_MESSAGE:
+                    raise ValueError("{} of {} is not a message".format(part, current.name))
+                current = field.message_type
+
+        node = tree
+        for field in path_fields[:-1]:
+            if field in node and node[field] is None:
+                # a parent path already selects the whole sub message
+                break
+            node = node.setdefault(field, {})
+        else:
+            node[path_fields[-1]] = None
+    return tree
+
+
+def _project(message, tree):
+    result = {}
+    for field, subtree in tree.items():
+        value = getattr(message, field.name)
+        repeated = _is_repeated(field)
+        if repeated and len(value) == 0:
+            continue
+        if not repeated and not message.HasField(field.name):
+            continue
+
+        if subtree is None:
+            if field.type != FieldDescriptor.TYPE_MESSAGE:
+                result[field.json_name] = _field_to_json(field, value)
+            elif repeated:
+                result[field.json_name] = [parse_protobuf_obj(v) for v in value]
+            else:
+                result[field.json_name] = parse_protobuf_obj(value)
+        elif repeated:
+            result[field.json_name] = [_project(v, subtree) for v in value]
+        else:
+            result[field.json_name] = _project(value, subtree)
+    return result
+
+
+def project_fields(obj, fields):
+    """Convert only the dotted *fields* paths of a message, e.g.
+    ["docid", "aggregateRating.starRating"]. The result has the nesting and
+    value format of parse_protobuf_obj(), unset fields are left out."""
+    return _project(obj, compile_field_mask(obj.DESCRIPTOR, as_field_paths(fields)))
+
+
+# characters requests.utils.requote_uri leaves as they are, except '%'
+_URI_SAFE = "!#$&'()*+,/:;=?@[]~"
+
+
+def quote_uri(value):
+    """Percent-encode a value put in a url, like requests.utils.requote_uri without importing requests"""
+    return quote(value, safe=_URI_SAFE)
+
+
 def read_int(byte_array, start):
     """Read the byte array, starting from *start* position,
     as an 32-bit unsigned integer"""
@@ -83,3 +328,24 @@ def has_doc(obj):
             is_exist = False
 
     return is_exist
+
+
+def parse_retry_after(value):
+    """Seconds of a Retry-After header, None when missing or given as a date"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def to_full_message(message):
+    """Convert a GooglePlaySlim_pb2 message, as returned with raw=True, to its GooglePlay_pb2 type.
+
+    Both modules describe the same wire format, the slim one only leaves
+    out the messages the library doesn't read."""
+    from gplayapi import GooglePlay_pb2
+
+    cls = GooglePlay_pb2
+    for name in message.DESCRIPTOR.full_name.split('.')[2:]:  # drop the gplayapi.slim package
+        cls = getattr(cls, name)
+    return cls.FromString(message.SerializeToString())
@@ -0,0 +1,147 @@
+"""Extraction of the results of each GplayAPI call from a ResponseWrapper.
+
+The extractors are plain module functions so that they can also run in a
+ParseExecutor worker process, which receives the raw response bytes and
+sends the converted results back.
+"""
+import os
+from functools import partial
+
+from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
+from gplayapi.Constant import sc
+from gplayapi.Error import RequestError
+from gplayapi.Helper import has_doc, has_prefetch, parse_protobuf_obj, parse_protobuf_lazy, parse_protobuf_raw, \
+    project_fields, as_field_paths, compile_field_mask, quote_uri
+
+
+def make_parser(fields=None, record=None, raw=False, lazy=False):
+    """Return the function converting a doc to the value handed to the caller.
+
+    Invalid combinations and unknown fields raise here, before any request is sent."""
+    if raw:
+        if fields or record is not None:
+            raise ValueError("raw can't be combined with fields or record")
+        # messages may be shared with other callers and the cache, they must not be modified
+        return parse_protobuf_raw
+    if record is not None:
+        if fields:
+            raise ValueError("fields and record can't be combined")
+        return record.from_doc
+    if fields:
+        fields = as_field_paths(fields)
+        # fields always select in a doc
+        compile_field_mask(GooglePlay_pb2.DocV2.DESCRIPTOR, fields)
+        return partial(project_fields, fields=fields)
+    if lazy:
+        return parse_protobuf_lazy
+    return parse_protobuf_obj
+
+
+def list_ranks_path(ctr, cat=None, next_page_url=None, fetch_new_apps=False):
+    if next_page_url:
+        path = sc.FDFE + next_page_url
+        path += "&stcid={}".format(quote_uri(ctr))
+    else:
+        # path = sc.LIST_TEST_URL + "?c=3&n=7"
+        path = sc.LIST_TEST_URL + "?c=3"
+        path += "&stcid={}".format(quote_uri(ctr))
+        if cat is not None:
+            path += "&scat={}".format(quote_uri(cat))
+        if fetch_new_apps:
+            path += '&stcreltype=1'
+    return path
+
+
+def extract_details(message, parse):
+    return parse(message.payload.detailsResponse.docV2)
+
+
+def extract_bulk_details(message, parse):
+    return [None if not has_doc(entry) else
+            parse(entry.doc)
+            for entry in message.payload.bulkDetailsResponse.entry]
+
+
+def extract_list_ranks(message, parse):
+    apps = []
+    for d in message.payload.listResponse.doc:  # categories
+        for c in d.child:  # sub-category
+            for a in c.child:  # app
+                apps.append(parse(a))
+    try:
+        # Sometimes we get transient very short response which indicates there's no more data
+        next_page_url = message.payload.listResponse.doc[0].child[0].containerMetadata.nextPageUrl
+    except Exception:
+        return apps, ""
+
+    return apps, next_page_url
+
+
+def extract_list_docs(message, parse):
+    """search and home answer with the list in the first PreFetch entry, if any"""
+    if has_prefetch(message):
+        response = message.preFetch[0].response
+    else:
+        response = message
+    return list(map(parse, response.payload.listResponse.doc))
+
+
+def extract_browse(message, parse):
+    return parse(message.payload.browseResponse)
+
+
+EXTRACTORS = {
+    'details': extract_details,
+    'bulk_details': extract_bulk_details,
+    'list_ranks': extract_list_ranks,
+    'list_docs': extract_list_docs,
+    'browse': extract_browse,
+}
+
+
+def can_offload(parse):
+    """Lazy views and raw messages are tied to the message, they are never sent across processes"""
+    return parse is not parse_protobuf_lazy and parse is not parse_protobuf_raw
+
+
+def parse_response(content, kind, parse):
+    """Decode ResponseWrapper bytes and extract the result of *kind*.
+
+    Returns (True, result) or (False, error message) so that the error
+    crosses the process boundary without pickling RequestError."""
+    message = GooglePlay_pb2.ResponseWrapper.FromString(content)
+    if message.commands.displayErrorMessage != "":
+        return False, message.commands.displayErrorMessage
+    return True, EXTRACTORS[kind](message, parse)
+
+
+class ParseExecutor:
+    """Process pool decoding and converting responses off the network threads.
+
+    *parse* must be picklable: parse_protobuf_obj, a project_fields partial
+    or a record class' from_doc all are."""
+
+    def __init__(self, max_workers=None):
+        # multiprocessing is only imported by the processes using a ParseExecutor
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.__executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def submit(self, content, kind, parse):
+        return self.__executor.submit(parse_response, content, kind, parse)
+
+    def parse(self, content, kind, parse):
+        ok, result = self.submit(content, kind, parse).result()
+        if not ok:
+            raise RequestError(result)
+        return result
+
+    def shutdown(self, wait=True):
+        self.__executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
@@ -0,0 +1,102 @@
+class Record(object):
+    """Base class of the slotted records, gives them repr, equality and to_dict()"""
+    __slots__ = ()
+
+    @classmethod
+    def fields(cls):
+        names = []
+        for klass in reversed(cls.__mro__):
+            names.extend(klass.__dict__.get('__slots__', ()))
+        return tuple(names)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.fields()}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.fields())
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__,
+                               ", ".join("{}={!r}".format(name, getattr(self, name)) for name in self.fields()))
+
+
+class AppSummary(Record):
+    """Compact view of an app DocV2, as listed by charts, search and bulk_details"""
+    __slots__ = ('docid', 'title', 'creator', 'star_rating', 'ratings_count',
+                 'price_micros', 'currency_code', 'formatted_price', 'version_code', 'num_downloads')
+
+    def __init__(self, docid, title, creator, star_rating, ratings_count,
+                 price_micros, currency_code, formatted_price, version_code, num_downloads):
+        self.docid = docid
+        self.title = title
+        self.creator = creator
+        self.star_rating = star_rating
+        self.ratings_count = ratings_count
+        self.price_micros = price_micros
+        self.currency_code = currency_code
+        self.formatted_price = formatted_price
+        self.version_code = version_code
+        self.num_downloads = num_downloads
+
+    @staticmethod
+    def summary_values(doc):
+        app = doc.details.appDetails
+        if doc.HasField('aggregateRating'):
+            rating = (doc.aggregateRating.starRating, doc.aggregateRating.ratingsCount)
+        else:
+            # unrated, not rated 0
+            rating = (None, None)
+        if len(doc.offer) > 0:
+            offer = doc.offer[0]
+            price = (offer.micros, offer.currencyCode, offer.formattedAmount)
+        else:
+            price = (None, None, None)
+        return (doc.docid, doc.title, doc.creator) + rating + price + (app.versionCode, app.numDownloads)
+
+    @classmethod
+    def from_doc(cls, doc):
+        return cls(*cls.summary_values(doc))
+
+
+class AppDetails(AppSummary):
+    """AppSummary with the fields of the app details page"""
+    __slots__ = ('version_string', 'developer_name', 'developer_email', 'developer_website',
+                 'upload_date', 'installation_size', 'categories', 'permissions', 'contains_ads',
+                 'recent_changes_html', 'description_html')
+
+    def __init__(self, docid, title, creator, star_rating, ratings_count,
+                 price_micros, currency_code, formatted_price, version_code, num_downloads,
+                 version_string, developer_name, developer_email, developer_website,
+                 upload_date, installation_size, categories, permissions, contains_ads,
+                 recent_changes_html, description_html):
+        AppSummary.__init__(self, docid, title, creator, star_rating, ratings_count,
+                            price_micros, currency_code, formatted_price, version_code, num_downloads)
+        self.version_string = version_string
+        self.developer_name = developer_name
+        self.developer_email = developer_email
+        self.developer_website = developer_website
+        self.upload_date = upload_date
+        self.installation_size = installation_size
+        self.categories = categories
+        self.permissions = permissions
+        self.contains_ads = contains_ads
+        self.recent_changes_html = recent_changes_html
+        self.description_html = description_html
+
+    @classmethod
+    def from_doc(cls, doc):
+        app = doc.details.appDetails
+        return cls(*cls.summary_values(doc),
+                   app.versionString,
+                   app.developerName,
+                   app.developerEmail,
+                   app.developerWebsite,
+                   app.uploadDate,
+                   app.installationSize,
+                   tuple(app.appCategory),
+                   tuple(app.permission),
+                   app.containsAds,
+                   app.recentChangesHtml,
+                   doc.descriptionHtml)
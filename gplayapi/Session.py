@@ -0,0 +1,217 @@
+import json
+import os
+import tempfile
+from functools import partial
+from threading import Lock
+from time import time
+
+from gplayapi.Concurrency import iter_completed
+from gplayapi.GoogleAuth import GoogleAuthAPI, sc
+from gplayapi.Records import Record
+
+
+class SessionSnapshot(Record):
+    """State of a logged in GoogleAuthAPI, enough to use it again without any login round trip"""
+    __slots__ = ('gsf_id', 'auth_sub_token', 'device_config_token', 'device_checkin_consistency_token',
+                 'dfe_cookie', 'locale', 'timezone', 'device_profile', 'tos_accepted', 'created_at')
+
+    def __init__(self, gsf_id, auth_sub_token, device_config_token=None, device_checkin_consistency_token=None,
+                 dfe_cookie=None, locale="ko_KR", timezone="Asia/Seoul", device_profile="default",
+                 tos_accepted=False, created_at=None):
+        self.gsf_id = gsf_id
+        self.auth_sub_token = auth_sub_token
+        self.device_config_token = device_config_token
+        self.device_checkin_consistency_token = device_checkin_consistency_token
+        self.dfe_cookie = dfe_cookie
+        self.locale = locale
+        self.timezone = timezone
+        self.device_profile = device_profile
+        self.tos_accepted = tos_accepted
+        self.created_at = time() if created_at is None else created_at
+
+    @classmethod
+    def from_auth_context(cls, google_auth_context: GoogleAuthAPI):
+        if google_auth_context.gsfId is None or google_auth_context.auth_sub_token is None:
+            raise ValueError("the auth context is not logged in")
+        device_builder = google_auth_context.device_builder
+        return cls(google_auth_context.gsfId,
+                   google_auth_context.auth_sub_token,
+                   google_auth_context.device_config_token,
+                   google_auth_context.device_checkin_consistency_token,
+                   google_auth_context.dfeCookie,
+                   device_builder.locale,
+                   device_builder.timezone,
+                   google_auth_context.device_profile,
+                   google_auth_context.tos_accepted)
+
+    def restore(self, proxies_config=None):
+        """Return a GoogleAuthAPI in the state of the snapshot, without any request"""
+        auth = GoogleAuthAPI(locale=self.locale,
+                             time_zone=self.timezone,
+                             device_profile=self.device_profile,
+                             proxies_config=proxies_config)
+        auth.gsfId = self.gsf_id
+        auth.set_auth_sub_token(self.auth_sub_token)
+        auth.device_config_token = self.device_config_token
+        auth.device_checkin_consistency_token = self.device_checkin_consistency_token
+        auth.dfeCookie = self.dfe_cookie
+        auth.tos_accepted = self.tos_accepted
+        return auth
+
+    def to_json(self):
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_dict(cls, values):
+        return cls(**{name: values[name] for name in cls.fields() if name in values})
+
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_dict(json.loads(text))
+
+    def save(self, filename):
+        """Write the snapshot atomically, readable by the owner only as it holds the tokens"""
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.session-')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(self.to_json())
+            os.chmod(tmp, 0o600)
+            os.replace(tmp, filename)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename) as f:
+            return cls.from_json(f.read())
+
+
+class BaseSessionStore:
+    """Storage of SessionSnapshots by key, usually the account email.
+
+    Subclasses implement get, put and delete."""
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def put(self, key, snapshot: SessionSnapshot):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+    def save(self, key, google_auth_context: GoogleAuthAPI):
+        snapshot = SessionSnapshot.from_auth_context(google_auth_context)
+        self.put(key, snapshot)
+        return snapshot
+
+    def restore(self, key, proxies_config=None):
+        """Return the GoogleAuthAPI stored under key, or None"""
+        snapshot = self.get(key)
+        if snapshot is None:
+            return None
+        return snapshot.restore(proxies_config)
+
+    def login(self, key, email, password, locale="ko_KR", time_zone="Asia/Seoul", device_profile="default",
+              proxies_config=None):
+        """Restore the session stored under key, or log in and store it"""
+        auth = self.restore(key, proxies_config)
+        if auth is not None:
+            return auth
+        auth = GoogleAuthAPI(locale=locale, time_zone=time_zone, device_profile=device_profile,
+                             proxies_config=proxies_config)
+        auth.login(email=email, password=password)
+        self.save(key, auth)
+        return auth
+
+
+class MemorySessionStore(BaseSessionStore):
+    def __init__(self):
+        self.__snapshots = {}
+        self.__lock = Lock()
+
+    def get(self, key):
+        with self.__lock:
+            return self.__snapshots.get(key)
+
+    def put(self, key, snapshot: SessionSnapshot):
+        with self.__lock:
+            self.__snapshots[key] = snapshot
+
+    def delete(self, key):
+        with self.__lock:
+            self.__snapshots.pop(key, None)
+
+
+class FileSessionStore(BaseSessionStore):
+    """One JSON file per key in a directory"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def __path__(self, key):
+        # keys are emails or ids, keep them usable as file names
+        name = "".join(c if c.isalnum() or c in '@._-' else '_' for c in str(key))
+        return os.path.join(self.directory, name + '.json')
+
+    def get(self, key):
+        try:
+            return SessionSnapshot.load(self.__path__(key))
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, snapshot: SessionSnapshot):
+        snapshot.save(self.__path__(key))
+
+    def delete(self, key):
+        try:
+            os.unlink(self.__path__(key))
+        except FileNotFoundError:
+            pass
+
+
+_AUTH_CONTEXT_ARGS = ('locale', 'time_zone', 'device_profile', 'proxies_config')
+
+
+def login_snapshot(credential, store: BaseSessionStore = None):
+    """Log in one account and return its SessionSnapshot, see bootstrap_sessions"""
+    email = credential['email']
+    if store is not None:
+        snapshot = store.get(email)
+        if snapshot is not None:
+            return snapshot
+    auth = GoogleAuthAPI(**{name: credential[name] for name in _AUTH_CONTEXT_ARGS if name in credential})
+    auth.login(email=email, password=credential['password'])
+    snapshot = SessionSnapshot.from_auth_context(auth)
+    if store is not None:
+        store.put(email, snapshot)
+    return snapshot
+
+
+def bootstrap_sessions(credentials, store: BaseSessionStore = None, max_workers=sc.BOOTSTRAP_MAX_WORKERS):
+    """Log in many accounts in parallel on a bounded thread pool.
+
+    Each login still runs its auth, checkin, token and device config
+    requests in sequence, the accounts run side by side. With a store,
+    accounts already stored are not logged in again and new sessions are
+    saved as soon as they are ready. A failing account does not stop the
+    remaining ones, closing the generator early stops the accounts not
+    started yet.
+
+    Args:
+        credentials (iterable): dicts with email and password, and optionally
+            locale, time_zone, device_profile and proxies_config.
+        store (BaseSessionStore): sessions are read from and saved to it, keyed by email.
+        max_workers (int): maximum number of accounts logging in at once.
+
+    Yields:
+        (email, snapshot, error) tuples in completion order, where
+        snapshot is None when error is set"""
+    for credential, future in iter_completed(partial(login_snapshot, store=store), credentials, max_workers):
+        try:
+            yield credential['email'], future.result(), None
+        except Exception as e:
+            yield credential['email'], None, e
@@ -0,0 +1,355 @@
+"""Minimal protobuf wire format decoder for the hot fields of app documents.
+
+It walks ResponseWrapper -> Payload -> ListResponse / BulkDetailsResponse /
+DetailsResponse -> DocV2 and only decodes the fields of AppSummary, every
+other field is skipped by its length without being materialized. The
+results are equal to AppSummary.from_doc() on the fully parsed message.
+
+It only pays off on the pure python protobuf backend: on upb or cpp,
+FromString followed by AppSummary.from_doc is several times faster, which
+is why the clients use record=AppSummary and this module is left to
+Benchmark.benchmark_wire_decoder and to iter_bulk_details_entries, which
+splits streamed bulkDetails responses into their entries.
+"""
+import struct
+
+from gplayapi.Error import RequestError
+from gplayapi.Records import AppSummary
+
+WIRE_VARINT = 0
+WIRE_FIXED64 = 1
+WIRE_LENGTH = 2
+WIRE_FIXED32 = 5
+
+# field numbers from resources/GooglePlay.proto
+RESPONSE_WRAPPER_PAYLOAD = 1
+RESPONSE_WRAPPER_COMMANDS = 2
+SERVER_COMMANDS_DISPLAY_ERROR_MESSAGE = 2
+PAYLOAD_LIST_RESPONSE = 1
+PAYLOAD_BULK_DETAILS_RESPONSE = 19
+LIST_RESPONSE_DOC = 2
+BULK_DETAILS_RESPONSE_ENTRY = 1
+BULK_DETAILS_ENTRY_DOC = 1
+DOC_DOCID = 1
+DOC_TITLE = 5
+DOC_CREATOR = 6
+DOC_OFFER = 8
+DOC_CHILD = 11
+DOC_CONTAINER_METADATA = 12
+DOC_DETAILS = 13
+DOC_AGGREGATE_RATING = 14
+CONTAINER_METADATA_NEXT_PAGE_URL = 2
+OFFER_MICROS = 1
+OFFER_CURRENCY_CODE = 2
+OFFER_FORMATTED_AMOUNT = 3
+DOCUMENT_DETAILS_APP_DETAILS = 1
+APP_DETAILS_VERSION_CODE = 3
+APP_DETAILS_NUM_DOWNLOADS = 13
+AGGREGATE_RATING_STAR_RATING = 2
+AGGREGATE_RATING_RATINGS_COUNT = 3
+
+_float32 = struct.Struct('<f').unpack_from
+
+
+def read_varint(buf, pos):
+    """Return (value, new position) of the varint starting at pos"""
+    b = buf[pos]
+    if b < 0x80:
+        return b, pos + 1
+    result = b & 0x7f
+    shift = 7
+    pos += 1
+    while True:
+        b = buf[pos]
+        result |= (b & 0x7f) << shift
+        pos += 1
+        if b < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _signed(value):
+    """int32 and int64 are both encoded as 64 bit two's complement"""
+    if value >= 1 << 63:
+        value -= 1 << 64
+    return value
+
+
+def iter_fields(buf, pos, end):
+    """Yield (field number, wire type, value, position) of the fields in buf[pos:end].
+
+    value is the integer for varints, and the start offset for length
+    delimited and fixed size fields, whose end is the yielded position."""
+    while pos < end:
+        key, pos = read_varint(buf, pos)
+        number = key >> 3
+        wire_type = key & 0x7
+        if wire_type == WIRE_VARINT:
+            value, pos = read_varint(buf, pos)
+        elif wire_type == WIRE_LENGTH:
+            length, value = read_varint(buf, pos)
+            pos = value + length
+        elif wire_type == WIRE_FIXED32:
+            value = pos
+            pos += 4
+        elif wire_type == WIRE_FIXED64:
+            value = pos
+            pos += 8
+        else:
+            raise ValueError("Unsupported wire type {} for field {}".format(wire_type, number))
+        yield number, wire_type, value, pos
+
+
+def find_field(buf, pos, end, number):
+    """Return (start, end) of the last length delimited field *number*, or None"""
+    found = None
+    for field, wire_type, value, next_pos in iter_fields(buf, pos, end):
+        if field == number and wire_type == WIRE_LENGTH:
+            found = (value, next_pos)
+    return found
+
+
+def iter_repeated(buf, pos, end, number):
+    """Yield (start, end) of every length delimited field *number*"""
+    for field, wire_type, value, next_pos in iter_fields(buf, pos, end):
+        if field == number and wire_type == WIRE_LENGTH:
+            yield value, next_pos
+
+
+def _string(buf, start, end):
+    return bytes(buf[start:end]).decode('utf-8')
+
+
+def _decode_offer(buf, pos, end):
+    micros = 0
+    currency_code = ""
+    formatted_amount = ""
+    for number, wire_type, value, next_pos in iter_fields(buf, pos, end):
+        if number == OFFER_MICROS and wire_type == WIRE_VARINT:
+            micros = _signed(value)
+        elif number == OFFER_CURRENCY_CODE and wire_type == WIRE_LENGTH:
+            currency_code = _string(buf, value, next_pos)
+        elif number == OFFER_FORMATTED_AMOUNT and wire_type == WIRE_LENGTH:
+            formatted_amount = _string(buf, value, next_pos)
+    return micros, currency_code, formatted_amount
+
+
+def _decode_rating(buf, pos, end):
+    star_rating = 0.0
+    ratings_count = 0
+    for number, wire_type, value, next_pos in iter_fields(buf, pos, end):
+        if number == AGGREGATE_RATING_STAR_RATING and wire_type == WIRE_FIXED32:
+            star_rating = _float32(buf, value)[0]
+        elif number == AGGREGATE_RATING_RATINGS_COUNT and wire_type == WIRE_VARINT:
+            ratings_count = value
+    return star_rating, ratings_count
+
+
+def _decode_app_details(buf, pos, end):
+    version_code = 0
+    num_downloads = ""
+    app = find_field(buf, pos, end, DOCUMENT_DETAILS_APP_DETAILS)
+    if app is None:
+        return version_code, num_downloads
+    for number, wire_type, value, next_pos in iter_fields(buf, app[0], app[1]):
+        if number == APP_DETAILS_VERSION_CODE and wire_type == WIRE_VARINT:
+            version_code = _signed(value)
+        elif number == APP_DETAILS_NUM_DOWNLOADS and wire_type == WIRE_LENGTH:
+            num_downloads = _string(buf, value, next_pos)
+    return version_code, num_downloads
+
+
+def decode_doc(buf, pos, end):
+    """Decode the DocV2 in buf[pos:end] into an AppSummary"""
+    docid = title = creator = ""
+    offer = None
+    # unrated apps have no aggregateRating, like AppSummary.summary_values
+    star_rating = ratings_count = None
+    version_code, num_downloads = 0, ""
+    for number, wire_type, value, next_pos in iter_fields(buf, pos, end):
+        if wire_type != WIRE_LENGTH:
+            continue
+        if number == DOC_DOCID:
+            docid = _string(buf, value, next_pos)
+        elif number == DOC_TITLE:
+            title = _string(buf, value, next_pos)
+        elif number == DOC_CREATOR:
+            creator = _string(buf, value, next_pos)
+        elif number == DOC_OFFER:
+            if offer is None:
+                offer = _decode_offer(buf, value, next_pos)
+        elif number == DOC_AGGREGATE_RATING:
+            star_rating, ratings_count = _decode_rating(buf, value, next_pos)
+        elif number == DOC_DETAILS:
+            version_code, num_downloads = _decode_app_details(buf, value, next_pos)
+    if offer is None:
+        offer = (None, None, None)
+    return AppSummary(docid, title, creator, star_rating, ratings_count,
+                      offer[0], offer[1], offer[2], version_code, num_downloads)
+
+
+def _payload(content):
+    """Return (buf, start, end) of the Payload, raise RequestError like GplayAPI does"""
+    buf = memoryview(content)
+    payload = None
+    for number, wire_type, value, next_pos in iter_fields(buf, 0, len(buf)):
+        if wire_type != WIRE_LENGTH:
+            continue
+        if number == RESPONSE_WRAPPER_PAYLOAD:
+            payload = (value, next_pos)
+        elif number == RESPONSE_WRAPPER_COMMANDS:
+            message = find_field(buf, value, next_pos, SERVER_COMMANDS_DISPLAY_ERROR_MESSAGE)
+            if message is not None and message[1] > message[0]:
+                raise RequestError(_string(buf, *message))
+    if payload is None:
+        return buf, 0, 0
+    return buf, payload[0], payload[1]
+
+
+def decode_bulk_details(content):
+    """ResponseWrapper bytes of a bulkDetails call to a list of AppSummary, or None for missing docs"""
+    buf, pos, end = _payload(content)
+    response = find_field(buf, pos, end, PAYLOAD_BULK_DETAILS_RESPONSE)
+    if response is None:
+        return []
+    result = []
+    for entry_start, entry_end in iter_repeated(buf, response[0], response[1], BULK_DETAILS_RESPONSE_ENTRY):
+        doc = find_field(buf, entry_start, entry_end, BULK_DETAILS_ENTRY_DOC)
+        result.append(None if doc is None else decode_doc(buf, *doc))
+    return result
+
+
+def decode_list_ranks(content):
+    """ResponseWrapper bytes of a top chart call to (list of AppSummary, next page url)"""
+    buf, pos, end = _payload(content)
+    response = find_field(buf, pos, end, PAYLOAD_LIST_RESPONSE)
+    if response is None:
+        return [], ""
+    apps = []
+    next_page_url = None
+    for doc_start, doc_end in iter_repeated(buf, response[0], response[1], LIST_RESPONSE_DOC):  # categories
+        for child_start, child_end in iter_repeated(buf, doc_start, doc_end, DOC_CHILD):  # sub-category
+            if next_page_url is None:
+                # like GplayAPI.list_ranks, only doc[0].child[0] carries the next page url
+                metadata = find_field(buf, child_start, child_end, DOC_CONTAINER_METADATA)
+                url = None if metadata is None else \
+                    find_field(buf, metadata[0], metadata[1], CONTAINER_METADATA_NEXT_PAGE_URL)
+                next_page_url = "" if url is None else _string(buf, *url)
+            for app_start, app_end in iter_repeated(buf, child_start, child_end, DOC_CHILD):  # app
+                apps.append(decode_doc(buf, app_start, app_end))
+        if next_page_url is None:
+            next_page_url = ""
+    return apps, next_page_url or ""
+
+
+class StreamReader:
+    """Reads protobuf wire format from an iterator of byte chunks, such as
+    requests' Response.iter_content(), keeping only the unread part buffered"""
+
+    def __init__(self, chunks):
+        self.__chunks = iter(chunks)
+        self.__buffer = bytearray()
+        self.__offset = 0
+        self.position = 0
+
+    def __fill__(self, n):
+        while len(self.__buffer) - self.__offset < n:
+            chunk = next(self.__chunks, None)
+            if chunk is None:
+                raise EOFError("Truncated protobuf stream")
+            if self.__offset:
+                del self.__buffer[:self.__offset]
+                self.__offset = 0
+            self.__buffer += chunk
+
+    def at_eof(self):
+        try:
+            self.__fill__(1)
+        except EOFError:
+            return True
+        return False
+
+    def read(self, n):
+        self.__fill__(n)
+        data = bytes(self.__buffer[self.__offset:self.__offset + n])
+        self.__offset += n
+        self.position += n
+        return data
+
+    def read_varint(self):
+        result = 0
+        shift = 0
+        while True:
+            self.__fill__(1)
+            b = self.__buffer[self.__offset]
+            self.__offset += 1
+            self.position += 1
+            result |= (b & 0x7f) << shift
+            if b < 0x80:
+                return result
+            shift += 7
+
+    def read_key(self):
+        key = self.read_varint()
+        return key >> 3, key & 0x7
+
+    def skip(self, n):
+        self.position += n
+        available = len(self.__buffer) - self.__offset
+        if available >= n:
+            self.__offset += n
+            return
+        # drop the buffer and discard whole chunks without keeping them
+        n -= available
+        self.__buffer = bytearray()
+        self.__offset = 0
+        while n > 0:
+            chunk = next(self.__chunks, None)
+            if chunk is None:
+                raise EOFError("Truncated protobuf stream")
+            if len(chunk) <= n:
+                n -= len(chunk)
+            else:
+                self.__buffer += chunk[n:]
+                n = 0
+
+    def skip_value(self, wire_type):
+        if wire_type == WIRE_VARINT:
+            self.read_varint()
+        elif wire_type == WIRE_LENGTH:
+            self.skip(self.read_varint())
+        elif wire_type == WIRE_FIXED32:
+            self.skip(4)
+        elif wire_type == WIRE_FIXED64:
+            self.skip(8)
+        else:
+            raise ValueError("Unsupported wire type {}".format(wire_type))
+
+
+def iter_bulk_details_entries(chunks):
+    """Yield the serialized BulkDetailsEntry messages of a bulkDetails ResponseWrapper
+    as soon as each one has been received, from an iterator of byte chunks"""
+    reader = StreamReader(chunks)
+    while not reader.at_eof():
+        number, wire_type = reader.read_key()
+        if number == RESPONSE_WRAPPER_PAYLOAD and wire_type == WIRE_LENGTH:
+            payload_end = reader.read_varint() + reader.position
+            while reader.position < payload_end:
+                number, wire_type = reader.read_key()
+                if number != PAYLOAD_BULK_DETAILS_RESPONSE or wire_type != WIRE_LENGTH:
+                    reader.skip_value(wire_type)
+                    continue
+                response_end = reader.read_varint() + reader.position
+                while reader.position < response_end:
+                    number, wire_type = reader.read_key()
+                    if number == BULK_DETAILS_RESPONSE_ENTRY and wire_type == WIRE_LENGTH:
+                        yield reader.read(reader.read_varint())
+                    else:
+                        reader.skip_value(wire_type)
+        elif number == RESPONSE_WRAPPER_COMMANDS and wire_type == WIRE_LENGTH:
+            commands = reader.read(reader.read_varint())
+            message = find_field(commands, 0, len(commands), SERVER_COMMANDS_DISPLAY_ERROR_MESSAGE)
+            if message is not None and message[1] > message[0]:
+                raise RequestError(_string(commands, *message))
+        else:
+            reader.skip_value(wire_type)
@@ -0,0 +1,100 @@
+import pytest
+
+pytest.importorskip("google.protobuf")
+
+from gplayapi.AccountPool import LEAST_LOADED, AccountPool, is_account_error
+from gplayapi.Error import LoginError, RequestError, ThrottledError
+
+
+class FakeApi:
+    def __init__(self, name):
+        self.name = name
+        self.throttled = False
+
+    def details(self, package_name):
+        if self.throttled:
+            raise ThrottledError("Too many requests", 30)
+        return self.name, package_name
+
+
+def pool(names=("a", "b", "c"), **kwargs):
+    account_pool = AccountPool(api_factory=lambda name: FakeApi(name), **kwargs)
+    for name in names:
+        account_pool.add(name, name)
+    return account_pool
+
+
+def test_round_robin():
+    account_pool = pool()
+    names = []
+    for _ in range(4):
+        account = account_pool.acquire()
+        names.append(account.name)
+        account_pool.release(account)
+    assert names == ["a", "b", "c", "a"]
+
+
+def test_least_loaded_picks_the_fewest_in_flight():
+    account_pool = pool(names=("a", "b"), strategy=LEAST_LOADED)
+    first = account_pool.acquire()
+    second = account_pool.acquire()
+    assert first.name != second.name
+    account_pool.release(first)
+    assert account_pool.acquire().name == first.name
+
+
+def test_throttled_account_cools_down_for_retry_after():
+    account_pool = pool(names=("a", "b"))
+    a = account_pool.acquire()
+    account_pool.release(a, ThrottledError("Too many requests", 30))
+    assert 29 < account_pool.stats()[0]['cooldown'] <= 30
+    for _ in range(2):
+        account = account_pool.acquire()
+        assert account.name == "b"
+        account_pool.release(account)
+    # without Retry-After the pool's own cooldown applies
+    account_pool.release(account_pool.acquire(), ThrottledError("Too many requests"))
+    assert account_pool.stats()[1]['cooldown'] > 30
+    with pytest.raises(ThrottledError) as error:
+        account_pool.acquire()
+    assert 0 < error.value.retry_after <= 30
+
+
+def test_error_rate_above_threshold_cools_down():
+    account_pool = pool(names=("a",), max_error_rate=0.5, min_requests=4)
+    for error in (None, LoginError("bad token"), None):
+        account_pool.release(account_pool.acquire(), error)
+    assert account_pool.stats()[0]['cooldown'] == 0
+    account_pool.release(account_pool.acquire(), OSError("connection reset"))
+    assert account_pool.stats()[0]['cooldown'] == 0
+    account_pool.release(account_pool.acquire(), OSError("connection reset"))
+    assert account_pool.stats()[0]['cooldown'] > 0
+
+
+def test_item_errors_dont_count():
+    account_pool = pool(names=("a",), max_error_rate=0.1, min_requests=1)
+    for _ in range(5):
+        account_pool.release(account_pool.acquire(), RequestError("Item not found."))
+    stats = account_pool.stats()[0]
+    assert stats['total_errors'] == 0 and stats['cooldown'] == 0
+
+
+@pytest.mark.parametrize("error, expected", [
+    (ThrottledError("Too many requests"), True),
+    (LoginError("bad token"), True),
+    (OSError("connection reset"), True),
+    (RequestError("Item not found."), False),
+    (ValueError("bad argument"), False),
+    (KeyError("email"), False),
+])
+def test_is_account_error(error, expected):
+    assert is_account_error(error) is expected
+
+
+def test_call_moves_to_the_next_account_when_throttled():
+    account_pool = pool(names=("a", "b"))
+    with account_pool.lease() as api:
+        api.throttled = True
+    assert account_pool.call('details', "com.example") == ("b", "com.example")
+    assert account_pool.call('details', "com.example") == ("b", "com.example")
+    assert account_pool.stats()[0]['cooldown'] > 0
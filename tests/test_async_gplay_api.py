@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("google.protobuf")
+pytest.importorskip("aiohttp")
+
+from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
+from gplayapi.AsyncGplayAPI import AsyncGplayAPI, AsyncSingleFlight
+from gplayapi.Constant import sc
+from gplayapi.GoogleAuth import GoogleAuthAPI
+
+
+class FakeAuth(GoogleAuthAPI):
+    def __init__(self):
+        self.auth_sub_token = "token"
+        self.proxies_config = None
+        self.dfeCookie = None
+        self.tos_accepted = False
+        self.invalidate_toc()
+
+    def get_headers(self, upload_fields=False):
+        return {}
+
+
+class FakeTransport:
+    def __init__(self):
+        self.urls = []
+
+    async def request(self, method, url, headers=None, params=None, data=None, proxy=None):
+        self.urls.append(url)
+        await asyncio.sleep(0.01)
+        message = GooglePlay_pb2.ResponseWrapper()
+        if url == sc.TOC_URL:
+            toc = message.payload.tocResponse
+            toc.tosContent = "terms"
+            toc.tosToken = "tos-token"
+            toc.cookie = "cookie"
+        return message.SerializeToString()
+
+
+def test_single_flight_shares_one_call():
+    calls = []
+
+    async def fetch(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value
+
+    async def main():
+        flight = AsyncSingleFlight()
+        return await asyncio.gather(flight.do("key", fetch, 1), flight.do("key", fetch, 2))
+
+    assert asyncio.run(main()) == [1, 1]
+    assert calls == [1]
+
+
+def test_single_flight_survives_cancelled_leader():
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "doc"
+
+    async def main():
+        flight = AsyncSingleFlight()
+        leader = asyncio.ensure_future(flight.do("key", fetch))
+        follower = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "doc"
+
+
+def test_single_flight_forgets_failed_calls():
+    attempts = []
+
+    async def fetch():
+        attempts.append(None)
+        if len(attempts) == 1:
+            raise ValueError("first")
+        return "doc"
+
+    async def main():
+        flight = AsyncSingleFlight()
+        with pytest.raises(ValueError):
+            await flight.do("key", fetch)
+        return await flight.do("key", fetch)
+
+    assert asyncio.run(main()) == "doc"
+
+
+def test_concurrent_toc_is_fetched_once():
+    transport = FakeTransport()
+    auth = FakeAuth()
+
+    async def main():
+        api = AsyncGplayAPI(auth, transport=transport)
+        await asyncio.gather(*[api.__toc__() for _ in range(5)])
+        # a forced refresh racing with another one reuses its result
+        await asyncio.gather(api.__toc__(force=True), api.__toc__(force=True))
+
+    asyncio.run(main())
+    assert transport.urls == [sc.TOC_URL, sc.ACCEPT_TOS_URL, sc.TOC_URL]
+    assert auth.tos_accepted and auth.dfeCookie == "cookie"
+
+
+def test_invalid_fields_raise_before_any_request():
+    transport = FakeTransport()
+
+    async def main():
+        api = AsyncGplayAPI(FakeAuth(), transport=transport)
+        with pytest.raises(ValueError):
+            await api.search("q", fields=["bogus"])
+        with pytest.raises(ValueError):
+            await api.bulk_details(["com.example"], fields=["docid"], raw=True)
+
+    asyncio.run(main())
+    assert transport.urls == []
@@ -0,0 +1,124 @@
+import time
+
+import pytest
+
+pytest.importorskip("google.protobuf")
+
+from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
+from gplayapi.Cache import CacheEntry, ResponseCache, SQLiteResponseCache, cache_key
+from gplayapi.Constant import sc
+from gplayapi.GoogleAuth import GoogleAuthAPI
+from gplayapi.GplayAPI import GplayAPI
+
+
+def details_response(docid):
+    message = GooglePlay_pb2.ResponseWrapper()
+    message.payload.detailsResponse.docV2.docid = docid
+    return message
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, message=None, headers=None):
+        self.status_code = status_code
+        self.content = b"" if message is None else message.SerializeToString()
+        self.headers = headers or {}
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, path, headers=None, params=None, **kwargs):
+        self.requests.append((path, headers))
+        return self.responses.pop(0)
+
+
+class FakeAuth(GoogleAuthAPI):
+    session = None
+
+    def __init__(self, session):
+        self.auth_sub_token = "token"
+        self.proxies_config = None
+        self.dfeCookie = None
+        self.session = session
+
+    def get_headers(self, upload_fields=False):
+        return {}
+
+
+def client(session, cache):
+    return GplayAPI(FakeAuth(session), response_cache=cache)
+
+
+def details_key(docid):
+    return cache_key(sc.DETAILS_URL + "?doc=" + docid)
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_prefetch_entries_are_served_without_request():
+    listing = GooglePlay_pb2.ResponseWrapper()
+    pre_fetch = listing.preFetch.add(url="details?doc=com.b", ttl=60000)
+    pre_fetch.response.CopyFrom(details_response("com.b"))
+    session = FakeSession(FakeResponse(message=listing))
+    api = client(session, ResponseCache())
+
+    api.browse()
+    assert api.details("com.b")['docid'] == "com.b"
+    assert len(session.requests) == 1
+
+
+def test_stale_entry_is_served_while_revalidated():
+    cache = ResponseCache()
+    cache.put(details_key("com.a"), details_response("com.a"), ttl=60, soft_ttl=0, etag="v1")
+    session = FakeSession(FakeResponse(message=details_response("com.a.new"), headers={"ETag": "v2"}))
+    api = client(session, cache)
+
+    assert api.details("com.a")['docid'] == "com.a"
+    wait_for(lambda: cache.get_entry(details_key("com.a")).etag == "v2")
+    assert session.requests[0][1]["If-None-Match"] == "v1"
+    assert api.details("com.a")['docid'] == "com.a.new"
+    assert len(session.requests) == 1
+
+
+def test_not_modified_renews_the_ttl():
+    cache = ResponseCache()
+    key = details_key("com.a")
+    cache.put_entry(key, CacheEntry(details_response("com.a"), ttl=10, etag="v1", fetched_at=time.time() - 20))
+    session = FakeSession(FakeResponse(status_code=304))
+    api = client(session, cache)
+
+    assert api.details("com.a")['docid'] == "com.a"
+    assert session.requests[0][1]["If-None-Match"] == "v1"
+    entry = cache.get_entry(key)
+    assert entry is not None and not entry.is_expired() and entry.etag == "v1"
+
+
+def test_expired_entries_without_etag_are_evicted(tmp_path):
+    for cache in (ResponseCache(), SQLiteResponseCache(str(tmp_path / "cache.db"), "en_US", "default")):
+        cache.put_entry("a", CacheEntry(details_response("com.a"), ttl=10, fetched_at=time.time() - 20))
+        cache.put_entry("b", CacheEntry(details_response("com.b"), ttl=10, etag="v1", fetched_at=time.time() - 20))
+        assert cache.get_entry("a", allow_expired=True) is None
+        assert cache.get_entry("b") is None
+        assert cache.get_entry("b", allow_expired=True).etag == "v1"
+        assert len(cache) == 1
+
+
+def test_sqlite_cache_round_trip(tmp_path):
+    filename = str(tmp_path / "cache.db")
+    cache = SQLiteResponseCache(filename, "en_US", "default")
+    cache.put("details?doc=com.a", details_response("com.a"), ttl=60, soft_ttl=30, etag="v1")
+    cache.close()
+
+    reopened = SQLiteResponseCache(filename, "en_US", "default")
+    entry = reopened.get_entry("details?doc=com.a")
+    assert entry.response == details_response("com.a")
+    assert (entry.ttl, entry.soft_ttl, entry.etag) == (60, 30, "v1")
+    assert not entry.is_stale()
+    assert SQLiteResponseCache(filename, "en_US", "other").get_entry("details?doc=com.a") is None
@@ -0,0 +1,36 @@
+import math
+
+import pytest
+
+pytest.importorskip("google.protobuf")
+
+from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
+from gplayapi.Columnar import to_columns, to_numpy
+from gplayapi.Records import AppSummary
+
+
+def docs():
+    rated = GooglePlay_pb2.DocV2(docid="com.rated")
+    rated.aggregateRating.starRating = 4.5
+    rated.aggregateRating.ratingsCount = 10
+    unrated = GooglePlay_pb2.DocV2(docid="com.unrated")
+    return [rated, None, unrated]
+
+
+def test_unrated_apps_have_no_rating():
+    columns = to_columns(docs())
+    assert columns['rank'] == [1, 3]
+    assert columns['star_rating'] == [4.5, None]
+    assert columns['ratings_count'] == [10, None]
+    assert to_columns([AppSummary.from_doc(doc) for doc in docs() if doc is not None]) == to_columns(docs()[::2])
+
+
+def test_to_numpy_fills_missing_numbers():
+    np = pytest.importorskip("numpy")
+    arrays = to_numpy(docs(), start_rank=11)
+    assert list(arrays['rank']) == [11, 13]
+    assert arrays['star_rating'][0] == 4.5 and math.isnan(arrays['star_rating'][1])
+    # unrated apps don't drag the mean down
+    assert np.nanmean(arrays['star_rating']) == 4.5
+    assert list(arrays['ratings_count']) == [10, -1]
+    assert list(arrays['price_micros']) == [-1, -1]
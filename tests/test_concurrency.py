@@ -0,0 +1,116 @@
+import threading
+
+import pytest
+
+from gplayapi.Concurrency import BatchSizeTuner, iter_completed
+
+
+def test_iter_completed_yields_every_item():
+    results = {item: future.result() for item, future in iter_completed(lambda x: x * 2, range(20), 3)}
+    assert results == {x: x * 2 for x in range(20)}
+
+
+def test_iter_completed_stops_submitting_when_closed():
+    started = []
+    lock = threading.Lock()
+
+    def call(item):
+        with lock:
+            started.append(item)
+        return item
+
+    results = iter_completed(call, range(400), max_workers=4, ahead=2)
+    next(results)
+    results.close()
+    # the first 8 are submitted up front, and one more per consumed result
+    assert len(started) <= 9
+
+
+def test_iter_completed_keeps_errors_on_their_future():
+    def call(item):
+        if item == 1:
+            raise ValueError(item)
+        return item
+
+    errors = [item for item, future in iter_completed(call, range(3), 2) if future.exception() is not None]
+    assert errors == [1]
+
+
+def test_tuner_keeps_direction_while_throughput_improves():
+    tuner = BatchSizeTuner(initial=100, minimum=10, maximum=1000, growth=2)
+    tuner.observe(100, 1.0, 0)
+    assert tuner.adjust() == 200
+    tuner.observe(200, 1.0, 0)
+    assert tuner.adjust() == 400
+    # slower than the previous round, turn around
+    tuner.observe(400, 4.0, 0)
+    assert tuner.adjust() == 200
+    assert tuner.direction == -1
+
+
+def test_tuner_without_observations_keeps_its_size():
+    tuner = BatchSizeTuner(initial=100, minimum=10, maximum=1000)
+    assert tuner.adjust() == 100
+
+
+@pytest.mark.parametrize("penalize", [
+    lambda tuner: tuner.observe_timeout(),
+    lambda tuner: tuner.observe(100, 0.1, tuner.max_response_bytes + 1),
+])
+def test_tuner_halves_on_timeout_or_oversized_response(penalize):
+    tuner = BatchSizeTuner(initial=100, minimum=10, maximum=1000, max_response_bytes=1000)
+    tuner.observe(100, 1.0, 0)
+    penalize(tuner)
+    assert tuner.adjust() == 50
+    assert tuner.direction == -1 and tuner.last_throughput is None
+
+
+def test_tuner_stays_within_bounds():
+    tuner = BatchSizeTuner(initial=5000, minimum=10, maximum=1000, growth=2)
+    assert tuner.size == 1000
+    for _ in range(3):
+        tuner.observe(1000, 1.0, 0)
+        assert tuner.adjust() == 1000
+    for _ in range(10):
+        tuner.observe_timeout()
+        tuner.adjust()
+    assert tuner.size == 10
+
+
+def test_adaptive_bulk_details_splits_timed_out_chunks():
+    pytest.importorskip("google.protobuf")
+    requests = pytest.importorskip("requests")
+    from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
+    from gplayapi.GoogleAuth import GoogleAuthAPI
+    from gplayapi.GplayAPI import GplayAPI
+
+    class FakeAuth(GoogleAuthAPI):
+        session = None
+
+        def __init__(self):
+            self.auth_sub_token = "token"
+            self.proxies_config = None
+            self.dfeCookie = None
+
+    sizes = []
+    lock = threading.Lock()
+
+    def bulk_details_request(package_names):
+        with lock:
+            sizes.append(len(package_names))
+        if len(package_names) > 4:
+            raise requests.exceptions.Timeout()
+        response = GooglePlay_pb2.BulkDetailsResponse()
+        for package_name in package_names:
+            response.entry.add().doc.docid = package_name
+        return response
+
+    api = GplayAPI(FakeAuth())
+    api.bulk_tuner = BatchSizeTuner(initial=8, minimum=1, maximum=8)
+    api.__bulk_details_request__ = bulk_details_request
+    package_names = ["com.app{}".format(i) for i in range(10)]
+
+    docs = api.bulk_details(package_names, max_workers=2, adaptive=True, fields=["docid"])
+    assert [doc['docid'] for doc in docs] == package_names
+    assert sorted(sizes[:2]) == [2, 8] and 4 in sizes
+    assert api.bulk_tuner.size < 8
@@ -0,0 +1,85 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+pytest.importorskip("google.protobuf")
+
+from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
+from gplayapi.Helper import LazyMessageDict, parse_protobuf_lazy, parse_protobuf_obj, project_fields
+
+
+def doc():
+    doc = GooglePlay_pb2.DocV2(docid="com.example", title="Example")
+    doc.offer.add(micros=1990000, currencyCode="KRW")
+    doc.aggregateRating.starRating = 4.3
+    doc.details.appDetails.versionCode = 3
+    return doc
+
+
+def test_lazy_dict_is_a_dict():
+    lazy = parse_protobuf_lazy(doc())
+    expected = parse_protobuf_obj(doc())
+    assert isinstance(lazy, dict)
+    assert isinstance(lazy['details'], LazyMessageDict)
+    assert lazy == expected and expected == lazy
+    assert len(lazy) == len(expected) and list(lazy) == list(expected)
+    assert lazy['offer'][0]['micros'] == "1990000"
+    assert lazy.get('missing') is None and 'missing' not in lazy
+
+
+@pytest.mark.parametrize("convert", [
+    lambda lazy: json.loads(json.dumps(lazy)),
+    lambda lazy: lazy.copy(),
+    dict,
+    lambda lazy: {**lazy},
+    copy.deepcopy,
+    lambda lazy: pickle.loads(pickle.dumps(lazy)),
+])
+def test_untouched_lazy_dict_converts_fully(convert):
+    assert convert(parse_protobuf_lazy(doc())) == parse_protobuf_obj(doc())
+
+
+
+def test_lazy_dict_copies_keep_changes():
+    lazy = parse_protobuf_lazy(doc())
+    lazy['rank'] = 3
+    del lazy['title']
+    lazy['details']['appDetails']['versionCode'] = 4
+    expected = parse_protobuf_obj(doc())
+    expected['rank'] = 3
+    del expected['title']
+    expected['details']['appDetails']['versionCode'] = 4
+    for converted in (lazy.copy(), copy.copy(lazy), copy.deepcopy(lazy), pickle.loads(pickle.dumps(lazy)),
+                      lazy.to_dict()):
+        assert converted == expected
+    assert repr(lazy) == 'LazyMessageDict({!r})'.format(expected)
+
+
+def test_lazy_dict_pop_converts():
+    lazy = parse_protobuf_lazy(doc())
+    expected = parse_protobuf_obj(doc())
+    assert lazy.pop('offer') == expected['offer']
+    assert lazy.pop('offer', None) is None
+    assert lazy.setdefault('docid') == "com.example"
+    assert lazy.setdefault('rank', 1) == 1
+    while lazy:
+        key, value = lazy.popitem()
+        assert value == expected.get(key, 1)
+
+def test_project_fields():
+    projected = project_fields(doc(), ["docid", "aggregateRating.starRating", "offer.micros", "details"])
+    assert projected == {'docid': "com.example", 'aggregateRating': {'starRating': 4.3},
+                         'offer': [{'micros': "1990000"}], 'details': {'appDetails': {'versionCode': 3}}}
+
+
+@pytest.mark.parametrize("fields", [["bogus"], ["details.appDetails.bogus"], ["docid.length"]])
+def test_project_fields_rejects_unknown_fields_even_when_unset(fields):
+    with pytest.raises(ValueError):
+        project_fields(GooglePlay_pb2.DocV2(), fields)
+
+
+def test_project_fields_rejects_a_string():
+    with pytest.raises(TypeError):
+        project_fields(doc(), "docid")
@@ -0,0 +1,93 @@
+import pytest
+
+pytest.importorskip("google.protobuf")
+
+from gplayapi import GooglePlaySlim_pb2 as GooglePlay_pb2
+from gplayapi.Error import RequestError
+from gplayapi.Parsing import extract_bulk_details, extract_list_ranks
+from gplayapi.Records import AppSummary
+from gplayapi.WireDecoder import decode_bulk_details, decode_list_ranks, iter_bulk_details_entries
+
+
+def full_doc():
+    doc = GooglePlay_pb2.DocV2(docid="com.example.full", title="Full", creator="Example Inc.")
+    offer = doc.offer.add()
+    offer.micros = 1990000
+    offer.currencyCode = "KRW"
+    offer.formattedAmount = "₩1,990"
+    # a second offer must be ignored, like AppSummary.from_doc does
+    doc.offer.add(micros=1)
+    doc.aggregateRating.starRating = 4.3
+    doc.aggregateRating.ratingsCount = 123456789
+    doc.details.appDetails.versionCode = 2147483647
+    doc.details.appDetails.numDownloads = "1,000,000+"
+    return doc
+
+
+def bare_doc():
+    # no offer, rating or appDetails
+    return GooglePlay_pb2.DocV2(docid="com.example.bare")
+
+
+def bulk_response():
+    message = GooglePlay_pb2.ResponseWrapper()
+    entries = message.payload.bulkDetailsResponse.entry
+    entries.add().doc.CopyFrom(full_doc())
+    entries.add()  # missing app
+    entries.add().doc.CopyFrom(bare_doc())
+    return message
+
+
+def error_response():
+    message = GooglePlay_pb2.ResponseWrapper()
+    message.commands.displayErrorMessage = "Something went wrong"
+    return message
+
+
+def test_bulk_details_matches_from_doc():
+    message = bulk_response()
+    expected = extract_bulk_details(message, AppSummary.from_doc)
+    assert expected[1] is None
+    assert expected[2].price_micros is None
+    assert decode_bulk_details(message.SerializeToString()) == expected
+
+
+def test_list_ranks_matches_from_doc():
+    message = GooglePlay_pb2.ResponseWrapper()
+    category = message.payload.listResponse.doc.add()
+    sub_category = category.child.add()
+    sub_category.containerMetadata.nextPageUrl = "list?c=3&ctr=apps_topselling_free&o=2"
+    sub_category.child.add().CopyFrom(full_doc())
+    sub_category.child.add().CopyFrom(bare_doc())
+    expected = extract_list_ranks(message, AppSummary.from_doc)
+    assert decode_list_ranks(message.SerializeToString()) == expected
+
+
+def test_empty_list_ranks():
+    content = GooglePlay_pb2.ResponseWrapper().SerializeToString()
+    assert decode_list_ranks(content) == ([], "")
+
+
+def test_display_error_message_raises():
+    content = error_response().SerializeToString()
+    with pytest.raises(RequestError):
+        decode_bulk_details(content)
+    with pytest.raises(RequestError):
+        decode_list_ranks(content)
+    with pytest.raises(RequestError):
+        list(iter_bulk_details_entries([content]))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_streamed_entries(chunk_size):
+    message = bulk_response()
+    content = message.SerializeToString()
+    chunks = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+    entries = [GooglePlay_pb2.BulkDetailsEntry.FromString(entry) for entry in iter_bulk_details_entries(chunks)]
+    assert entries == list(message.payload.bulkDetailsResponse.entry)
+
+
+def test_truncated_stream():
+    content = bulk_response().SerializeToString()
+    with pytest.raises(EOFError):
+        list(iter_bulk_details_entries([content[:-3]]))